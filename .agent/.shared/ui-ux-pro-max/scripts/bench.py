@@ -0,0 +1,362 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+UI/UX Pro Max Bench - latency and memory benchmarks for search and design-system generation
+
+Usage: python bench.py [--scales 1,10,100] [--repeats 30] [--output results.json]
+       python bench.py --baseline results.json [--tolerance 0.25]
+       python bench.py --startup [--startup-budget 45]
+
+Synthetic data: every domain/stack CSV is replicated N times into a temp dir
+(each copy tagged with a unique "synthN" token so rows stay distinct).
+
+Benchmarks: fit, score, build (index build), open (every prebuilt index, per INDEX_FORMATS),
+            search, search_stack, design_system.
+Conditions: cold = in-process caches cleared (prebuilt index read from disk),
+            warm = indexes in memory, result cache cleared so BM25 still ranks.
+Reports p50/p95/p99 in milliseconds and tracemalloc peak in KiB, as JSON.
+With --baseline, exits non-zero when p50 or peak memory regresses past the tolerance.
+
+Startup: `python -X importtime search.py <query>` must stay within STARTUP_BUDGET_MS of
+imports beyond the bare interpreter and must not load STARTUP_FORBIDDEN modules
+(every run checks this; --startup checks only this).
+"""
+
+import argparse
+import csv
+import json
+import math
+import platform
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+import core
+import design_system
+from core import CSV_CONFIG, STACK_CONFIG, _STACK_COLS, BM25
+
+# ============ CONFIGURATION ============
+DEFAULT_SCALES = [1, 10, 100]
+DEFAULT_REPEATS = 30
+COLD_REPEATS = 5  # Cold samples re-read every index from disk; keep them few
+DEFAULT_TOLERANCE = 0.25  # Allowed fractional slowdown / memory growth vs. baseline
+MIN_DELTA_MS = 0.05  # Ignore regressions smaller than timer noise
+SCRIPT_DIR = Path(__file__).parent
+INDEX_FORMATS = ["json", "binary"]  # Prebuilt index formats compared by the "open" benchmark
+STARTUP_BUDGET_MS = 45  # Import time of a plain `search.py <query>` run, interpreter startup excluded
+STARTUP_SAMPLES = 7
+STARTUP_COMMAND = ["search.py", "saas dashboard", "--domain", "product"]
+STARTUP_FORBIDDEN = ["design_system", "concurrent.futures", "datetime", "csv", "hashlib", "sqlite3", "numpy"]
+
+QUERIES = [
+    "saas dashboard",
+    "glassmorphism dark mode",
+    "fintech trust blue",
+    "hero pricing cta",
+    "accessibility touch targets",
+    "elegant serif heading",
+    "line chart trend",
+    "react rerender memo"
+]
+STACK_QUERIES = [
+    ("react", "state management hooks"),
+    ("nextjs", "image optimization"),
+    ("vue", "computed reactivity"),
+    ("html-tailwind", "responsive layout"),
+    ("flutter", "list performance")
+]
+DESIGN_SYSTEM_QUERIES = ["SaaS dashboard", "e-commerce luxury", "healthcare app"]
+
+
+# ============ SYNTHETIC DATA ============
+def _corpora():
+    """(file, search_cols, weights) for every CSV the search functions read"""
+    corpora = [(config["file"], config["search_cols"], core._search_weights(config)) for config in CSV_CONFIG.values()]
+    corpora += [(config["file"], _STACK_COLS["search_cols"], core._search_weights(_STACK_COLS)) for config in STACK_CONFIG.values()]
+    return corpora
+
+
+def make_dataset(source_dir, target_dir, scale):
+    """Copy the CSVs into target_dir with every searchable file replicated `scale` times"""
+    target_dir.mkdir(parents=True, exist_ok=True)
+    reasoning = source_dir / design_system.REASONING_FILE
+    if reasoning.exists():
+        shutil.copy(reasoning, target_dir / design_system.REASONING_FILE)
+
+    for filename, search_cols, _ in _corpora():
+        source = source_dir / filename
+        if not source.exists():
+            continue
+        with open(source, 'r', encoding='utf-8', newline='') as f:
+            reader = csv.reader(f)
+            header = next(reader, [])
+            rows = [record for record in reader if record]
+        tag = header.index(search_cols[0])
+
+        target = target_dir / filename
+        target.parent.mkdir(parents=True, exist_ok=True)
+        with open(target, 'w', encoding='utf-8', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow(header)
+            for copy in range(scale):
+                for record in rows:
+                    if copy and tag < len(record):
+                        record = record[:tag] + [f"{record[tag]} synth{copy}"] + record[tag + 1:]
+                    writer.writerow(record)
+
+
+def use_dataset(data_dir):
+    """Point core and design_system at a dataset and drop every cache"""
+    core.DATA_DIR = data_dir
+    core.INDEX_DIR = data_dir / ".index"
+    design_system.DATA_DIR = data_dir
+    core.clear_cache()
+
+
+# ============ MEASUREMENT ============
+def percentile(samples, pct):
+    """Nearest-rank percentile of a non-empty sample list"""
+    ordered = sorted(samples)
+    return ordered[max(0, math.ceil(pct / 100 * len(ordered)) - 1)]
+
+
+def measure(run, repeats, setup=None):
+    """Time `run` repeats times (after an optional untimed setup), then one traced pass for peak memory"""
+    samples = []
+    for i in range(repeats):
+        if setup:
+            setup()
+        start = time.perf_counter()
+        run(i)
+        samples.append((time.perf_counter() - start) * 1000)
+
+    if setup:
+        setup()
+    tracemalloc.start()
+    try:
+        run(repeats)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {
+        "samples": len(samples),
+        "p50_ms": round(percentile(samples, 50), 4),
+        "p95_ms": round(percentile(samples, 95), 4),
+        "p99_ms": round(percentile(samples, 99), 4),
+        "peak_kib": round(peak / 1024, 1)
+    }
+
+
+def _clear_results():
+    """Warm condition: keep fitted indexes, forget cached rankings"""
+    with core._result_cache_lock:
+        core._result_cache.clear()
+
+
+def bench_scale(data_dir, repeats):
+    """Run every benchmark against one dataset"""
+    use_dataset(data_dir)
+    cold_repeats = min(repeats, COLD_REPEATS)
+    results = {}
+
+    documents, weights = {}, {}
+    for filename, search_cols, field_weights in _corpora():
+        filepath = data_dir / filename
+        if filepath.exists():
+            rows = core._load_csv(filepath)
+            documents[filename] = [core._document_fields(rows, idx, search_cols) for idx in range(len(rows))]
+            weights[filename] = field_weights
+    largest = max(documents, key=lambda name: len(documents[name]))
+    results["documents"] = sum(len(docs) for docs in documents.values())
+
+    def fit(i):
+        for filename, docs in documents.items():
+            BM25(field_weights=weights[filename]).fit(docs)
+    results["fit"] = measure(fit, cold_repeats)
+
+    model = BM25(field_weights=weights[largest])
+    model.fit(documents[largest])
+
+    def score(i):
+        model.score(QUERIES[i % len(QUERIES)], top_k=core.MAX_RESULTS)
+    cold = measure(score, cold_repeats, setup=lambda: setattr(model, "_matrix", None))  # Vectorized engine rebuilds its matrix
+    score(0)
+    results["score"] = {"cold": cold, "warm": measure(score, repeats)}
+
+    results["build"] = measure(lambda i: core.build_indexes(force=True), cold_repeats)
+
+    def open_indexes(i):
+        for filename, search_cols, field_weights in _corpora():
+            filepath = data_dir / filename
+            if filepath.exists():
+                core._open_index(filepath, search_cols, field_weights)
+    results["open"] = {}
+    default_format = core.INDEX_FORMAT
+    for index_format in INDEX_FORMATS:
+        core.INDEX_FORMAT = index_format
+        core.build_indexes()
+        results["open"][index_format] = measure(open_indexes, cold_repeats)
+    core.INDEX_FORMAT = default_format
+
+    def run_search(i):
+        core.search(QUERIES[i % len(QUERIES)])
+
+    def run_search_stack(i):
+        stack, query = STACK_QUERIES[i % len(STACK_QUERIES)]
+        core.search_stack(query, stack)
+
+    def run_design_system(i):
+        design_system.generate_design_system(DESIGN_SYSTEM_QUERIES[i % len(DESIGN_SYSTEM_QUERIES)])
+
+    for name, run in (("search", run_search), ("search_stack", run_search_stack), ("design_system", run_design_system)):
+        cold = measure(run, cold_repeats, setup=core.clear_cache)
+        for i in range(repeats):
+            run(i)  # Load every index the warm samples will touch
+        warm = measure(run, repeats, setup=_clear_results)
+        results[name] = {"cold": cold, "warm": warm}
+
+    return results
+
+
+# ============ STARTUP BUDGET ============
+def _import_times(args):
+    """{module: self import time in us} for one `python -X importtime` run"""
+    proc = subprocess.run([sys.executable, "-X", "importtime", *args], cwd=SCRIPT_DIR,
+                          capture_output=True, text=True, check=True)
+    times = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, _, name = line[len("import time:"):].split("|")
+        times[name.strip()] = int(self_us)
+    return times
+
+
+def check_startup(budget_ms=STARTUP_BUDGET_MS, samples=STARTUP_SAMPLES):
+    """Median import cost of a plain search, and any modules it should not have loaded"""
+    import compileall
+    compileall.compile_dir(str(SCRIPT_DIR), quiet=1)  # Measure imports, not bytecode compilation
+    subprocess.run([sys.executable, *STARTUP_COMMAND], cwd=SCRIPT_DIR, capture_output=True, check=True)  # Fresh index
+
+    interpreter = set(_import_times(["-c", "pass"]))
+    runs = [_import_times(STARTUP_COMMAND) for _ in range(samples)]
+    import_ms = statistics.median(sum(us for name, us in run.items() if name not in interpreter) / 1000 for run in runs)
+    return {
+        "command": " ".join(STARTUP_COMMAND),
+        "import_ms": round(import_ms, 2),
+        "budget_ms": budget_ms,
+        "modules": len(set(runs[0]) - interpreter),
+        "forbidden": [name for name in STARTUP_FORBIDDEN if name in runs[0]]
+    }
+
+
+def startup_violations(startup):
+    """Messages for a startup report that exceeds its budget or loads forbidden modules"""
+    violations = []
+    if startup["import_ms"] > startup["budget_ms"]:
+        violations.append(f"startup: imports take {startup['import_ms']:.1f} ms (budget {startup['budget_ms']} ms)")
+    if startup["forbidden"]:
+        violations.append(f"startup: plain search imports {', '.join(startup['forbidden'])}")
+    return violations
+
+
+# ============ BASELINE COMPARISON ============
+def _flatten(results):
+    """{"10x/search/warm": metrics} for every measured benchmark"""
+    flat = {}
+    for scale, benches in results.items():
+        for bench, value in benches.items():
+            if not isinstance(value, dict):
+                continue
+            if "p50_ms" in value:
+                flat[f"{scale}/{bench}"] = value
+            else:
+                for condition, metrics in value.items():
+                    flat[f"{scale}/{bench}/{condition}"] = metrics
+    return flat
+
+
+def compare(current, baseline, tolerance):
+    """List of regression messages (p50 latency and peak memory) vs. a baseline run"""
+    regressions = []
+    previous = _flatten(baseline.get("results", {}))
+    for key, metrics in _flatten(current["results"]).items():
+        old = previous.get(key)
+        if old is None:
+            continue
+        p50, old_p50 = metrics["p50_ms"], old["p50_ms"]
+        if p50 > old_p50 * (1 + tolerance) and p50 - old_p50 > MIN_DELTA_MS:
+            regressions.append(f"{key}: p50 {old_p50:.3f} ms -> {p50:.3f} ms (+{(p50 / old_p50 - 1) * 100:.0f}%)")
+        peak, old_peak = metrics["peak_kib"], old["peak_kib"]
+        if old_peak and peak > old_peak * (1 + tolerance):
+            regressions.append(f"{key}: peak {old_peak:.1f} KiB -> {peak:.1f} KiB (+{(peak / old_peak - 1) * 100:.0f}%)")
+    return regressions
+
+
+# ============ CLI ============
+def main():
+    parser = argparse.ArgumentParser(description="UI Pro Max benchmarks")
+    parser.add_argument("--scales", default=",".join(map(str, DEFAULT_SCALES)), help="Comma-separated data multipliers (default: 1,10,100)")
+    parser.add_argument("--repeats", "-r", type=int, default=DEFAULT_REPEATS, help=f"Warm samples per benchmark (default: {DEFAULT_REPEATS})")
+    parser.add_argument("--output", "-o", help="Write results JSON to this file (default: stdout)")
+    parser.add_argument("--baseline", "-b", help="Compare against a previous results JSON and fail on regression")
+    parser.add_argument("--tolerance", "-t", type=float, default=DEFAULT_TOLERANCE, help=f"Allowed regression fraction (default: {DEFAULT_TOLERANCE})")
+    parser.add_argument("--startup", action="store_true", help="Only check the search.py import-time budget")
+    parser.add_argument("--startup-budget", type=float, default=STARTUP_BUDGET_MS, help=f"Import-time budget in ms (default: {STARTUP_BUDGET_MS})")
+    args = parser.parse_args()
+
+    scales = [] if args.startup else [int(s) for s in args.scales.split(",") if s.strip()]
+    source_dir = core.DATA_DIR
+    report = {
+        "meta": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "engine": core.BM25_ENGINE,
+            "numpy": core.numpy_available(),
+            "repeats": args.repeats,
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S")
+        },
+        "startup": check_startup(args.startup_budget),
+        "results": {}
+    }
+
+    workdir = Path(tempfile.mkdtemp(prefix="uipro-bench-"))
+    try:
+        for scale in scales:
+            data_dir = workdir / f"{scale}x"
+            make_dataset(source_dir, data_dir, scale)
+            print(f"Benchmarking {scale}x ...", file=sys.stderr)
+            report["results"][f"{scale}x"] = bench_scale(data_dir, args.repeats)
+    finally:
+        use_dataset(source_dir)
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    text = json.dumps(report, indent=2)
+    if args.output:
+        Path(args.output).write_text(text + "\n", encoding="utf-8")
+    else:
+        print(text)
+
+    failures = startup_violations(report["startup"])
+    if args.baseline:
+        with open(args.baseline, 'r', encoding='utf-8') as f:
+            regressions = compare(report, json.load(f), args.tolerance)
+        if regressions:
+            failures.append(f"REGRESSION vs {args.baseline}:")
+            failures.extend(f"  {line}" for line in regressions)
+        else:
+            print(f"No regressions vs {args.baseline} (tolerance {args.tolerance:.0%})", file=sys.stderr)
+    if failures:
+        for line in failures:
+            print(line, file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
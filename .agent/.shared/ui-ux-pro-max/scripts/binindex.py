@@ -0,0 +1,405 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+UI/UX Pro Max Binary Index - memory-mapped BM25 index for the ui-ux-pro-max CSVs.
+
+Every concurrent agent process maps the same file read-only, so they share its
+physical pages and only fault in the vocabulary probes and postings a query
+touches: opening an index is a header read, not a parse. Rows are not copied
+into the index; hits are read back from the CSV at their recorded byte offsets.
+
+Usage: python binindex.py [--force]        (rebuild stale data/.index/*.bin)
+       UIPRO_INDEX_FORMAT=binary python search.py "<query>"
+
+Layout (header little-endian, sections in native byte order, 8-byte aligned):
+  header         magic, format version, counts, source mtime/size/sha256, (offset, length) per section
+  meta           JSON: index version, search columns/weights, tokenizer, byte order, CSV header, k1/b/avgdl
+  term_offsets   u32[terms + 1]   end of each term in `strings` (terms sorted by UTF-8 bytes)
+  strings        UTF-8 term bytes
+  term_postings  u32[terms + 1]   start of each term's postings in doc_ids/tfs
+  idf            f64[terms]
+  doc_ids        u32[postings]
+  tfs            f64[postings]    (weighted) term frequency
+  doc_lengths    f64[docs]
+  norms          f64[docs]        k1 * (1 - b + b * dl / avgdl)
+  rows           u64[docs + 1]    byte offset of each CSV record, then end of file
+"""
+
+import argparse
+import json
+import mmap
+import os
+import struct
+import sys
+from array import array
+from collections.abc import Mapping
+
+import core
+from core import BM25
+
+MAGIC = b"UIPXBIN\0"
+FORMAT_VERSION = 1
+SECTIONS = ("meta", "term_offsets", "strings", "term_postings", "idf", "doc_ids", "tfs", "doc_lengths", "norms", "rows")
+HEADER = struct.Struct("<8sI4xQQQqQ32s" + "QQ" * len(SECTIONS))
+
+
+def index_path(filepath):
+    """Location of the binary index for a CSV file (next to its JSON artifact)"""
+    return core._index_path(filepath).with_suffix(".bin")
+
+
+# ============ WRITING ============
+def _record_offsets(filepath):
+    """Byte offset of every non-blank CSV record after the header, then the file size.
+
+    Records line up with the rows of core._load_csv, including quoted fields
+    that span lines.
+    """
+    import csv
+    position = 0
+    with open(filepath, 'r', encoding='utf-8', newline='') as f:
+        def lines():
+            nonlocal position
+            for line in f:
+                position += len(line.encode('utf-8'))
+                yield line
+
+        reader = csv.reader(lines())
+        next(reader, None)
+        offsets = []
+        while True:
+            start = position  # csv.reader pulls lines only as a record needs them
+            record = next(reader, None)
+            if record is None:
+                break
+            if record:
+                offsets.append(start)
+    offsets.append(position)
+    return offsets
+
+
+def _pad(buffer):
+    buffer.extend(b"\0" * (-len(buffer) % 8))
+
+
+def write_index(filepath, search_cols, data, bm25, source=None):
+    """Serialize a fitted (rows, bm25) pair to the binary format, atomically"""
+    rows = _record_offsets(filepath)
+    if len(rows) - 1 != len(data) or bm25.N != len(data):
+        raise ValueError(f"{filepath.name}: {len(rows) - 1} CSV records for {bm25.N} indexed rows")
+    source = source or core._source_signature(filepath)
+
+    term_offsets, strings = array('I', [0]), bytearray()
+    term_postings, idf = array('I', [0]), array('d')
+    doc_ids, tfs = array('I'), array('d')
+    for term in sorted(bm25.postings):  # Code point order == UTF-8 byte order
+        strings += term.encode('utf-8')
+        term_offsets.append(len(strings))
+        for idx, tf in bm25.postings[term]:
+            doc_ids.append(idx)
+            tfs.append(tf)
+        term_postings.append(len(doc_ids))
+        idf.append(bm25.idf[term])
+
+    meta = {
+        "version": core.INDEX_VERSION,
+        "search_cols": list(search_cols),
+        "search_weights": bm25.field_weights,
+        "tokenizer": core.tokenizer_signature(),
+        "byteorder": sys.byteorder,
+        "columns": list(data.columns),
+        "k1": bm25.k1,
+        "b": bm25.b,
+        "avgdl": bm25.avgdl
+    }
+    sections = {
+        "meta": json.dumps(meta, ensure_ascii=False).encode('utf-8'),
+        "term_offsets": term_offsets.tobytes(),
+        "strings": bytes(strings),
+        "term_postings": term_postings.tobytes(),
+        "idf": idf.tobytes(),
+        "doc_ids": doc_ids.tobytes(),
+        "tfs": tfs.tobytes(),
+        "doc_lengths": array('d', bm25.doc_lengths).tobytes(),
+        "norms": array('d', bm25.norms).tobytes(),
+        "rows": array('Q', rows).tobytes()
+    }
+
+    body, table = bytearray(), []
+    for name in SECTIONS:
+        table += [HEADER.size + len(body), len(sections[name])]
+        body += sections[name]
+        _pad(body)
+    header = HEADER.pack(MAGIC, FORMAT_VERSION, bm25.N, len(idf), len(doc_ids),
+                         source["mtime_ns"], source["size"], bytes.fromhex(source["sha256"]), *table)
+    _replace(index_path(filepath), header + body)
+
+
+def _replace(path, content):
+    """Write via temp file + rename: processes mapping the old file keep their pages"""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    with open(tmp_path, 'wb') as f:
+        f.write(content)
+    os.replace(tmp_path, path)
+
+
+# ============ MAPPED VIEWS ============
+class _Vocabulary:
+    """Binary search over the sorted term table, straight from the mapping"""
+
+    def __init__(self, strings, offsets, postings, idf):
+        self._strings = strings
+        self._offsets = offsets
+        self.postings = postings
+        self.idf = idf
+        self.size = len(idf)
+
+    def find(self, term):
+        """Row of a term in the term table, or -1"""
+        key = term.encode('utf-8')
+        lo, hi = 0, self.size
+        while lo < hi:
+            mid = (lo + hi) // 2
+            probe = bytes(self._strings[self._offsets[mid]:self._offsets[mid + 1]])
+            if probe < key:
+                lo = mid + 1
+            elif probe > key:
+                hi = mid
+            else:
+                return mid
+        return -1
+
+    def term(self, row):
+        return bytes(self._strings[self._offsets[row]:self._offsets[row + 1]]).decode('utf-8')
+
+
+class _TermView(Mapping):
+    """Read-only {term: value} over the vocabulary (idf, doc_freqs, postings)"""
+
+    def __init__(self, vocabulary, value):
+        self._vocabulary = vocabulary
+        self._value = value
+
+    def __getitem__(self, term):
+        row = self._vocabulary.find(term) if isinstance(term, str) else -1
+        if row < 0:
+            raise KeyError(term)
+        return self._value(row)
+
+    def __contains__(self, term):
+        return isinstance(term, str) and self._vocabulary.find(term) >= 0
+
+    def __iter__(self):
+        return (self._vocabulary.term(row) for row in range(self._vocabulary.size))
+
+    def __len__(self):
+        return self._vocabulary.size
+
+
+class MappedRows:
+    """RowStore-compatible rows, parsed on demand from the CSV at their byte offsets"""
+
+    __slots__ = ("columns", "_path", "_offsets", "_positions")
+
+    def __init__(self, path, columns, offsets):
+        self.columns = tuple(sys.intern(col) for col in columns)
+        self._path = path
+        self._offsets = offsets
+        self._positions = {col: i for i, col in enumerate(self.columns)}
+
+    def __len__(self):
+        return len(self._offsets) - 1
+
+    def __contains__(self, col):
+        return col in self._positions
+
+    def _record(self, idx):
+        import csv
+        import io
+        start, end = self._offsets[idx], self._offsets[idx + 1]
+        with open(self._path, 'rb') as f:
+            f.seek(start)
+            chunk = f.read(end - start)
+        return next(csv.reader(io.StringIO(chunk.decode('utf-8'), newline='')), [])
+
+    def _cell(self, record, col):
+        position = self._positions[col]
+        return record[position] if position < len(record) else None  # Short record: DictReader's restval
+
+    def get(self, idx, col, default=""):
+        """Single cell, or default if the column does not exist"""
+        if col not in self._positions:
+            return default
+        return self._cell(self._record(idx), col)
+
+    def row(self, idx, cols):
+        """Materialize one row restricted to the requested (existing) columns"""
+        record = self._record(idx)
+        return {col: self._cell(record, col) for col in cols if col in self._positions}
+
+
+class MappedBM25(BM25):
+    """Read-only BM25 whose tables are views into a memory-mapped index file"""
+
+    def __init__(self, buffer, sections, meta, docs):
+        super().__init__(meta["k1"], meta["b"], field_weights=meta["search_weights"])
+        self._buffer = buffer
+        self._sections = sections
+        self.N = docs
+        self.avgdl = meta["avgdl"]
+        self.doc_lengths = self._view("doc_lengths", "d")
+        self.norms = self._view("norms", "d")
+        doc_ids, tfs = self._view("doc_ids", "I"), self._view("tfs", "d")
+        starts = self._view("term_postings", "I")
+        vocabulary = _Vocabulary(self._view("strings", "B"), self._view("term_offsets", "I"), starts, self._view("idf", "d"))
+        self.idf = _TermView(vocabulary, vocabulary.idf.__getitem__)
+        self.doc_freqs = _TermView(vocabulary, lambda row: starts[row + 1] - starts[row])
+        self.postings = _TermView(vocabulary, lambda row: list(zip(doc_ids[starts[row]:starts[row + 1]],
+                                                                   tfs[starts[row]:starts[row + 1]])))
+
+    def _view(self, name, fmt):
+        offset, length = self._sections[name]
+        return self._buffer[offset:offset + length].cast(fmt)
+
+    def _read_only(self, *args, **kwargs):
+        raise TypeError("A mapped index is read-only; rebuild it with binindex.py or use the JSON format")
+
+    fit = add_documents = remove_documents = update_document = to_dict = _read_only
+
+    def _build_matrix(self):
+        """CSR matrix over the mapped postings without copying ids or frequencies"""
+        import numpy as np
+
+        starts = np.frombuffer(self._view("term_postings", "B"), dtype=np.uint32)
+        indptr = starts.astype(np.int64)
+        indices = np.frombuffer(self._view("doc_ids", "B"), dtype=np.uint32)
+        tfs = np.frombuffer(self._view("tfs", "B"), dtype=np.float64)
+        idf = np.repeat(np.frombuffer(self._view("idf", "B"), dtype=np.float64), np.diff(indptr))
+        norms = np.frombuffer(self._view("norms", "B"), dtype=np.float64)[indices]
+
+        # Same operation order as the pure-Python scorer, so weights are bit-identical
+        data = idf * (tfs * (self.k1 + 1)) / (tfs + norms)
+        self._matrix = ({term: row for row, term in enumerate(self.idf)}, indptr, indices, data)
+
+
+# ============ LOADING ============
+def _map(path):
+    """Read-only mapping of an index file, or None if it is missing or not one of ours"""
+    try:
+        with open(path, 'rb') as f:
+            if os.fstat(f.fileno()).st_size < HEADER.size:
+                return None
+            mapping = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):
+        return None
+    if mapping[:len(MAGIC)] != MAGIC:
+        mapping.close()
+        return None
+    return mapping
+
+
+def _restamp(path, mapping, mtime_ns):
+    """Rewrite the source mtime after a checkout/touch left the content unchanged"""
+    content = bytearray(mapping)
+    fields = list(HEADER.unpack_from(content))
+    fields[5] = mtime_ns  # magic, version, docs, terms, postings, mtime_ns, ...
+    HEADER.pack_into(content, 0, *fields)
+    try:
+        _replace(path, bytes(content))
+    except OSError:
+        pass
+
+
+def load_index(filepath, search_cols, weights=None):
+    """Map a binary index as (rows, bm25), or None if it is missing or stale"""
+    path = index_path(filepath)
+    mapping = _map(path)
+    if mapping is None:
+        return None
+
+    try:
+        layout = _check_mapping(filepath, path, mapping, search_cols, weights)
+    except BaseException:
+        mapping.close()
+        raise
+    if layout is None:
+        mapping.close()  # Stale: release the mapping now rather than at garbage collection
+        return None
+
+    sections, meta, docs = layout
+    bm25 = MappedBM25(memoryview(mapping), sections, meta, docs)
+    return MappedRows(filepath, meta["columns"], bm25._view("rows", "Q")), bm25
+
+
+def _check_mapping(filepath, path, mapping, search_cols, weights):
+    """(sections, meta, docs) of a mapped index, or None if it does not match the CSV and columns"""
+    magic, version, docs, _, _, mtime_ns, size, sha256, *table = HEADER.unpack_from(mapping)
+    sections = {name: (table[2 * i], table[2 * i + 1]) for i, name in enumerate(SECTIONS)}
+    if version != FORMAT_VERSION or sections["rows"][0] + sections["rows"][1] > len(mapping):
+        return None
+    offset, length = sections["meta"]
+    meta = json.loads(mapping[offset:offset + length].decode('utf-8'))
+    if meta.get("byteorder") != sys.byteorder or not core._compatible(meta, search_cols, weights):
+        return None
+
+    stat = filepath.stat()
+    if mtime_ns != stat.st_mtime_ns or size != stat.st_size:
+        # Row offsets are byte positions: only an identical CSV can reuse them
+        if size != stat.st_size or sha256.hex() != core._file_hash(filepath):
+            return None
+        _restamp(path, mapping, stat.st_mtime_ns)
+    return sections, meta, docs
+
+
+def _is_fresh(filepath, search_cols, weights=None):
+    """True if the binary index matches the CSV and columns (the mapping is closed again)"""
+    path = index_path(filepath)
+    mapping = _map(path)
+    if mapping is None:
+        return False
+    try:
+        return _check_mapping(filepath, path, mapping, search_cols, weights) is not None
+    finally:
+        mapping.close()
+
+
+def open_index(filepath, search_cols, weights=None):
+    """(rows, bm25) from the binary index, rebuilding it when missing or stale"""
+    index = load_index(filepath, search_cols, weights)
+    if index is not None:
+        return index
+
+    # A JSON artifact, if any, still saves re-tokenizing unchanged rows
+    data, bm25 = core._refresh_index(filepath, search_cols, core._read_payload(filepath), weights)
+    try:
+        write_index(filepath, search_cols, data, bm25)
+    except OSError:
+        return data, bm25  # Read-only checkout: serve from the in-memory build
+    return load_index(filepath, search_cols, weights) or (data, bm25)
+
+
+def build_indexes(force=False):
+    """Prebuild binary indexes for every domain and stack CSV"""
+    report = []
+    for filename, search_cols, weights in core._index_targets():
+        filepath = core.DATA_DIR / filename
+        if not filepath.exists():
+            report.append({"file": filename, "status": "missing"})
+            continue
+        if not force and _is_fresh(filepath, search_cols, weights):
+            report.append({"file": filename, "status": "fresh"})
+            continue
+        data, bm25 = core._build_index(filepath, search_cols, None, weights)
+        write_index(filepath, search_cols, data, bm25)
+        report.append({"file": filename, "status": "built", "documents": bm25.N})
+    return report
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Rebuild the memory-mapped ui-ux-pro-max indexes")
+    parser.add_argument("--force", action="store_true", help="Rebuild even if the index is fresh")
+    args = parser.parse_args()
+    for entry in build_indexes(force=args.force):
+        detail = f" ({entry['documents']} docs)" if "documents" in entry else ""
+        print(f"{entry['status']:>7}  {entry['file']}{detail}")
@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+UI/UX Pro Max Client - thin client for the search daemon (daemon.py).
+Starts the daemon on first use, then every lookup is a socket round trip
+against warm indexes instead of a fresh interpreter + CSV parse.
+
+Usage: python client.py "<query>" [--domain <domain>] [--stack <stack>] [--max-results 3] [--json]
+       python client.py "<query>" --all
+       python client.py "<query>" --design-system [-p "Project Name"] [-f markdown]
+       python client.py --stats
+       python client.py --stop
+
+Falls back to an in-process search where Unix domain sockets are unavailable,
+or when the daemon times out or sends an empty or malformed reply.
+"""
+
+import argparse
+import json
+import os
+import socket
+import subprocess
+import sys
+import time
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+CONNECT_TIMEOUT = 5.0  # Seconds to wait for a freshly spawned daemon
+RESPONSE_TIMEOUT = 60.0
+
+
+def socket_path():
+    """Per-user socket path (override with UIPRO_SOCKET)"""
+    override = os.environ.get("UIPRO_SOCKET")
+    if override:
+        return override
+    base = os.environ.get("XDG_RUNTIME_DIR") or "/tmp"
+    user = os.getuid() if hasattr(os, "getuid") else os.environ.get("USERNAME", "user")
+    return os.path.join(base, f"ui-ux-pro-max-{user}.sock")
+
+
+def _send(path, request):
+    """One request/response round trip; raises OSError if nothing listens or it times out, ValueError on a broken reply"""
+    conn = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    conn.settimeout(RESPONSE_TIMEOUT)
+    try:
+        conn.connect(path)
+        conn.sendall((json.dumps(request, ensure_ascii=False) + "\n").encode("utf-8"))
+        chunks = []
+        while True:
+            chunk = conn.recv(65536)
+            if not chunk:
+                break
+            chunks.append(chunk)
+            if chunk.endswith(b"\n"):
+                break
+    finally:
+        conn.close()
+    response = json.loads(b"".join(chunks).decode("utf-8"))
+    if not isinstance(response, dict):
+        raise ValueError(f"Unexpected daemon reply: {response!r}")
+    return response
+
+
+def _start_daemon(path):
+    """Spawn `search.py --serve` detached from this process"""
+    subprocess.Popen(
+        [sys.executable, os.path.join(SCRIPT_DIR, "search.py"), "--serve", "--socket", path],
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        start_new_session=True,
+        cwd=SCRIPT_DIR
+    )
+
+
+def request(payload, autostart=True):
+    """Send a request to the daemon, starting it on first use"""
+    if not hasattr(socket, "AF_UNIX"):
+        return _request_in_process(payload)
+
+    path = socket_path()
+    try:
+        return _send(path, payload)
+    except (FileNotFoundError, ConnectionRefusedError):
+        if not autostart:
+            raise
+    except (socket.timeout, ValueError):
+        return _request_in_process(payload)  # Daemon hung or sent a broken reply
+
+    _start_daemon(path)
+    deadline = time.monotonic() + CONNECT_TIMEOUT
+    while True:
+        try:
+            return _send(path, payload)
+        except (FileNotFoundError, ConnectionRefusedError):
+            if time.monotonic() > deadline:
+                return _request_in_process(payload)
+            time.sleep(0.05)
+        except (socket.timeout, ValueError):
+            return _request_in_process(payload)
+
+
+def _request_in_process(payload):
+    """Answer without a daemon (no AF_UNIX, or the daemon failed to start or answer)"""
+    sys.path.insert(0, SCRIPT_DIR)
+    from daemon import handle_request
+    return handle_request(payload)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="UI Pro Max Search (daemon client)")
+    parser.add_argument("query", nargs="?", help="Search query")
+    parser.add_argument("--domain", "-d", help="Search domain")
+    parser.add_argument("--stack", "-s", help="Stack-specific search")
+    parser.add_argument("--max-results", "-n", type=int, default=3, help="Max results (default: 3)")
+    parser.add_argument("--json", action="store_true", help="Output as JSON")
+    parser.add_argument("--all", action="store_true", help="Federated search across every domain and stack")
+    parser.add_argument("--design-system", "-ds", action="store_true", help="Generate complete design system recommendation")
+    parser.add_argument("--project-name", "-p", type=str, default=None, help="Project name for design system output")
+    parser.add_argument("--format", "-f", choices=["ascii", "markdown"], default="ascii", help="Output format for design system")
+    parser.add_argument("--stats", action="store_true", help="Show the daemon's result-cache statistics")
+    parser.add_argument("--stop", action="store_true", help="Shut down the running daemon")
+    args = parser.parse_args()
+
+    if args.stats:
+        print(json.dumps(request({"op": "cache_stats"})["result"], indent=2))
+        return
+
+    if args.stop:
+        try:
+            request({"op": "shutdown"}, autostart=False)
+        except (FileNotFoundError, ConnectionRefusedError):
+            print("No daemon running")
+        return
+    if args.query is None:
+        parser.error("the following arguments are required: query")
+
+    if args.design_system:
+        payload = {"op": "design_system", "query": args.query, "project_name": args.project_name, "format": args.format}
+    elif args.all:
+        payload = {"op": "search_all", "query": args.query, "max_results": args.max_results}
+    elif args.stack:
+        payload = {"op": "search_stack", "query": args.query, "stack": args.stack, "max_results": args.max_results}
+    else:
+        payload = {"op": "search", "query": args.query, "domain": args.domain, "max_results": args.max_results}
+    if not args.json:
+        payload["format"] = "text"
+
+    response = request(payload)
+    if not response.get("ok"):
+        print(f"Error: {response.get('error')}")
+        sys.exit(1)
+    if args.json and "result" in response:
+        print(json.dumps(response["result"], indent=2, ensure_ascii=False))
+    else:
+        print(response["text"])
+
+
+if __name__ == "__main__":
+    main()
@@ -4,70 +4,110 @@
 UI/UX Pro Max Core - BM25 search engine for UI/UX style guides
 """
 
-import csv
+import heapq
+import json
+import os
 import re
+import sys
+import threading
+import time
+from bisect import bisect_left
 from pathlib import Path
 from math import log
-from collections import defaultdict
+from collections import OrderedDict, defaultdict
+from functools import lru_cache
+
+# Startup path: csv, hashlib, unicodedata, sqlite3 and numpy are imported by the
+# functions that need them, so a search served from a fresh index skips them.
 
 # ============ CONFIGURATION ============
 DATA_DIR = Path(__file__).parent.parent / "data"
+INDEX_DIR = DATA_DIR / ".index"
+INDEX_VERSION = 5
+INDEX_FORMAT_ENV = "UIPRO_INDEX_FORMAT"  # Overrides INDEX_FORMAT for a process tree (e.g. every agent on a host)
+INDEX_FORMAT = os.environ.get(INDEX_FORMAT_ENV, "json")  # "json" or "binary" (memory-mapped, shared across processes; see binindex.py)
+INDEX_CACHE_SIZE = 32  # Fitted indexes kept in memory per process
+BM25_ENGINE = "auto"  # "python", "numpy", or "auto" (NumPy for large corpora when installed)
+NUMPY_MIN_DOCS = 2000  # Below this, per-call NumPy overhead outweighs the vectorized scan
+NUMPY_BATCH_ROWS = 256  # Queries scored per dense score block in batch mode
+RESULT_CACHE_SIZE = 1024  # Query results kept in memory per process
+RESULT_CACHE_TTL = 3600  # Seconds before a cached result is recomputed
+RESULT_STORE_ENV = "UIPRO_RESULT_STORE"  # "1" (data/.index/results.sqlite3) or a path: share results across processes
 MAX_RESULTS = 3
+FOLD_ACCENTS = True  # "anotações" and "anotacoes" index to the same token
+STEM_TOKENS = False  # Light plural stemming (English S-stemmer, Portuguese -ções/-ais/-éis)
+FUZZY_MATCHING = True  # Expand out-of-vocabulary query tokens ("glassmorph", "neumorphic", typos)
+FUZZY_MAX_EDITS = 2  # Edit-distance budget for tokens of 8+ chars (shorter tokens get less, see _edit_budget)
+FUZZY_MAX_EXPANSIONS = 3  # Vocabulary terms one unknown token may expand to
+FUZZY_MIN_PREFIX = 4  # Shortest token completed by prefix ("anim" -> "animation")
 
+# search_weights: optional BM25F weight per search column (default 1); a match in a
+# weight-3 column counts like three matches in an unweighted one
 CSV_CONFIG = {
     "style": {
         "file": "styles.csv",
         "search_cols": ["Style Category", "Keywords", "Best For", "Type"],
+        "search_weights": {"Style Category": 3, "Keywords": 2},
         "output_cols": ["Style Category", "Type", "Keywords", "Primary Colors", "Effects & Animation", "Best For", "Performance", "Accessibility", "Framework Compatibility", "Complexity"]
     },
     "prompt": {
         "file": "prompts.csv",
         "search_cols": ["Style Category", "AI Prompt Keywords (Copy-Paste Ready)", "CSS/Technical Keywords"],
+        "search_weights": {"Style Category": 3},
         "output_cols": ["Style Category", "AI Prompt Keywords (Copy-Paste Ready)", "CSS/Technical Keywords", "Implementation Checklist"]
     },
     "color": {
         "file": "colors.csv",
         "search_cols": ["Product Type", "Keywords", "Notes"],
+        "search_weights": {"Product Type": 3, "Keywords": 2},
         "output_cols": ["Product Type", "Keywords", "Primary (Hex)", "Secondary (Hex)", "CTA (Hex)", "Background (Hex)", "Text (Hex)", "Border (Hex)", "Notes"]
     },
     "chart": {
         "file": "charts.csv",
         "search_cols": ["Data Type", "Keywords", "Best Chart Type", "Accessibility Notes"],
+        "search_weights": {"Data Type": 3, "Keywords": 2},
         "output_cols": ["Data Type", "Keywords", "Best Chart Type", "Secondary Options", "Color Guidance", "Accessibility Notes", "Library Recommendation", "Interactive Level"]
     },
     "landing": {
         "file": "landing.csv",
         "search_cols": ["Pattern Name", "Keywords", "Conversion Optimization", "Section Order"],
+        "search_weights": {"Pattern Name": 3, "Keywords": 2},
         "output_cols": ["Pattern Name", "Keywords", "Section Order", "Primary CTA Placement", "Color Strategy", "Conversion Optimization"]
     },
     "product": {
         "file": "products.csv",
         "search_cols": ["Product Type", "Keywords", "Primary Style Recommendation", "Key Considerations"],
+        "search_weights": {"Product Type": 3, "Keywords": 2},
         "output_cols": ["Product Type", "Keywords", "Primary Style Recommendation", "Secondary Styles", "Landing Page Pattern", "Dashboard Style (if applicable)", "Color Palette Focus"]
     },
     "ux": {
         "file": "ux-guidelines.csv",
         "search_cols": ["Category", "Issue", "Description", "Platform"],
+        "search_weights": {"Category": 2, "Issue": 3},
         "output_cols": ["Category", "Issue", "Platform", "Description", "Do", "Don't", "Code Example Good", "Code Example Bad", "Severity"]
     },
     "typography": {
         "file": "typography.csv",
         "search_cols": ["Font Pairing Name", "Category", "Mood/Style Keywords", "Best For", "Heading Font", "Body Font"],
+        "search_weights": {"Font Pairing Name": 3, "Mood/Style Keywords": 2},
         "output_cols": ["Font Pairing Name", "Category", "Heading Font", "Body Font", "Mood/Style Keywords", "Best For", "Google Fonts URL", "CSS Import", "Tailwind Config", "Notes"]
     },
     "icons": {
         "file": "icons.csv",
         "search_cols": ["Category", "Icon Name", "Keywords", "Best For"],
+        "search_weights": {"Icon Name": 3, "Keywords": 2},
         "output_cols": ["Category", "Icon Name", "Keywords", "Library", "Import Code", "Usage", "Best For", "Style"]
     },
     "react": {
         "file": "react-performance.csv",
         "search_cols": ["Category", "Issue", "Keywords", "Description"],
+        "search_weights": {"Issue": 3, "Keywords": 2},
         "output_cols": ["Category", "Issue", "Platform", "Description", "Do", "Don't", "Code Example Good", "Code Example Bad", "Severity"]
     },
     "web": {
         "file": "web-interface.csv",
         "search_cols": ["Category", "Issue", "Keywords", "Description"],
+        "search_weights": {"Issue": 3, "Keywords": 2},
         "output_cols": ["Category", "Issue", "Platform", "Description", "Do", "Don't", "Code Example Good", "Code Example Bad", "Severity"]
     }
 }
@@ -90,107 +130,1032 @@ STACK_CONFIG = {
 # Common columns for all stacks
 _STACK_COLS = {
     "search_cols": ["Category", "Guideline", "Description", "Do", "Don't"],
+    "search_weights": {"Guideline": 3, "Category": 2},
     "output_cols": ["Category", "Guideline", "Description", "Do", "Don't", "Code Good", "Code Bad", "Severity", "Docs URL"]
 }
 
 AVAILABLE_STACKS = list(STACK_CONFIG.keys())
 
 
+# ============ TOKENIZER ============
+_TOKEN_RE = re.compile(r"\w{3,}")  # Same tokens as replacing [^\w\s] with spaces, splitting, dropping len <= 2
+_DIACRITICS_RE = re.compile("[\u0300-\u036f\u1ab0-\u1aff\u1dc0-\u1dff\u20d0-\u20ff\ufe20-\ufe2f]")
+
+
+def _fold_accents(text):
+    """Strip Latin diacritics: "consultórios" -> "consultorios" """
+    if text.isascii():
+        return text
+    import unicodedata
+    return _DIACRITICS_RE.sub("", unicodedata.normalize("NFKD", text))
+
+
+def _stem(token):
+    """Conservative plural stemmer; never shortens a token below 3 characters"""
+    if len(token) <= 4:
+        return token
+    if token.endswith("coes") or token.endswith("soes"):
+        return token[:-3] + "ao"   # anotacoes -> anotacao
+    if token.endswith("ais") or token.endswith("eis"):
+        return token[:-2] + "l"    # animais -> animal, papeis -> papel
+    if token.endswith("ies") and not token.endswith(("eies", "aies")):
+        return token[:-3] + "y"    # categories -> category
+    if token.endswith("es") and not token.endswith(("aes", "ees", "oes")):
+        return token[:-1]          # pages -> page
+    if token.endswith("s") and not token.endswith(("us", "ss", "is")):
+        return token[:-1]          # consultorios -> consultorio
+    return token
+
+
+def _tokenize_text(text, fold=True, stem=False):
+    """Tokenizer pipeline: lowercase, fold accents, split on \w runs, drop short words, stem, intern"""
+    text = str(text).lower()
+    if fold:
+        text = _fold_accents(text)
+    tokens = _TOKEN_RE.findall(text)
+    if stem:
+        tokens = [_stem(w) for w in tokens]
+    return [sys.intern(w) for w in tokens]
+
+
+@lru_cache(maxsize=8192)
+def _tokenize_query(text, fold, stem):
+    """Cached tokenization for query strings (agents repeat the same queries)"""
+    return tuple(_tokenize_text(text, fold, stem))
+
+
+def tokenizer_signature():
+    """Tokenizer settings an index was built with; a mismatch invalidates it"""
+    return {"fold": FOLD_ACCENTS, "stem": STEM_TOKENS}
+
+
+# ============ OPTIONAL NUMPY ============
+@lru_cache(maxsize=None)
+def numpy_available():
+    """Whether the vectorized engine can be used (numpy itself is imported once a corpus needs it)"""
+    from importlib.util import find_spec
+    return find_spec("numpy") is not None
+
+
+# ============ FUZZY MATCHING ============
+def _trigrams(term):
+    """Boundary-padded character trigrams ("$gl", "gla", ..., "ss$")"""
+    padded = f"${term}$"
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def _edit_budget(token):
+    """Edits allowed for a token: none below 5 chars ("mode" is not "code"), 1 up to 7, then FUZZY_MAX_EDITS"""
+    if len(token) < 5:
+        return 0
+    return 1 if len(token) < 8 else FUZZY_MAX_EDITS
+
+
+def _edit_distance(a, b, limit):
+    """Levenshtein distance between a and b, or None once it must exceed limit"""
+    if abs(len(a) - len(b)) > limit:
+        return None
+    previous = list(range(len(b) + 1))
+    for i, char_a in enumerate(a, 1):
+        current = [i]
+        for j, char_b in enumerate(b, 1):
+            current.append(min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (char_a != char_b)))
+        if min(current) > limit:
+            return None
+        previous = current
+    return previous[-1] if previous[-1] <= limit else None
+
+
 # ============ BM25 IMPLEMENTATION ============
 class BM25:
-    """BM25 ranking algorithm for text search"""
+    """BM25 ranking algorithm for text search.
 
-    def __init__(self, k1=1.5, b=0.75):
+    With field_weights, documents are sequences of field strings scored
+    BM25F-style: a term's frequency is the weighted sum of its per-field
+    counts and document length is the weighted sum of field lengths, so a hit
+    in a heavily weighted column ("Style Category") outranks one buried in a
+    long description. Without weights, fields are simply concatenated.
+    """
+
+    def __init__(self, k1=1.5, b=0.75, engine=None, field_weights=None):
         self.k1 = k1
         self.b = b
-        self.corpus = []
+        self.engine = engine or BM25_ENGINE
+        self.field_weights = list(field_weights) if field_weights else None
+        self.field_lengths = []  # Tokens per field of each document (weighted models only)
+        self._corpus = []
+        self._corpus_text = None
         self.doc_lengths = []
         self.avgdl = 0
         self.idf = {}
         self.doc_freqs = defaultdict(int)
+        self.postings = {}
+        self.norms = []
         self.N = 0
+        self._matrix = None
+        self._fuzzy = None  # (sorted vocabulary, trigram -> terms, expansion memo), built on first unknown token
+
+    @property
+    def corpus(self):
+        """Tokenized documents (a loaded index keeps them space-joined until needed)"""
+        if self._corpus is None:
+            self._corpus = [doc.split() for doc in self._corpus_text]
+        return self._corpus
+
+    @corpus.setter
+    def corpus(self, documents):
+        self._corpus = documents
+        self._corpus_text = None
 
-    def tokenize(self, text):
+    @staticmethod
+    def tokenize(text):
         """Lowercase, split, remove punctuation, filter short words"""
-        text = re.sub(r'[^\w\s]', ' ', str(text).lower())
-        return [w for w in text.split() if len(w) > 2]
+        if isinstance(text, str):
+            return list(_tokenize_query(text, FOLD_ACCENTS, STEM_TOKENS))
+        return _tokenize_text(text, FOLD_ACCENTS, STEM_TOKENS)
+
+    def _tokenize_document(self, document):
+        """(tokens, tokens per field or None) for a string or a sequence of field strings"""
+        if isinstance(document, str):
+            return _tokenize_text(document, FOLD_ACCENTS, STEM_TOKENS), None
+        if self.field_weights is None:
+            return _tokenize_text(" ".join(document), FOLD_ACCENTS, STEM_TOKENS), None
+        fields = [_tokenize_text(field, FOLD_ACCENTS, STEM_TOKENS) for field in document]
+        return [token for field in fields for token in field], [len(field) for field in fields]
+
+    def _doc_length(self, tokens, lengths):
+        """Document length; weighted sum of field lengths for BM25F"""
+        if lengths is None:
+            return len(tokens)
+        return sum(weight * length for weight, length in zip(self.field_weights, lengths))
+
+    def fit(self, documents, known_tokens=None):
+        """Build BM25 index (IDF table + postings lists) from documents.
 
-    def fit(self, documents):
-        """Build BM25 index from documents"""
-        self.corpus = [self.tokenize(doc) for doc in documents]
+        known_tokens maps a document to its (tokens, field lengths) from a
+        previous build, so unchanged rows are not re-tokenized.
+        """
+        known_tokens = known_tokens or {}
+        tokenized = [known_tokens[doc] if doc in known_tokens else self._tokenize_document(doc) for doc in documents]
+        self.corpus = [tokens for tokens, _ in tokenized]
+        self.field_lengths = [lengths for _, lengths in tokenized] if self.field_weights else []
         self.N = len(self.corpus)
-        if self.N == 0:
-            return
-        self.doc_lengths = [len(doc) for doc in self.corpus]
-        self.avgdl = sum(self.doc_lengths) / self.N
-
-        for doc in self.corpus:
-            seen = set()
-            for word in doc:
-                if word not in seen:
-                    self.doc_freqs[word] += 1
-                    seen.add(word)
-
-        for word, freq in self.doc_freqs.items():
-            self.idf[word] = log((self.N - freq + 0.5) / (freq + 0.5) + 1)
-
-    def score(self, query):
-        """Score all documents against query"""
-        query_tokens = self.tokenize(query)
-        scores = []
-
-        for idx, doc in enumerate(self.corpus):
-            score = 0
-            doc_len = self.doc_lengths[idx]
-            term_freqs = defaultdict(int)
-            for word in doc:
+        self.doc_lengths = [self._doc_length(tokens, lengths) for tokens, lengths in tokenized]
+        self.doc_freqs = defaultdict(int)
+        self.postings = {}  # term -> [(doc_id, tf)], in doc_id order
+        for idx, (tokens, lengths) in enumerate(tokenized):
+            self._index_document(idx, tokens, lengths)
+        self._refresh_statistics()
+
+    # ---- Incremental updates (must leave the model identical to a full fit) ----
+    def add_documents(self, documents, at=None):
+        """Insert documents at doc id `at` (default: append); returns their doc ids"""
+        tokenized = [self._tokenize_document(doc) for doc in documents]
+        doc_ids = self._insert(tokenized, self.N if at is None else at)
+        self._refresh_statistics()
+        return doc_ids
+
+    def remove_documents(self, doc_ids):
+        """Delete documents; later doc ids shift down to stay contiguous"""
+        self._delete(doc_ids)
+        self._refresh_statistics()
+
+    def update_document(self, doc_id, document):
+        """Replace one document in place (its doc id is unchanged)"""
+        self._replace(doc_id, *self._tokenize_document(document))
+        self._refresh_statistics()
+
+    def _index_document(self, idx, tokens, lengths=None):
+        """Add one tokenized document to doc_freqs and the postings lists"""
+        term_freqs = defaultdict(int)
+        if lengths is None:
+            for word in tokens:
                 term_freqs[word] += 1
+        else:
+            start = 0
+            for weight, length in zip(self.field_weights, lengths):
+                for word in tokens[start:start + length]:
+                    term_freqs[word] += weight
+                start += length
+        for word, tf in term_freqs.items():
+            self.doc_freqs[word] += 1
+            plist = self.postings.setdefault(word, [])
+            if not plist or plist[-1][0] < idx:
+                plist.append((idx, tf))
+            else:
+                plist.insert(bisect_left(plist, (idx,)), (idx, tf))
 
-            for token in query_tokens:
-                if token in self.idf:
-                    tf = term_freqs[token]
-                    idf = self.idf[token]
-                    numerator = tf * (self.k1 + 1)
-                    denominator = tf + self.k1 * (1 - self.b + self.b * doc_len / self.avgdl)
-                    score += idf * numerator / denominator
+    def _unindex_document(self, idx):
+        """Remove one document from doc_freqs and the postings lists"""
+        for word in set(self.corpus[idx]):
+            plist = self.postings[word]
+            del plist[bisect_left(plist, (idx,))]
+            if not plist:
+                del self.postings[word]
+            self.doc_freqs[word] -= 1
+            if not self.doc_freqs[word]:
+                del self.doc_freqs[word]
 
-            scores.append((idx, score))
+    def _mutable_postings(self):
+        """Loaded postings hold JSON [doc_id, tf] pairs; bisect needs tuples"""
+        for word, plist in self.postings.items():
+            if plist and not isinstance(plist[0], tuple):
+                self.postings[word] = [tuple(entry) for entry in plist]
 
-        return sorted(scores, key=lambda x: x[1], reverse=True)
+    def _insert(self, tokenized, at):
+        """Insert (tokens, field lengths) documents at doc id `at`, shifting later ids up"""
+        if not tokenized:
+            return []
+        self._mutable_postings()
+        count = len(tokenized)
+        if at < self.N:
+            for word, plist in self.postings.items():
+                if plist[-1][0] >= at:
+                    self.postings[word] = [(i + count if i >= at else i, tf) for i, tf in plist]
+        self.corpus[at:at] = [tokens for tokens, _ in tokenized]
+        self.doc_lengths[at:at] = [self._doc_length(tokens, lengths) for tokens, lengths in tokenized]
+        if self.field_weights:
+            self.field_lengths[at:at] = [lengths for _, lengths in tokenized]
+        self.N += count
+        for offset, (tokens, lengths) in enumerate(tokenized):
+            self._index_document(at + offset, tokens, lengths)
+        return list(range(at, at + count))
+
+    def _delete(self, doc_ids):
+        """Drop documents and compact the doc ids after them"""
+        removed = sorted(set(doc_ids))
+        if not removed:
+            return
+        self._mutable_postings()
+        for idx in removed:
+            self._unindex_document(idx)
+        first = removed[0]
+        for word, plist in self.postings.items():
+            if plist[-1][0] > first:
+                self.postings[word] = [(i - bisect_left(removed, i), tf) for i, tf in plist]
+        for idx in reversed(removed):
+            del self.corpus[idx]
+            del self.doc_lengths[idx]
+            if self.field_weights:
+                del self.field_lengths[idx]
+        self.N -= len(removed)
+
+    def _replace(self, doc_id, tokens, lengths=None):
+        """Swap the tokens of one document"""
+        self._mutable_postings()
+        self._unindex_document(doc_id)
+        self.corpus[doc_id] = tokens
+        self.doc_lengths[doc_id] = self._doc_length(tokens, lengths)
+        if self.field_weights:
+            self.field_lengths[doc_id] = lengths
+        self._index_document(doc_id, tokens, lengths)
+
+    def _refresh_statistics(self):
+        """Recompute avgdl, IDF and length norms after the corpus changed"""
+        self.avgdl = sum(self.doc_lengths) / self.N if self.N else 0
+        self.idf = {word: log((self.N - freq + 0.5) / (freq + 0.5) + 1) for word, freq in self.doc_freqs.items()}
+        self.norms = []
+        if self.N:
+            self._compute_norms()
+        self._matrix = None
+        self._fuzzy = None
+
+    def _compute_norms(self):
+        """Precompute the per-document length normalization term"""
+        if not self.avgdl:
+            self.norms = [self.k1 * (1 - self.b)] * self.N  # No document has an indexable token
+            return
+        self.norms = [self.k1 * (1 - self.b + self.b * doc_len / self.avgdl) for doc_len in self.doc_lengths]
+
+    def score(self, query, top_k=None):
+        """Score documents containing a query term, best first (ties by doc order)"""
+        return self.score_tokens(self._query_tokens(query), top_k)
+
+    def _query_tokens(self, query):
+        """Tokenize a query, expanding unknown tokens when FUZZY_MATCHING is on"""
+        tokens = self.tokenize(query)
+        return self.expand(tokens) if FUZZY_MATCHING else tokens
+
+    def expand(self, tokens):
+        """Replace out-of-vocabulary tokens with close vocabulary terms.
+
+        Each unknown token becomes up to FUZZY_MAX_EXPANSIONS terms that either
+        extend it ("glassmorph" -> "glassmorphism") or lie within its edit
+        budget ("neumorphic" -> "neumorphism"); known tokens pass through.
+        """
+        if all(token in self.idf for token in tokens):
+            return tokens
+        expanded = []
+        for token in tokens:
+            if token in self.idf:
+                expanded.append(token)
+            else:
+                expanded.extend(self._expansions(token))
+        return expanded
+
+    def _fuzzy_index(self):
+        """Sorted vocabulary + trigram side index over it, built once per fitted model"""
+        if self._fuzzy is None:
+            grams = defaultdict(list)
+            for term in self.idf:
+                for gram in _trigrams(term):
+                    grams[gram].append(term)
+            self._fuzzy = (sorted(self.idf), dict(grams), {})
+        return self._fuzzy
+
+    def _expansions(self, token):
+        """Closest vocabulary terms for one unknown token (memoized per model)"""
+        vocabulary, grams, memo = self._fuzzy_index()
+        if token in memo:
+            return memo[token]
+
+        candidates = {}  # term -> (edits, length difference)
+        if len(token) >= FUZZY_MIN_PREFIX:
+            start = bisect_left(vocabulary, token)
+            for term in vocabulary[start:start + 64]:
+                if not term.startswith(token):
+                    break
+                candidates[term] = (0, len(term) - len(token))
+
+        budget = _edit_budget(token)
+        if budget > 0:
+            token_grams = _trigrams(token)
+            shared = defaultdict(int)
+            for gram in token_grams:
+                for term in grams.get(gram, ()):
+                    shared[term] += 1
+            needed = len(token_grams) - 3 * budget  # One edit breaks at most three trigrams
+            for term, count in shared.items():
+                if count < needed or term in candidates or term[0] != token[0]:
+                    continue  # Typos rarely hit the first letter; this keeps "chart" from matching "start"
+                edits = _edit_distance(token, term, budget)
+                if edits is not None:
+                    candidates[term] = (edits, abs(len(term) - len(token)))
+
+        best = sorted(candidates, key=lambda term: (candidates[term], -self.doc_freqs[term], term))
+        if len(memo) >= 4096:
+            memo.clear()
+        memo[token] = best[:FUZZY_MAX_EXPANSIONS]
+        return memo[token]
+
+    def score_tokens(self, query_tokens, top_k=None):
+        """score() for an already tokenized query"""
+        if self._vectorized():
+            return self._score_vectorized([query_tokens], top_k)[0]
+
+        scores = {}
+        for token in query_tokens:
+            postings = self.postings.get(token)
+            if not postings:
+                continue
+            idf = self.idf[token]
+            for idx, tf in postings:
+                numerator = tf * (self.k1 + 1)
+                denominator = tf + self.norms[idx]
+                scores[idx] = scores.get(idx, 0) + idf * numerator / denominator
+
+        return self._rank(scores, top_k)
+
+    def max_score(self, query_tokens):
+        """Upper bound of score() for these tokens in this corpus (tf -> infinity).
+
+        Unseen tokens count with the IDF they would have at df=0, so a corpus
+        missing part of the query cannot reach the bound.
+        """
+        unseen_idf = log((self.N + 0.5) / 0.5 + 1)
+        return sum(self.idf.get(token, unseen_idf) * (self.k1 + 1) for token in query_tokens)
+
+    def score_many(self, queries, top_k=None):
+        """Score a batch of queries, computing each distinct term's weights once"""
+        tokenized = [self._query_tokens(query) for query in queries]
+        if self._vectorized():
+            return self._score_vectorized(tokenized, top_k)
+
+        weights = {}
+        for token in {token for tokens in tokenized for token in tokens}:
+            postings = self.postings.get(token)
+            if not postings:
+                continue
+            idf = self.idf[token]
+            weights[token] = [(idx, idf * (tf * (self.k1 + 1)) / (tf + self.norms[idx])) for idx, tf in postings]
+
+        ranked = []
+        for tokens in tokenized:
+            scores = {}
+            for token in tokens:
+                for idx, weight in weights.get(token, ()):
+                    scores[idx] = scores.get(idx, 0) + weight
+            ranked.append(self._rank(scores, top_k))
+        return ranked
+
+    @staticmethod
+    def _rank(scores, top_k):
+        """Order {doc_id: score} best first, ties by doc order"""
+        if top_k is None:
+            return sorted(scores.items(), key=lambda x: (-x[1], x[0]))
+        return heapq.nlargest(top_k, scores.items(), key=lambda x: (x[1], -x[0]))
+
+    # ---- NumPy engine ----
+    def _vectorized(self):
+        """Whether this corpus is scored by the NumPy engine"""
+        if self.engine == "python" or self.N == 0:
+            return False
+        return (self.engine == "numpy" or self.N >= NUMPY_MIN_DOCS) and numpy_available()
+
+    def _build_matrix(self):
+        """CSR term-document matrix (rows = terms) of length-normalized BM25 weights"""
+        import numpy as np
+
+        terms = list(self.postings)
+        lengths = [len(self.postings[term]) for term in terms]
+        indptr = np.zeros(len(terms) + 1, dtype=np.int64)
+        np.cumsum(lengths, out=indptr[1:])
+        nnz = int(indptr[-1])
+
+        indices = np.fromiter((idx for term in terms for idx, _ in self.postings[term]), dtype=np.int64, count=nnz)
+        tfs = np.fromiter((tf for term in terms for _, tf in self.postings[term]), dtype=np.float64, count=nnz)
+        idf = np.repeat(np.array([self.idf[term] for term in terms], dtype=np.float64), lengths)
+        norms = np.asarray(self.norms, dtype=np.float64)[indices]
+
+        # Same operation order as the pure-Python scorer, so weights are bit-identical
+        data = idf * (tfs * (self.k1 + 1)) / (tfs + norms)
+        self._matrix = ({term: row for row, term in enumerate(terms)}, indptr, indices, data)
+
+    def _score_vectorized(self, tokenized, top_k):
+        """Score token lists with sparse row gathers; one scatter-add per token position"""
+        import numpy as np
+
+        if self._matrix is None:
+            self._build_matrix()
+        rows_by_term, indptr, indices, data = self._matrix
+
+        ranked = []
+        for start in range(0, len(tokenized), NUMPY_BATCH_ROWS):
+            block = tokenized[start:start + NUMPY_BATCH_ROWS]
+            scores = np.zeros((len(block), self.N), dtype=np.float64)
+
+            # Accumulate in query-token order so sums match the Python scorer exactly
+            for position in range(max((len(tokens) for tokens in block), default=0)):
+                query_ids, doc_ids, weights = [], [], []
+                for q, tokens in enumerate(block):
+                    row = rows_by_term.get(tokens[position]) if position < len(tokens) else None
+                    if row is None:
+                        continue
+                    lo, hi = indptr[row], indptr[row + 1]
+                    query_ids.append(np.full(hi - lo, q, dtype=np.int64))
+                    doc_ids.append(indices[lo:hi])
+                    weights.append(data[lo:hi])
+                if query_ids:
+                    scores[np.concatenate(query_ids), np.concatenate(doc_ids)] += np.concatenate(weights)
+
+            ranked.extend(self._top_k_vectorized(row_scores, top_k) for row_scores in scores)
+        return ranked
+
+    @staticmethod
+    def _top_k_vectorized(scores, top_k):
+        """argpartition top-k over a dense score vector, ties by doc order"""
+        import numpy as np
+
+        candidates = np.flatnonzero(scores > 0)
+        if top_k is not None and len(candidates) > top_k:
+            values = scores[candidates]
+            kth = values[np.argpartition(-values, top_k - 1)[top_k - 1]]
+            candidates = candidates[values >= kth]
+        order = np.lexsort((candidates, -scores[candidates]))
+        return [(int(idx), float(scores[idx])) for idx in candidates[order][:top_k]]
+
+    def to_dict(self):
+        """Serialize fitted state for the on-disk index"""
+        return {
+            "k1": self.k1,
+            "b": self.b,
+            "corpus": self._corpus_text if self._corpus is None else [" ".join(doc) for doc in self._corpus],
+            "doc_lengths": self.doc_lengths,
+            "avgdl": self.avgdl,
+            "idf": self.idf,
+            "doc_freqs": dict(self.doc_freqs),
+            "postings": self.postings,
+            "N": self.N,
+            "field_weights": self.field_weights,
+            "field_lengths": self.field_lengths
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        """Restore a fitted model without re-tokenizing the corpus"""
+        bm25 = cls(data["k1"], data["b"], field_weights=data.get("field_weights"))
+        bm25.field_lengths = data.get("field_lengths") or []
+        bm25._corpus, bm25._corpus_text = None, data["corpus"]
+        bm25.doc_lengths = data["doc_lengths"]
+        bm25.avgdl = data["avgdl"]
+        bm25.idf = data["idf"]
+        bm25.doc_freqs = defaultdict(int, data["doc_freqs"])
+        bm25.postings = data["postings"]
+        bm25.N = data["N"]
+        if bm25.N:
+            bm25._compute_norms()
+        return bm25
+
+
+# ============ CSV LOADING ============
+class RowStore:
+    """Columnar CSV rows: interned column names, one tuple per column, dicts built only for hits"""
+
+    __slots__ = ("columns", "_values", "_size")
+
+    def __init__(self, columns, values):
+        self.columns = tuple(sys.intern(col) for col in columns)
+        self._values = {col: tuple(column) for col, column in zip(self.columns, values)}
+        self._size = len(values[0]) if values else 0
+
+    def __len__(self):
+        return self._size
+
+    def __contains__(self, col):
+        return col in self._values
+
+    def get(self, idx, col, default=""):
+        """Single cell, or default if the column does not exist"""
+        column = self._values.get(col)
+        return column[idx] if column is not None else default
+
+    def row(self, idx, cols):
+        """Materialize one row restricted to the requested (existing) columns"""
+        return {col: self._values[col][idx] for col in cols if col in self._values}
+
+    def to_dict(self):
+        """Serialize for the on-disk index"""
+        return {"columns": list(self.columns), "values": [list(self._values[col]) for col in self.columns]}
+
+    @classmethod
+    def from_dict(cls, data):
+        """Restore from the on-disk index"""
+        return cls(data["columns"], data["values"])
 
 
-# ============ SEARCH FUNCTIONS ============
 def _load_csv(filepath):
-    """Load CSV and return list of dicts"""
-    with open(filepath, 'r', encoding='utf-8') as f:
-        return list(csv.DictReader(f))
+    """Load CSV into a RowStore (same cells csv.DictReader would produce)"""
+    import csv
+    with open(filepath, 'r', encoding='utf-8', newline='') as f:
+        reader = csv.reader(f)
+        header = next(reader, [])
+        columns = [[] for _ in header]
+        pool = {}  # Share repeated short values (severity, platform, ...) across rows
+        for record in reader:
+            if not record:
+                continue  # DictReader skips blank lines
+            for i, column in enumerate(columns):
+                value = record[i] if i < len(record) else None
+                if value is not None and len(value) <= 64:
+                    value = pool.setdefault(value, value)
+                column.append(value)
+    return RowStore(header, columns)
 
 
-def _search_csv(filepath, search_cols, output_cols, query, max_results):
-    """Core search function using BM25"""
-    if not filepath.exists():
-        return []
+# ============ PREBUILT INDEX ============
+def _index_path(filepath):
+    """Location of the prebuilt index artifact for a CSV file"""
+    try:
+        relative = filepath.resolve().relative_to(DATA_DIR.resolve())
+    except ValueError:
+        import hashlib
+        digest = hashlib.sha1(str(filepath.resolve()).encode("utf-8")).hexdigest()[:12]
+        relative = Path(f"{digest}-{filepath.name}")
+    return INDEX_DIR / relative.with_suffix(".json")
+
+
+def _file_hash(filepath):
+    """SHA-256 of the CSV contents, used when mtime alone is inconclusive"""
+    import hashlib
+    return hashlib.sha256(filepath.read_bytes()).hexdigest()
+
+
+def _source_signature(filepath):
+    """mtime/size/hash record stored with each index for invalidation"""
+    stat = filepath.stat()
+    return {"mtime_ns": stat.st_mtime_ns, "size": stat.st_size, "sha256": _file_hash(filepath)}
+
+
+def _document_fields(data, idx, search_cols):
+    """BM25 document for one row: the text of each search column"""
+    return tuple(str(data.get(idx, col)) for col in search_cols)
+
+
+def _search_weights(config, search_cols=None):
+    """BM25F weights aligned with search_cols, or None when every column weighs 1"""
+    weights = config.get("search_weights")
+    if not weights:
+        return None
+    aligned = tuple(weights.get(col, 1) for col in (search_cols or config["search_cols"]))
+    return aligned if any(weight != 1 for weight in aligned) else None
 
+
+def _build_index(filepath, search_cols, known_tokens=None, weights=None):
+    """Parse the CSV and fit a BM25 model over its search columns"""
     data = _load_csv(filepath)
+    documents = [_document_fields(data, idx, search_cols) for idx in range(len(data))]
 
-    # Build documents from search columns
-    documents = [" ".join(str(row.get(col, "")) for col in search_cols) for row in data]
+    bm25 = BM25(field_weights=weights)
+    bm25.fit(documents, known_tokens)
+    return data, bm25
 
-    # BM25 search
-    bm25 = BM25()
-    bm25.fit(documents)
-    ranked = bm25.score(query)
 
-    # Get top results with score > 0
-    results = []
-    for idx, score in ranked[:max_results]:
-        if score > 0:
-            row = data[idx]
-            results.append({col: row.get(col, "") for col in output_cols if col in row})
+def _save_index(filepath, search_cols, data, bm25, source=None):
+    """Write the index artifact atomically (temp file + rename)"""
+    payload = {
+        "version": INDEX_VERSION,
+        "source": source or _source_signature(filepath),
+        "search_cols": list(search_cols),
+        "search_weights": bm25.field_weights,
+        "tokenizer": tokenizer_signature(),
+        "rows": data.to_dict(),
+        "bm25": bm25.to_dict()
+    }
+
+    index_path = _index_path(filepath)
+    index_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = index_path.with_name(f"{index_path.name}.{os.getpid()}.tmp")
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(payload, f, ensure_ascii=False, separators=(",", ":"))
+    os.replace(tmp_path, index_path)
+
+
+def _read_payload(filepath):
+    """Raw index artifact for a CSV, or None if missing or unreadable"""
+    try:
+        with open(_index_path(filepath), 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _compatible(payload, search_cols, weights=None):
+    """Artifact was written by this format, for these columns, weights and tokenizer"""
+    return (payload is not None
+            and payload.get("version") == INDEX_VERSION
+            and payload.get("search_cols") == list(search_cols)
+            and payload.get("search_weights") == (list(weights) if weights else None)
+            and payload.get("tokenizer") == tokenizer_signature())
+
+
+def _load_index(filepath, search_cols, payload=None, weights=None):
+    """Load a prebuilt index, or None if it is missing or stale"""
+    if payload is None:
+        payload = _read_payload(filepath)
+    if not _compatible(payload, search_cols, weights):
+        return None
+
+    source = payload.get("source", {})
+    stat = filepath.stat()
+    if source.get("mtime_ns") == stat.st_mtime_ns and source.get("size") == stat.st_size:
+        return RowStore.from_dict(payload["rows"]), BM25.from_dict(payload["bm25"])
+
+    # mtime moved (checkout, touch): the index is still valid if the content is identical
+    if source.get("size") != stat.st_size or source.get("sha256") != _file_hash(filepath):
+        return None
+    data, bm25 = RowStore.from_dict(payload["rows"]), BM25.from_dict(payload["bm25"])
+    try:
+        _save_index(filepath, search_cols, data, bm25, dict(source, mtime_ns=stat.st_mtime_ns))
+    except OSError:
+        pass
+    return data, bm25
+
 
+def _known_tokens(payload, search_cols, weights=None):
+    """{document: (tokens, field lengths)} salvaged from a stale but compatible artifact"""
+    if not _compatible(payload, search_cols, weights):
+        return {}
+    data = RowStore.from_dict(payload["rows"])
+    corpus = payload["bm25"]["corpus"]
+    field_lengths = payload["bm25"].get("field_lengths") or [None] * len(corpus)
+    return {_document_fields(data, idx, search_cols): (tokens.split(), lengths)
+            for idx, (tokens, lengths) in enumerate(zip(corpus, field_lengths))}
+
+
+def _patch_index(filepath, search_cols, payload, weights=None):
+    """Bring a stale index up to date by applying the row diff to its BM25 model.
+
+    Only rows whose search text changed are re-tokenized and re-indexed;
+    returns None when a full rebuild is cheaper or required (new header,
+    most rows changed).
+    """
+    if not _compatible(payload, search_cols, weights):
+        return None
+    from difflib import SequenceMatcher
+
+    old_rows = RowStore.from_dict(payload["rows"])
+    data = _load_csv(filepath)
+    if old_rows.columns != data.columns:
+        return None
+    old_docs = [_document_fields(old_rows, idx, search_cols) for idx in range(len(old_rows))]
+    new_docs = [_document_fields(data, idx, search_cols) for idx in range(len(data))]
+
+    opcodes = [op for op in SequenceMatcher(None, old_docs, new_docs, autojunk=False).get_opcodes() if op[0] != "equal"]
+    if sum(max(i2 - i1, j2 - j1) for _, i1, i2, j1, j2 in opcodes) * 2 > max(len(new_docs), 1):
+        return None
+
+    bm25 = BM25.from_dict(payload["bm25"])
+    for _, i1, i2, j1, j2 in reversed(opcodes):  # Back to front keeps earlier doc ids valid
+        common = min(i2 - i1, j2 - j1)
+        for k in range(common):
+            bm25._replace(i1 + k, *bm25._tokenize_document(new_docs[j1 + k]))
+        if i2 - i1 > common:
+            bm25._delete(range(i1 + common, i2))
+        elif j2 - j1 > common:
+            bm25._insert([bm25._tokenize_document(doc) for doc in new_docs[j1 + common:j2]], i1 + common)
+    bm25._refresh_statistics()
+    return data, bm25
+
+
+def _refresh_index(filepath, search_cols, payload, weights=None):
+    """Patch a stale index in place when possible, otherwise rebuild it"""
+    index = _patch_index(filepath, search_cols, payload, weights)
+    if index is not None:
+        return index
+    return _build_index(filepath, search_cols, _known_tokens(payload, search_cols, weights), weights)
+
+
+def _open_index(filepath, search_cols, weights=None):
+    """Return (rows, bm25) from the prebuilt index, updating it when stale"""
+    if INDEX_FORMAT == "binary":
+        import binindex
+        return binindex.open_index(filepath, search_cols, weights)
+    payload = _read_payload(filepath)
+    index = _load_index(filepath, search_cols, payload, weights)
+    if index is not None:
+        return index
+
+    data, bm25 = _refresh_index(filepath, search_cols, payload, weights)
+    try:
+        _save_index(filepath, search_cols, data, bm25)
+    except OSError:
+        pass  # Read-only checkout: serve from the in-memory build
+    return data, bm25
+
+
+# ============ IN-PROCESS CACHE ============
+_index_cache = OrderedDict()
+_index_cache_lock = threading.RLock()  # Concurrent searches (design-system fan-out) share one cache
+_index_build_locks = {}  # key -> Lock held while that index loads; other keys load in parallel
+
+
+def _cached_index(key):
+    """Cached (rows, bm25) for a key, or None (caller holds _index_cache_lock)"""
+    index = _index_cache.get(key)
+    if index is not None:
+        _index_cache.move_to_end(key)
+    return index
+
+
+def _get_index(filepath, search_cols, weights=None):
+    """LRU-cached (rows, bm25) keyed by (path, mtime, search_cols, weights)"""
+    path = str(filepath)
+    search_cols = tuple(search_cols)
+    weights = tuple(weights) if weights else None
+    key = (path, filepath.stat().st_mtime_ns, search_cols, FOLD_ACCENTS, STEM_TOKENS, weights, INDEX_FORMAT)
+
+    with _index_cache_lock:
+        index = _cached_index(key)
+        if index is not None:
+            return index
+        build_lock = _index_build_locks.setdefault(key, threading.Lock())
+
+    # Load or build outside the cache lock; a second thread asking for the same key waits for the first
+    with build_lock:
+        with _index_cache_lock:
+            index = _cached_index(key)
+            if index is not None:
+                return index
+        try:
+            index = _open_index(filepath, search_cols, weights)
+        except BaseException:
+            with _index_cache_lock:
+                _release_build_lock(key, build_lock)
+            raise
+
+        with _index_cache_lock:
+            # Drop entries for older versions of the same file
+            for stale in [k for k in _index_cache if k[0] == path and k[2] == search_cols]:
+                del _index_cache[stale]
+            _index_cache[key] = index
+            while len(_index_cache) > INDEX_CACHE_SIZE:
+                _index_cache.popitem(last=False)
+            _release_build_lock(key, build_lock)  # Only once the index is visible to the next caller
+        return index
+
+
+def _release_build_lock(key, build_lock):
+    """Forget a key's build lock (caller holds _index_cache_lock)"""
+    if _index_build_locks.get(key) is build_lock:
+        del _index_build_locks[key]
+
+
+def clear_cache():
+    """Drop every index and query result held in the in-process caches"""
+    with _index_cache_lock:
+        _index_cache.clear()
+    with _result_cache_lock:
+        _result_cache.clear()
+        _result_stats.update(hits=0, misses=0, store_hits=0)
+
+
+# ============ RESULT CACHE ============
+_result_cache = OrderedDict()  # key -> (expires, source stamp, results, size in bytes)
+_result_cache_lock = threading.RLock()
+_result_stats = {"hits": 0, "misses": 0, "store_hits": 0}
+_result_store = {"conn": None, "path": None, "checked": False}
+
+
+def enable_result_store(path=None):
+    """Persist cached results in a small SQLite file shared by every process"""
+    import sqlite3
+
+    path = Path(path) if path else INDEX_DIR / "results.sqlite3"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(str(path), timeout=5, check_same_thread=False, isolation_level=None)
+    conn.execute("CREATE TABLE IF NOT EXISTS results (key TEXT PRIMARY KEY, source TEXT, expires REAL, value TEXT)")
+    conn.execute("DELETE FROM results WHERE expires <= ?", (time.time(),))
+    with _result_cache_lock:
+        _result_store.update(conn=conn, path=str(path), checked=True)
+    return conn
+
+
+def _store_conn():
+    """SQLite result store, opened on first use when RESULT_STORE_ENV is set"""
+    with _result_cache_lock:  # Reentrant: callers may already hold it; concurrent first uses open it once
+        if not _result_store["checked"]:
+            _result_store["checked"] = True
+            setting = os.environ.get(RESULT_STORE_ENV)
+            if setting:
+                try:
+                    enable_result_store(None if setting == "1" else setting)
+                except Exception:
+                    pass  # Unwritable location: stay memory-only
+        return _result_store["conn"]
+
+
+def _result_key(filepath, search_cols, output_cols, tokens, max_results, weights=None):
+    """Cache key: source file + columns/weights + normalized query tokens + result count + fuzzy mode"""
+    return (str(filepath), tuple(search_cols), tuple(weights) if weights else None, tuple(output_cols),
+            tuple(tokens), max_results, FUZZY_MATCHING)
+
+
+def _source_stamp(filepath):
+    """Cheap change detector for the CSV behind a cached result"""
+    stat = filepath.stat()
+    return [stat.st_mtime_ns, stat.st_size]
+
+
+def _cached_results(key, stamp):
+    """Fresh cached results for key, or None (counts a hit or a miss)"""
+    now = time.time()
+    with _result_cache_lock:
+        entry = _result_cache.get(key)
+        if entry is not None:
+            expires, source, results, _ = entry
+            if source == stamp and expires > now:
+                _result_cache.move_to_end(key)
+                _result_stats["hits"] += 1
+                return [dict(row) for row in results]
+            del _result_cache[key]
+
+        conn = _store_conn()
+        if conn is not None:
+            try:
+                row = conn.execute("SELECT source, expires, value FROM results WHERE key = ?",
+                                   (json.dumps(key, ensure_ascii=False),)).fetchone()
+            except Exception:
+                row = None
+            if row and json.loads(row[0]) == stamp and row[1] > now:
+                results = json.loads(row[2])
+                _remember(key, stamp, results, row[1], len(row[2].encode("utf-8")))
+                _result_stats["hits"] += 1
+                _result_stats["store_hits"] += 1
+                return [dict(r) for r in results]
+
+        _result_stats["misses"] += 1
+        return None
+
+
+def _remember(key, stamp, results, expires, size):
+    """Insert into the in-memory LRU, evicting the oldest entries"""
+    _result_cache[key] = (expires, stamp, results, size)
+    _result_cache.move_to_end(key)
+    while len(_result_cache) > RESULT_CACHE_SIZE:
+        _result_cache.popitem(last=False)
+
+
+def _store_results(key, stamp, results):
+    """Cache freshly ranked results in memory (and in the shared store if enabled)"""
+    value = json.dumps(results, ensure_ascii=False)
+    expires = time.time() + RESULT_CACHE_TTL
+    with _result_cache_lock:
+        _remember(key, stamp, [dict(row) for row in results], expires, len(value.encode("utf-8")))
+        conn = _store_conn()
+        if conn is not None:
+            try:
+                conn.execute("INSERT OR REPLACE INTO results (key, source, expires, value) VALUES (?, ?, ?, ?)",
+                             (json.dumps(key, ensure_ascii=False), json.dumps(stamp), expires, value))
+            except Exception:
+                pass
+
+
+def cache_stats():
+    """Hit ratio, entry count and bytes used by the result cache"""
+    with _result_cache_lock:
+        lookups = _result_stats["hits"] + _result_stats["misses"]
+        stats = {
+            "hits": _result_stats["hits"],
+            "misses": _result_stats["misses"],
+            "hit_ratio": round(_result_stats["hits"] / lookups, 4) if lookups else 0.0,
+            "entries": len(_result_cache),
+            "bytes": sum(entry[3] for entry in _result_cache.values()),
+            "indexes": len(_index_cache)
+        }
+        conn = _store_conn()
+        if conn is not None:
+            entries, size = conn.execute("SELECT COUNT(*), COALESCE(SUM(LENGTH(CAST(value AS BLOB))), 0) FROM results").fetchone()
+            stats["store"] = {"path": _result_store["path"], "hits": _result_stats["store_hits"],
+                              "entries": entries, "bytes": size}
+        return stats
+
+
+def _index_targets():
+    """(file, search_cols, weights) for every domain and stack CSV"""
+    targets = [(config["file"], config["search_cols"], _search_weights(config)) for config in CSV_CONFIG.values()]
+    targets += [(config["file"], _STACK_COLS["search_cols"], _search_weights(_STACK_COLS)) for config in STACK_CONFIG.values()]
+    return targets
+
+
+def build_indexes(force=False):
+    """Prebuild on-disk indexes (in INDEX_FORMAT) for every domain and stack CSV"""
+    if INDEX_FORMAT == "binary":
+        import binindex
+        return binindex.build_indexes(force)
+
+    report = []
+    for filename, search_cols, weights in _index_targets():
+        filepath = DATA_DIR / filename
+        if not filepath.exists():
+            report.append({"file": filename, "status": "missing"})
+            continue
+        payload = _read_payload(filepath)
+        if not force and _load_index(filepath, search_cols, payload, weights) is not None:
+            report.append({"file": filename, "status": "fresh"})
+            continue
+        index = None if force else _patch_index(filepath, search_cols, payload, weights)
+        status = "patched" if index is not None else "built"
+        if index is None:
+            index = _build_index(filepath, search_cols, None if force else _known_tokens(payload, search_cols, weights), weights)
+        data, bm25 = index
+        _save_index(filepath, search_cols, data, bm25)
+        report.append({"file": filename, "status": status, "documents": bm25.N})
+    return report
+
+
+# ============ SEARCH FUNCTIONS ============
+def _search_csv(filepath, search_cols, output_cols, query, max_results, weights=None):
+    """Core search function using BM25 (BM25F when search columns are weighted)"""
+    if not filepath.exists():
+        return []
+
+    stamp = _source_stamp(filepath)
+    key = _result_key(filepath, search_cols, output_cols, _tokenize_query(query, FOLD_ACCENTS, STEM_TOKENS), max_results, weights)
+    results = _cached_results(key, stamp)
+    if results is not None:
+        return results
+
+    data, bm25 = _get_index(filepath, search_cols, weights)
+    results = _collect_rows(data, bm25.score(query, top_k=max_results), output_cols)
+    _store_results(key, stamp, results)
     return results
 
 
+def _search_csv_many(filepath, search_cols, output_cols, queries, max_results, weights=None):
+    """Batch variant of _search_csv: one index load, shared term weights"""
+    if not filepath.exists():
+        return [[] for _ in queries]
+
+    stamp = _source_stamp(filepath)
+    keys = [_result_key(filepath, search_cols, output_cols, _tokenize_query(query, FOLD_ACCENTS, STEM_TOKENS), max_results, weights)
+            for query in queries]
+    batch = [_cached_results(key, stamp) for key in keys]
+
+    misses = [i for i, results in enumerate(batch) if results is None]
+    if misses:
+        data, bm25 = _get_index(filepath, search_cols, weights)
+        ranked = bm25.score_many([queries[i] for i in misses], top_k=max_results)
+        for i, hits in zip(misses, ranked):
+            batch[i] = _collect_rows(data, hits, output_cols)
+            _store_results(keys[i], stamp, batch[i])
+    return batch
+
+
+def _collect_rows(data, ranked, output_cols):
+    """Get top results with score > 0, restricted to output columns"""
+    return [data.row(idx, output_cols) for idx, score in ranked if score > 0]
+
+
 def detect_domain(query):
     """Auto-detect the most relevant domain from query"""
     query_lower = query.lower()
@@ -225,7 +1190,7 @@ def search(query, domain=None, max_results=MAX_RESULTS):
     if not filepath.exists():
         return {"error": f"File not found: {filepath}", "domain": domain}
 
-    results = _search_csv(filepath, config["search_cols"], config["output_cols"], query, max_results)
+    results = _search_csv(filepath, config["search_cols"], config["output_cols"], query, max_results, _search_weights(config))
 
     return {
         "domain": domain,
@@ -246,7 +1211,8 @@ def search_stack(query, stack, max_results=MAX_RESULTS):
     if not filepath.exists():
         return {"error": f"Stack file not found: {filepath}", "stack": stack}
 
-    results = _search_csv(filepath, _STACK_COLS["search_cols"], _STACK_COLS["output_cols"], query, max_results)
+    results = _search_csv(filepath, _STACK_COLS["search_cols"], _STACK_COLS["output_cols"], query, max_results,
+                          _search_weights(_STACK_COLS))
 
     return {
         "domain": "stack",
@@ -256,3 +1222,138 @@ def search_stack(query, stack, max_results=MAX_RESULTS):
         "count": len(results),
         "results": results
     }
+
+
+def search_many(queries, domain=None, max_results=MAX_RESULTS):
+    """Batch search: queries sharing a domain are scored against one index load"""
+    queries = list(queries)
+    domains = [domain if domain is not None else detect_domain(query) for query in queries]
+    responses = [None] * len(queries)
+
+    for batch_domain in dict.fromkeys(domains):
+        positions = [i for i, d in enumerate(domains) if d == batch_domain]
+        config = CSV_CONFIG.get(batch_domain, CSV_CONFIG["style"])
+        filepath = DATA_DIR / config["file"]
+
+        if not filepath.exists():
+            for i in positions:
+                responses[i] = {"error": f"File not found: {filepath}", "domain": batch_domain}
+            continue
+
+        batch = _search_csv_many(filepath, config["search_cols"], config["output_cols"],
+                                 [queries[i] for i in positions], max_results, _search_weights(config))
+        for i, results in zip(positions, batch):
+            responses[i] = {
+                "domain": batch_domain,
+                "query": queries[i],
+                "file": config["file"],
+                "count": len(results),
+                "results": results
+            }
+
+    return responses
+
+
+def search_stack_many(queries, stack, max_results=MAX_RESULTS):
+    """Batch variant of search_stack()"""
+    queries = list(queries)
+    if stack not in STACK_CONFIG:
+        return [{"error": f"Unknown stack: {stack}. Available: {', '.join(AVAILABLE_STACKS)}"} for _ in queries]
+
+    filepath = DATA_DIR / STACK_CONFIG[stack]["file"]
+
+    if not filepath.exists():
+        return [{"error": f"Stack file not found: {filepath}", "stack": stack} for _ in queries]
+
+    batch = _search_csv_many(filepath, _STACK_COLS["search_cols"], _STACK_COLS["output_cols"], queries, max_results,
+                             _search_weights(_STACK_COLS))
+
+    return [{
+        "domain": "stack",
+        "stack": stack,
+        "query": query,
+        "file": STACK_CONFIG[stack]["file"],
+        "count": len(results),
+        "results": results
+    } for query, results in zip(queries, batch)]
+
+
+# ============ FEDERATED SEARCH ============
+def _all_corpora(include_stacks=True):
+    """(domain, stack, file, search_cols, output_cols, weights) for every searchable CSV"""
+    corpora = [(domain, None, config["file"], config["search_cols"], config["output_cols"], _search_weights(config))
+               for domain, config in CSV_CONFIG.items()]
+    if include_stacks:
+        stack_weights = _search_weights(_STACK_COLS)
+        corpora += [("stack", stack, config["file"], _STACK_COLS["search_cols"], _STACK_COLS["output_cols"], stack_weights)
+                    for stack, config in STACK_CONFIG.items()]
+    return corpora
+
+
+def _collection_beliefs(tokens, indexes):
+    """CORI collection belief per corpus, min-max normalized to [0, 1].
+
+    A corpus where the query terms are common relative to its size is more
+    likely the topical one (e.g. "glassmorphism" -> styles), which raw or
+    per-corpus-normalized BM25 scores cannot express.
+    """
+    unique = list(dict.fromkeys(tokens))
+    sizes = [sum(bm25.doc_lengths) for bm25 in indexes]
+    avg_size = (sum(sizes) / len(sizes)) or 1
+    corpora = len(indexes)
+    spread = {token: sum(1 for bm25 in indexes if token in bm25.doc_freqs) for token in unique}
+
+    beliefs = []
+    for bm25, size in zip(indexes, sizes):
+        belief = 0.0
+        for token in unique:
+            if not spread[token]:
+                continue
+            df = bm25.doc_freqs.get(token, 0)
+            t = df / (df + 50 + 150 * size / avg_size)
+            i = log((corpora + 0.5) / spread[token]) / log(corpora + 1.0)
+            belief += 0.4 + 0.6 * t * i
+        beliefs.append(belief / len(unique))
+
+    low, high = min(beliefs), max(beliefs)
+    return [(b - low) / (high - low) if high > low else 0.0 for b in beliefs]
+
+
+def search_all(query, max_results=MAX_RESULTS, include_stacks=True):
+    """Score one query against every domain (and stack) index and merge the top hits.
+
+    Raw BM25 scores are not comparable across corpora of different sizes and
+    average lengths. Each hit is first divided by its corpus's max_score()
+    bound for the query, then merged CORI-style with that corpus's collection
+    belief: (d + 0.4 * d * belief) / 1.4, a [0, 1) relevance ranked globally.
+    """
+    tokens = BM25.tokenize(query)
+    corpora = [c for c in _all_corpora(include_stacks) if (DATA_DIR / c[2]).exists()]
+    candidates = []
+
+    if tokens and corpora:
+        indexes = [_get_index(DATA_DIR / filename, search_cols, weights) for _, _, filename, search_cols, _, weights in corpora]
+        expansions = [bm25.expand(tokens) if FUZZY_MATCHING else tokens for _, bm25 in indexes]
+        beliefs = _collection_beliefs(list(dict.fromkeys(t for expanded in expansions for t in expanded)) or tokens,
+                                      [bm25 for _, bm25 in indexes])
+        for order, ((domain, stack, filename, _, output_cols, _), (data, bm25), belief, expanded) in enumerate(zip(corpora, indexes, beliefs, expansions)):
+            bound = bm25.max_score(expanded)
+            for idx, score in bm25.score_tokens(expanded, top_k=max_results):
+                normalized = score / bound
+                merged = (normalized + 0.4 * normalized * belief) / 1.4
+                candidates.append((merged, order, idx, domain, stack, filename, data, output_cols))
+
+    best = heapq.nsmallest(max_results, candidates, key=lambda c: (-c[0], c[1], c[2]))
+    results = []
+    for merged, _, idx, domain, stack, filename, data, output_cols in best:
+        hit = {"domain": domain, "file": filename, "score": round(merged, 4), "result": data.row(idx, output_cols)}
+        if stack:
+            hit["stack"] = stack
+        results.append(hit)
+
+    return {
+        "domain": "all",
+        "query": query,
+        "count": len(results),
+        "results": results
+    }
@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+UI/UX Pro Max Daemon - keeps every domain and stack index warm in memory and
+answers newline-delimited JSON requests over a Unix domain socket or stdin/stdout.
+
+Usage:
+    python search.py --serve                 # Unix socket (see client.socket_path)
+    python search.py --serve --stdio         # one JSON request per stdin line
+
+Request:  {"op": "search", "query": "saas dashboard", "domain": "product", "max_results": 3, "format": "text"}
+Response: {"ok": true, "result": {...}, "text": "..."} or {"ok": false, "error": "..."}
+
+Ops: ping, search, search_stack, search_all, search_many, search_stack_many, design_system, build_index,
+     cache_stats, clear_cache, shutdown
+"""
+
+import json
+import os
+import socket
+import socketserver
+import sys
+
+import core
+from client import socket_path
+
+IDLE_TIMEOUT = 30 * 60  # Seconds without a request before the socket daemon exits
+REQUEST_TIMEOUT = 30  # Seconds a connected client may take to send its request
+
+
+# ============ WARM-UP ============
+def warm_indexes():
+    """Load every domain and stack index into the in-process cache"""
+    for config in core.CSV_CONFIG.values():
+        filepath = core.DATA_DIR / config["file"]
+        if filepath.exists():
+            core._get_index(filepath, config["search_cols"], core._search_weights(config))
+    for config in core.STACK_CONFIG.values():
+        filepath = core.DATA_DIR / config["file"]
+        if filepath.exists():
+            core._get_index(filepath, core._STACK_COLS["search_cols"], core._search_weights(core._STACK_COLS))
+
+
+# ============ REQUEST HANDLING ============
+def handle_request(request):
+    """Dispatch one decoded request; returns the response dict"""
+    if not isinstance(request, dict):
+        return {"ok": False, "error": "Bad request: expected a JSON object"}
+    op = request.get("op", "search")
+    max_results = int(request.get("max_results", core.MAX_RESULTS))
+
+    if op == "ping":
+        return {"ok": True, "result": {"pid": os.getpid()}}
+    if op == "search":
+        result = core.search(request["query"], request.get("domain"), max_results)
+    elif op == "search_stack":
+        result = core.search_stack(request["query"], request["stack"], max_results)
+    elif op == "search_all":
+        result = core.search_all(request["query"], max_results, request.get("include_stacks", True))
+    elif op == "search_many":
+        result = core.search_many(request["queries"], request.get("domain"), max_results)
+    elif op == "search_stack_many":
+        result = core.search_stack_many(request["queries"], request["stack"], max_results)
+    elif op == "design_system":
+        from design_system import generate_design_system
+        text = generate_design_system(request["query"], request.get("project_name"), request.get("format", "ascii"))
+        return {"ok": True, "text": text}
+    elif op == "build_index":
+        result = core.build_indexes(force=bool(request.get("force")))
+    elif op == "cache_stats":
+        result = core.cache_stats()
+    elif op == "clear_cache":
+        core.clear_cache()
+        result = {}
+    elif op == "shutdown":
+        return {"ok": True, "result": {}, "shutdown": True}
+    else:
+        return {"ok": False, "error": f"Unknown op: {op}"}
+
+    response = {"ok": True, "result": result}
+    if request.get("format") == "text" and op in ("search", "search_stack", "search_all"):
+        from search import format_output
+        response["text"] = format_output(result)
+    return response
+
+
+def _respond(line):
+    """Decode a request line (str or UTF-8 bytes) and build the encoded response line"""
+    try:
+        if isinstance(line, bytes):
+            line = line.decode("utf-8")
+        response = handle_request(json.loads(line))
+    except (ValueError, KeyError, TypeError) as e:
+        response = {"ok": False, "error": f"Bad request: {e}"}
+    except Exception as e:  # A failing request must not take the daemon down with it
+        response = {"ok": False, "error": f"{type(e).__name__}: {e}"}
+    return json.dumps(response, ensure_ascii=False) + "\n", response.get("shutdown", False)
+
+
+# ============ TRANSPORTS ============
+def serve_stdio():
+    """Line protocol over stdin/stdout (no socket, works on every platform)"""
+    warm_indexes()
+    for line in sys.stdin:
+        if not line.strip():
+            continue
+        payload, stop = _respond(line)
+        sys.stdout.write(payload)
+        sys.stdout.flush()
+        if stop:
+            break
+
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    """One request line per connection"""
+    timeout = REQUEST_TIMEOUT
+
+    def handle(self):
+        try:
+            line = self.rfile.readline()
+        except socket.timeout:
+            return
+        if not line.strip():
+            return
+        payload, stop = _respond(line)
+        self.wfile.write(payload.encode("utf-8"))
+        if stop:
+            self.server.stopping = True
+
+
+class _DaemonServer(socketserver.UnixStreamServer):
+    """Sequential server that exits after IDLE_TIMEOUT without traffic"""
+    stopping = False
+
+    def handle_timeout(self):
+        self.stopping = True
+
+
+def _socket_in_use(path):
+    """True if another daemon is already answering on this socket path"""
+    probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        probe.connect(path)
+        return True
+    except OSError:
+        return False
+    finally:
+        probe.close()
+
+
+def serve_socket(path=None):
+    """Serve requests on a Unix domain socket until shutdown or idle timeout"""
+    if not hasattr(socket, "AF_UNIX"):
+        raise SystemExit("Unix domain sockets are not available here; use --serve --stdio")
+
+    path = path or socket_path()
+    if os.path.exists(path):
+        if _socket_in_use(path):
+            print(f"Daemon already running on {path}", file=sys.stderr)
+            return
+        os.unlink(path)  # Stale socket from a crashed daemon
+
+    warm_indexes()
+    old_umask = os.umask(0o177)  # Socket is private to the current user
+    try:
+        server = _DaemonServer(path, _RequestHandler)
+    finally:
+        os.umask(old_umask)
+    server.timeout = IDLE_TIMEOUT
+    try:
+        while not server.stopping:
+            server.handle_request()
+    finally:
+        server.server_close()
+        try:
+            os.unlink(path)
+        except OSError:
+            pass
@@ -11,11 +11,17 @@ Usage:
     # With persistence (Master + Overrides pattern)
     result = generate_design_system("SaaS dashboard", "My Project", persist=True)
     result = generate_design_system("SaaS dashboard", "My Project", persist=True, page="dashboard")
+
+    # Scaffold many page overrides in one pass
+    persist_pages(design_system, ["dashboard", "settings", "checkout"])
 """
 
 import csv
+import hashlib
 import json
 import os
+import re
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from core import search, DATA_DIR
@@ -24,14 +30,18 @@ from core import search, DATA_DIR
 # ============ CONFIGURATION ============
 REASONING_FILE = "ui-reasoning.csv"
 
+# Ranking weights each CSV's name column above its prose (CSV_CONFIG "search_weights"), so top-1 is the pick
 SEARCH_CONFIG = {
     "product": {"max_results": 1},
-    "style": {"max_results": 3},
-    "color": {"max_results": 2},
-    "landing": {"max_results": 2},
-    "typography": {"max_results": 2}
+    "style": {"max_results": 1},
+    "color": {"max_results": 1},
+    "landing": {"max_results": 1},
+    "typography": {"max_results": 1}
 }
 
+PAGE_WORKERS = 8  # Page overrides generated concurrently by persist_pages()
+_GENERATED_LINE = re.compile(r"^.*\*\*Generated:\*\*.*$\n?", re.MULTILINE)  # Timestamp, ignored when diffing output
+
 
 # ============ DESIGN SYSTEM GENERATOR ============
 class DesignSystemGenerator:
@@ -39,6 +49,7 @@ class DesignSystemGenerator:
 
     def __init__(self):
         self.reasoning_data = self._load_reasoning()
+        self._build_reasoning_index()
 
     def _load_reasoning(self) -> list:
         """Load reasoning rules from CSV."""
@@ -48,46 +59,78 @@ class DesignSystemGenerator:
         with open(filepath, 'r', encoding='utf-8') as f:
             return list(csv.DictReader(f))
 
-    def _multi_domain_search(self, query: str, style_priority: list = None) -> dict:
-        """Execute searches across multiple domains."""
-        results = {}
+    def _build_reasoning_index(self):
+        """Precompute lookup structures so rule matching never rescans the CSV."""
+        self._rule_categories = []   # Lowercased UI_Category, by rule index
+        self._exact_rules = {}       # UI_Category -> first rule index
+        self._keyword_rules = {}     # UI_Category keyword -> first rule index containing it
+        self._decision_rules = []    # Parsed Decision_Rules JSON, by rule index
+        self._rule_lookup_cache = {}  # Lowercased category -> rule index (or None)
+
+        for idx, rule in enumerate(self.reasoning_data):
+            ui_cat = rule.get("UI_Category", "").lower()
+            self._rule_categories.append(ui_cat)
+            self._exact_rules.setdefault(ui_cat, idx)
+            for keyword in ui_cat.replace("/", " ").replace("-", " ").split():
+                self._keyword_rules.setdefault(keyword, idx)
+
+            try:
+                self._decision_rules.append(json.loads(rule.get("Decision_Rules", "{}")))
+            except json.JSONDecodeError:
+                self._decision_rules.append({})
+
+    def _multi_domain_search(self, query: str, style_priority: list = None, product_result: dict = None) -> dict:
+        """Execute searches across multiple domains concurrently (merged in SEARCH_CONFIG order)."""
+        jobs = {}
         for domain, config in SEARCH_CONFIG.items():
+            if domain == "product" and product_result is not None:
+                continue  # Already searched by generate()
             if domain == "style" and style_priority:
-                # For style, also search with priority keywords
-                priority_query = " ".join(style_priority[:2]) if style_priority else query
-                combined_query = f"{query} {priority_query}"
-                results[domain] = search(combined_query, domain, config["max_results"])
+                # For style, also search with the lead priority style (its name column outranks keyword matches)
+                priority_query = style_priority[0]
+                jobs[domain] = (f"{query} {priority_query}", config["max_results"])
             else:
-                results[domain] = search(query, domain, config["max_results"])
+                jobs[domain] = (query, config["max_results"])
+
+        with ThreadPoolExecutor(max_workers=len(jobs)) as pool:
+            futures = {domain: pool.submit(search, q, domain, n) for domain, (q, n) in jobs.items()}
+
+        results = {}
+        for domain in SEARCH_CONFIG:
+            results[domain] = futures[domain].result() if domain in futures else product_result
         return results
 
-    def _find_reasoning_rule(self, category: str) -> dict:
-        """Find matching reasoning rule for a category."""
+    def _find_reasoning_index(self, category: str):
+        """Find the index of the matching reasoning rule for a category (memoized)."""
         category_lower = category.lower()
+        if category_lower in self._rule_lookup_cache:
+            return self._rule_lookup_cache[category_lower]
 
         # Try exact match first
-        for rule in self.reasoning_data:
-            if rule.get("UI_Category", "").lower() == category_lower:
-                return rule
+        idx = self._exact_rules.get(category_lower)
 
         # Try partial match
-        for rule in self.reasoning_data:
-            ui_cat = rule.get("UI_Category", "").lower()
-            if ui_cat in category_lower or category_lower in ui_cat:
-                return rule
+        if idx is None:
+            idx = next((i for i, ui_cat in enumerate(self._rule_categories)
+                        if ui_cat in category_lower or category_lower in ui_cat), None)
 
-        # Try keyword match
-        for rule in self.reasoning_data:
-            ui_cat = rule.get("UI_Category", "").lower()
-            keywords = ui_cat.replace("/", " ").replace("-", " ").split()
-            if any(kw in category_lower for kw in keywords):
-                return rule
+        # Try keyword match: earliest rule owning any keyword found in the category
+        if idx is None:
+            matches = [first for keyword, first in self._keyword_rules.items() if keyword in category_lower]
+            idx = min(matches) if matches else None
 
-        return {}
+        self._rule_lookup_cache[category_lower] = idx
+        return idx
+
+    def _find_reasoning_rule(self, category: str) -> dict:
+        """Find matching reasoning rule for a category."""
+        idx = self._find_reasoning_index(category)
+        return self.reasoning_data[idx] if idx is not None else {}
 
     def _apply_reasoning(self, category: str, search_results: dict) -> dict:
         """Apply reasoning rules to search results."""
-        rule = self._find_reasoning_rule(category)
+        idx = self._find_reasoning_index(category)
+        rule = self.reasoning_data[idx] if idx is not None else {}
 
         if not rule:
             return {
@@ -101,12 +144,8 @@ class DesignSystemGenerator:
                 "severity": "MEDIUM"
             }
 
-        # Parse decision rules JSON
-        decision_rules = {}
-        try:
-            decision_rules = json.loads(rule.get("Decision_Rules", "{}"))
-        except json.JSONDecodeError:
-            pass
+        # Decision rules JSON was parsed once in _build_reasoning_index
+        decision_rules = dict(self._decision_rules[idx])
 
         return {
             "pattern": rule.get("Recommended_Pattern", ""),
@@ -119,43 +158,6 @@ class DesignSystemGenerator:
             "severity": rule.get("Severity", "MEDIUM")
         }
 
-    def _select_best_match(self, results: list, priority_keywords: list) -> dict:
-        """Select best matching result based on priority keywords."""
-        if not results:
-            return {}
-
-        if not priority_keywords:
-            return results[0]
-
-        # First: try exact style name match
-        for priority in priority_keywords:
-            priority_lower = priority.lower().strip()
-            for result in results:
-                style_name = result.get("Style Category", "").lower()
-                if priority_lower in style_name or style_name in priority_lower:
-                    return result
-
-        # Second: score by keyword match in all fields
-        scored = []
-        for result in results:
-            result_str = str(result).lower()
-            score = 0
-            for kw in priority_keywords:
-                kw_lower = kw.lower().strip()
-                # Higher score for style name match
-                if kw_lower in result.get("Style Category", "").lower():
-                    score += 10
-                # Lower score for keyword field match
-                elif kw_lower in result.get("Keywords", "").lower():
-                    score += 3
-                # Even lower for other field matches
-                elif kw_lower in result_str:
-                    score += 1
-            scored.append((score, result))
-
-        scored.sort(key=lambda x: x[0], reverse=True)
-        return scored[0][1] if scored and scored[0][0] > 0 else results[0]
-
     def _extract_results(self, search_result: dict) -> list:
         """Extract results list from search result dict."""
         return search_result.get("results", [])
@@ -174,16 +176,15 @@ class DesignSystemGenerator:
         style_priority = reasoning.get("style_priority", [])
 
         # Step 3: Multi-domain search with style priority hints
-        search_results = self._multi_domain_search(query, style_priority)
-        search_results["product"] = product_result  # Reuse product search
+        search_results = self._multi_domain_search(query, style_priority, product_result)
 
-        # Step 4: Select best matches from each domain using priority
+        # Step 4: Take the top hit from each domain (the style query already carries the priority)
         style_results = self._extract_results(search_results.get("style", {}))
         color_results = self._extract_results(search_results.get("color", {}))
         typography_results = self._extract_results(search_results.get("typography", {}))
         landing_results = self._extract_results(search_results.get("landing", {}))
 
-        best_style = self._select_best_match(style_results, reasoning.get("style_priority", []))
+        best_style = style_results[0] if style_results else {}
         best_color = color_results[0] if color_results else {}
         best_typography = typography_results[0] if typography_results else {}
         best_landing = landing_results[0] if landing_results else {}
@@ -460,7 +461,8 @@ def format_markdown(design_system: dict) -> str:
 
 # ============ MAIN ENTRY POINT ============
 def generate_design_system(query: str, project_name: str = None, output_format: str = "ascii", 
-                           persist: bool = False, page: str = None, output_dir: str = None) -> str:
+                           persist: bool = False, page: str = None, output_dir: str = None,
+                           pages: list = None) -> str:
     """
     Main entry point for design system generation.
 
@@ -471,6 +473,7 @@ def generate_design_system(query: str, project_name: str = None, output_format:
         persist: If True, save design system to design-system/ folder
         page: Optional page name for page-specific override file
         output_dir: Optional output directory (defaults to current working directory)
+        pages: Optional list of page names; all overrides are generated in one pass
 
     Returns:
         Formatted design system string
@@ -480,7 +483,10 @@ def generate_design_system(query: str, project_name: str = None, output_format:
     
     # Persist to files if requested
     if persist:
-        persist_design_system(design_system, page, output_dir, query)
+        if pages:
+            persist_pages(design_system, ([page] if page else []) + list(pages), output_dir, query)
+        else:
+            persist_design_system(design_system, page, output_dir, query)
 
     if output_format == "markdown":
         return format_markdown(design_system)
@@ -488,6 +494,45 @@ def generate_design_system(query: str, project_name: str = None, output_format:
 
 
 # ============ PERSISTENCE FUNCTIONS ============
+def _design_system_dir(design_system: dict, output_dir: str = None) -> Path:
+    """design-system/<project-slug>/ under output_dir (or the current directory)"""
+    base_dir = Path(output_dir) if output_dir else Path.cwd()
+    project_slug = design_system.get("project_name", "default").lower().replace(' ', '-')
+    return base_dir / "design-system" / project_slug
+
+
+def _page_slug(page: str) -> str:
+    """File name stem for a page override"""
+    return page.lower().replace(' ', '-')
+
+
+def _content_hash(content: str) -> str:
+    """SHA-256 of generated Markdown, ignoring the **Generated:** timestamp line"""
+    return hashlib.sha256(_GENERATED_LINE.sub("", content).encode("utf-8")).hexdigest()
+
+
+def _write_if_changed(path: Path, content: str) -> bool:
+    """Atomically write content (temp file + rename) unless the file already holds it; True if written"""
+    try:
+        if _content_hash(path.read_text(encoding='utf-8')) == _content_hash(content):
+            return False
+    except (OSError, UnicodeDecodeError):
+        pass  # Missing or unreadable: write it
+
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    try:
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(content)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+    return True
+
+
 def persist_design_system(design_system: dict, page: str = None, output_dir: str = None, page_query: str = None) -> dict:
     """
     Persist design system to design-system/<project>/ folder using Master + Overrides pattern.
@@ -501,41 +546,59 @@ def persist_design_system(design_system: dict, page: str = None, output_dir: str
     Returns:
         dict with created file paths and status
     """
-    base_dir = Path(output_dir) if output_dir else Path.cwd()
-    
-    # Use project name for project-specific folder
-    project_name = design_system.get("project_name", "default")
-    project_slug = project_name.lower().replace(' ', '-')
-    
-    design_system_dir = base_dir / "design-system" / project_slug
+    return persist_pages(design_system, [page] if page else [], output_dir, page_query)
+
+
+def persist_pages(design_system: dict, pages, output_dir: str = None, page_query: str = None,
+                  max_workers: int = PAGE_WORKERS) -> dict:
+    """
+    Persist MASTER.md plus one override file per page, generating the overrides concurrently.
+
+    Every page override runs its own searches (style, ux, landing); the worker
+    threads share the process-wide index cache, so each index is loaded once.
+    Files are written atomically and left untouched when only their
+    **Generated:** timestamp would change.
+
+    Args:
+        design_system: The generated design system dictionary
+        pages: Page names, or a {page name: page query} dict for per-page queries
+        output_dir: Optional output directory (defaults to current working directory)
+        page_query: Query used for pages without their own (e.g. the design system query)
+        max_workers: Upper bound on concurrent page generations
+
+    Returns:
+        dict with status, the design-system directory, every persisted file
+        (created_files) and the subset whose content was already current (unchanged_files)
+    """
+    queries = dict(pages) if isinstance(pages, dict) else {page: page_query for page in pages}
+    slugs = {}
+    for page, query in queries.items():
+        slugs.setdefault(_page_slug(page), (page, query if query is not None else page_query))
+
+    design_system_dir = _design_system_dir(design_system, output_dir)
     pages_dir = design_system_dir / "pages"
-    
-    created_files = []
-    
-    # Create directories
     design_system_dir.mkdir(parents=True, exist_ok=True)
     pages_dir.mkdir(parents=True, exist_ok=True)
-    
-    master_file = design_system_dir / "MASTER.md"
-    
-    # Generate and write MASTER.md
-    master_content = format_master_md(design_system)
-    with open(master_file, 'w', encoding='utf-8') as f:
-        f.write(master_content)
-    created_files.append(str(master_file))
-    
-    # If page is specified, create page override file with intelligent content
-    if page:
-        page_file = pages_dir / f"{page.lower().replace(' ', '-')}.md"
-        page_content = format_page_override_md(design_system, page, page_query)
-        with open(page_file, 'w', encoding='utf-8') as f:
-            f.write(page_content)
-        created_files.append(str(page_file))
-    
+
+    targets = [(design_system_dir / "MASTER.md", lambda: format_master_md(design_system))]
+    targets += [(pages_dir / f"{slug}.md", lambda page=page, query=query: format_page_override_md(design_system, page, query))
+                for slug, (page, query) in slugs.items()]
+
+    def render_and_write(target):
+        path, render = target
+        return str(path), _write_if_changed(path, render())
+
+    if len(targets) > 2 and max_workers > 1:
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(targets))) as pool:
+            written = list(pool.map(render_and_write, targets))
+    else:
+        written = [render_and_write(target) for target in targets]
+
     return {
         "status": "success",
         "design_system_dir": str(design_system_dir),
-        "created_files": created_files
+        "created_files": [path for path, _ in written],
+        "unchanged_files": [path for path, changed in written if not changed]
     }
 
 
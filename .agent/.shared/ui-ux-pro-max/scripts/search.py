@@ -5,6 +5,12 @@ UI/UX Pro Max Search - BM25 search engine for UI/UX style guides
 Usage: python search.py "<query>" [--domain <domain>] [--stack <stack>] [--max-results 3]
        python search.py "<query>" --design-system [-p "Project Name"]
        python search.py "<query>" --design-system --persist [-p "Project Name"] [--page "dashboard"]
+       python search.py "<query>" --design-system --persist [-p "Project Name"] --pages "dashboard,settings,checkout"
+       python search.py "<query>" --all [--no-stacks]
+       python search.py --batch queries.txt [--domain <domain> | --stack <stack>] [--jsonl]
+       python search.py "<query>" --jsonl
+       python search.py --build-index [--force]
+       python search.py --serve [--stdio | --socket PATH]   (query it with client.py)
 
 Domains: style, prompt, color, chart, landing, product, ux, typography
 Stacks: html-tailwind, react, nextjs
@@ -12,11 +18,33 @@ Stacks: html-tailwind, react, nextjs
 Persistence (Master + Overrides pattern):
   --persist    Save design system to design-system/MASTER.md
   --page       Also create a page-specific override file in design-system/pages/
+  --pages      Comma-separated list: every page override in one pass (unchanged files are not rewritten)
+
+Federated search:
+  --all          Search every domain and stack at once; hits are ranked on normalized scores
+
+Fuzzy matching:
+  Unknown query words are expanded to close index terms ("glassmorph", "neumorphic", "dashbord");
+  --no-fuzzy     Match exact tokens only
+
+Batch mode:
+  --batch FILE   Read newline-delimited queries from FILE ("-" for stdin), emit one JSON line per query
+  --jsonl        Stream one compact JSON line per ranked hit (flushed per query; pairs with --batch)
+
+Prebuilt index:
+  --build-index  Prebuild data/.index/ for every domain and stack (stale entries only, --force for all)
+  UIPRO_INDEX_FORMAT=binary  Memory-mapped indexes shared by concurrent processes (see binindex.py)
+
+Daemon:
+  --serve        Keep all indexes warm and answer JSON requests (see daemon.py / client.py)
 """
 
 import argparse
-from core import CSV_CONFIG, AVAILABLE_STACKS, MAX_RESULTS, search, search_stack
-from design_system import generate_design_system, persist_design_system
+import os
+import sys
+from itertools import islice
+from core import CSV_CONFIG, AVAILABLE_STACKS, MAX_RESULTS, search, search_stack, search_many, search_stack_many, search_all, build_indexes
+# design_system and daemon are imported by their subcommands: plain searches should only pay for core
 
 
 def format_output(result):
@@ -24,6 +52,9 @@ def format_output(result):
     if "error" in result:
         return f"Error: {result['error']}"
 
+    if result.get("domain") == "all":
+        return format_federated(result)
+
     output = []
     if result.get("stack"):
         output.append(f"## UI Pro Max Stack Guidelines")
@@ -45,13 +76,96 @@ def format_output(result):
     return "\n".join(output)
 
 
+def format_federated(result):
+    """Format search_all() results, tagging each hit with its source"""
+    output = [f"## UI Pro Max Federated Results"]
+    output.append(f"**Query:** {result['query']} | **Found:** {result['count']} results\n")
+
+    for i, hit in enumerate(result['results'], 1):
+        source = f"{hit['domain']}/{hit['stack']}" if hit.get("stack") else hit['domain']
+        output.append(f"### Result {i} ({source}, score {hit['score']})")
+        for key, value in hit['result'].items():
+            value_str = str(value)
+            if len(value_str) > 300:
+                value_str = value_str[:300] + "..."
+            output.append(f"- **{key}:** {value_str}")
+        output.append("")
+
+    return "\n".join(output)
+
+
+BATCH_CHUNK = 64  # Queries ranked per search_many() call; bounds memory while streaming
+
+
+def iter_batch(path):
+    """Yield newline-delimited queries lazily, skipping blank lines"""
+    f = sys.stdin if path == "-" else open(path, 'r', encoding='utf-8')
+    try:
+        for line in f:
+            line = line.strip()
+            if line:
+                yield line
+    finally:
+        if f is not sys.stdin:
+            f.close()
+
+
+def iter_batch_results(queries, domain=None, stack=None, max_results=MAX_RESULTS):
+    """Rank queries chunk by chunk so results stream out while input is still being read"""
+    queries = iter(queries)
+    while True:
+        chunk = list(islice(queries, BATCH_CHUNK))
+        if not chunk:
+            return
+        if stack:
+            yield from search_stack_many(chunk, stack, max_results)
+        else:
+            yield from search_many(chunk, domain, max_results)
+
+
+def iter_hits(result):
+    """Flatten a search result into one record per ranked hit"""
+    if "error" in result:
+        yield {"query": result.get("query"), "error": result["error"]}
+        return
+    for rank, row in enumerate(result["results"], 1):
+        if result.get("domain") == "all":
+            yield {"query": result["query"], "rank": rank, **row}
+            continue
+        hit = {"query": result["query"], "rank": rank, "domain": result["domain"]}
+        if result.get("stack"):
+            hit["stack"] = result["stack"]
+        hit["file"] = result["file"]
+        hit["result"] = row
+        yield hit
+
+
+def stream_jsonl(results, per_hit=False):
+    """Write each result (or each of its hits) as a compact JSON line, flushing per result"""
+    import json
+    try:
+        for result in results:
+            for record in (iter_hits(result) if per_hit else (result,)):
+                sys.stdout.write(json.dumps(record, ensure_ascii=False, separators=(",", ":")) + "\n")
+            sys.stdout.flush()
+    except BrokenPipeError:
+        # Consumer (head, jq ...) went away: silence the flush at interpreter exit
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+        sys.exit(1)
+
+
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="UI Pro Max Search")
-    parser.add_argument("query", help="Search query")
+    parser.add_argument("query", nargs="?", help="Search query")
     parser.add_argument("--domain", "-d", choices=list(CSV_CONFIG.keys()), help="Search domain")
     parser.add_argument("--stack", "-s", choices=AVAILABLE_STACKS, help="Stack-specific search (html-tailwind, react, nextjs)")
     parser.add_argument("--max-results", "-n", type=int, default=MAX_RESULTS, help="Max results (default: 3)")
     parser.add_argument("--json", action="store_true", help="Output as JSON")
+    parser.add_argument("--all", action="store_true", help="Federated search across every domain and stack")
+    parser.add_argument("--no-stacks", action="store_true", help="With --all, only search the domain CSVs")
+    parser.add_argument("--batch", type=str, default=None, metavar="FILE", help="Newline-delimited queries to run in one pass (JSONL output, '-' for stdin)")
+    parser.add_argument("--jsonl", action="store_true", help="Stream one compact JSON line per hit as results are ranked")
+    parser.add_argument("--no-fuzzy", action="store_true", help="Exact tokens only (no prefix/typo expansion of unknown words)")
     # Design system generation
     parser.add_argument("--design-system", "-ds", action="store_true", help="Generate complete design system recommendation")
     parser.add_argument("--project-name", "-p", type=str, default=None, help="Project name for design system output")
@@ -59,19 +173,48 @@ if __name__ == "__main__":
     # Persistence (Master + Overrides pattern)
     parser.add_argument("--persist", action="store_true", help="Save design system to design-system/MASTER.md (creates hierarchical structure)")
     parser.add_argument("--page", type=str, default=None, help="Create page-specific override file in design-system/pages/")
+    parser.add_argument("--pages", type=str, default=None, help="Comma-separated pages: create every override in one concurrent pass")
     parser.add_argument("--output-dir", "-o", type=str, default=None, help="Output directory for persisted files (default: current directory)")
+    # Prebuilt index
+    parser.add_argument("--build-index", action="store_true", help="Prebuild the on-disk BM25 index for every domain and stack")
+    parser.add_argument("--force", action="store_true", help="With --build-index, rebuild even if the index is fresh")
+    # Daemon
+    parser.add_argument("--serve", action="store_true", help="Run the warm-index search daemon")
+    parser.add_argument("--stdio", action="store_true", help="With --serve, speak the line protocol on stdin/stdout")
+    parser.add_argument("--socket", type=str, default=None, help="With --serve, Unix socket path (default: per-user path in $XDG_RUNTIME_DIR or /tmp)")
 
     args = parser.parse_args()
 
+    if args.no_fuzzy:
+        import core
+        core.FUZZY_MATCHING = False
+
+    if args.serve:
+        from daemon import serve_socket, serve_stdio
+        if args.stdio:
+            serve_stdio()
+        else:
+            serve_socket(args.socket)
+    elif args.build_index:
+        for entry in build_indexes(force=args.force):
+            detail = f" ({entry['documents']} docs)" if "documents" in entry else ""
+            print(f"{entry['status']:>7}  {entry['file']}{detail}")
+    elif args.batch:
+        stream_jsonl(iter_batch_results(iter_batch(args.batch), args.domain, args.stack, args.max_results), per_hit=args.jsonl)
+    elif args.query is None:
+        parser.error("the following arguments are required: query")
     # Design system takes priority
-    if args.design_system:
+    elif args.design_system:
+        from design_system import generate_design_system
+        pages = [p.strip() for p in args.pages.split(",") if p.strip()] if args.pages else []
         result = generate_design_system(
             args.query, 
             args.project_name, 
             args.format,
             persist=args.persist,
             page=args.page,
-            output_dir=args.output_dir
+            output_dir=args.output_dir,
+            pages=pages
         )
         print(result)
         
@@ -81,25 +224,24 @@ if __name__ == "__main__":
             print("\n" + "=" * 60)
             print(f"✅ Design system persisted to design-system/{project_slug}/")
             print(f"   📄 design-system/{project_slug}/MASTER.md (Global Source of Truth)")
-            if args.page:
-                page_filename = args.page.lower().replace(' ', '-')
+            for page in dict.fromkeys(([args.page] if args.page else []) + pages):
+                page_filename = page.lower().replace(' ', '-')
                 print(f"   📄 design-system/{project_slug}/pages/{page_filename}.md (Page Overrides)")
             print("")
             print(f"📖 Usage: When building a page, check design-system/{project_slug}/pages/[page].md first.")
             print(f"   If exists, its rules override MASTER.md. Otherwise, use MASTER.md.")
             print("=" * 60)
-    # Stack search
-    elif args.stack:
-        result = search_stack(args.query, args.stack, args.max_results)
-        if args.json:
-            import json
-            print(json.dumps(result, indent=2, ensure_ascii=False))
-        else:
-            print(format_output(result))
-    # Domain search
     else:
-        result = search(args.query, args.domain, args.max_results)
-        if args.json:
+        if args.all:  # Federated search
+            result = search_all(args.query, args.max_results, include_stacks=not args.no_stacks)
+        elif args.stack:  # Stack search
+            result = search_stack(args.query, args.stack, args.max_results)
+        else:  # Domain search
+            result = search(args.query, args.domain, args.max_results)
+
+        if args.jsonl:
+            stream_jsonl([result], per_hit=True)
+        elif args.json:
             import json
             print(json.dumps(result, indent=2, ensure_ascii=False))
         else:
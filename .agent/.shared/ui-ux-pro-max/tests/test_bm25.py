@@ -0,0 +1,38 @@
+"""Regression tests for the ui-ux-pro-max BM25 search (run with pytest)"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
+
+import core  # noqa: E402
+from core import BM25  # noqa: E402
+
+
+def test_fit_corpus_without_indexable_tokens():
+    bm25 = BM25()
+    bm25.fit(["a b", "-- ..", ""])
+    assert bm25.avgdl == 0
+    assert bm25.norms == [bm25.k1 * (1 - bm25.b)] * 3
+    assert bm25.score("a b") == []
+    assert bm25.score("anything") == []
+
+
+def test_weighted_corpus_without_indexable_tokens_then_add():
+    bm25 = BM25(field_weights=[2, 1])
+    bm25.fit([("", ""), ("ab", "--")])
+    assert bm25.score("style") == []
+
+    bm25.add_documents([("style", "")])
+    assert [doc for doc, _ in bm25.score("style")] == [2]
+
+    bm25.remove_documents([2])
+    assert bm25.score("style") == []
+
+
+def test_search_csv_with_empty_search_columns(tmp_path, monkeypatch):
+    monkeypatch.setattr(core, "INDEX_DIR", tmp_path / ".index")
+    csv_file = tmp_path / "empty.csv"
+    csv_file.write_text("Name,Keywords\n,\nab,--\n", encoding="utf-8")
+
+    assert core._search_csv(csv_file, ["Name", "Keywords"], ["Name"], "glassmorphism", 3) == []
@@ -0,0 +1,26 @@
+"""Tests for the ui-ux-pro-max daemon request handling (run with pytest)"""
+
+import json
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
+
+from daemon import _respond  # noqa: E402
+
+
+def reply(line):
+    payload, stop = _respond(line)
+    assert not stop
+    return json.loads(payload)
+
+
+def test_malformed_requests_get_an_error_response():
+    for line in ('[1]\n', '"search"\n', 'not json\n', b'\xff\xfe\n', '{"op": "search"}\n',
+                 '{"op": "search", "query": 5}\n', '{"op": "search", "query": "x", "max_results": "x"}\n'):
+        response = reply(line)
+        assert response["ok"] is False and response["error"]
+
+
+def test_ping_still_answers():
+    assert reply('{"op": "ping"}\n')["ok"] is True
@@ -0,0 +1,14 @@
+"""Startup budget of a plain search.py run (run with pytest)"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
+
+from bench import STARTUP_FORBIDDEN, check_startup, startup_violations  # noqa: E402
+
+
+def test_plain_search_stays_within_startup_budget():
+    startup = check_startup()
+    assert startup["forbidden"] == [], f"plain search imports {startup['forbidden']} (forbidden: {STARTUP_FORBIDDEN})"
+    assert startup_violations(startup) == []
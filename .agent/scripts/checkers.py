@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Checker Plugins - Antigravity Kit
+=================================
+
+Runs the Python checkers of checklist.py and verify_all.py in-process.
+
+A checker script opts in by defining:
+
+    def run(project_path: Path, context: dict) -> dict
+
+which audits without printing or exiting and returns a JSON-serializable
+report with at least "passed" (bool) and "summary" (one line). The
+orchestrator imports the script once and calls run() directly, so a check
+pays no interpreter startup or re-imports, and `context` carries state
+shared by every checker of the run (e.g. "url").
+
+Scripts without run(), and SUBPROCESS_SCRIPTS (thin wrappers around npm,
+tsc, lighthouse and playwright), still run as `python <script>`.
+"""
+
+import importlib.util
+import json
+import threading
+import traceback
+from pathlib import Path
+
+# External-tool wrappers keep their subprocess isolation
+SUBPROCESS_SCRIPTS = {"lint_runner.py", "test_runner.py", "lighthouse_audit.py", "playwright_runner.py"}
+
+_modules = {}
+_modules_lock = threading.Lock()  # verify_all.py loads checkers from several worker threads
+
+
+def load_checker(script_path: Path):
+    """Imported checker module exposing run(), or None to run the script as a subprocess"""
+    script_path = Path(script_path).resolve()
+    if script_path.name in SUBPROCESS_SCRIPTS or not script_path.is_file():
+        return None
+
+    with _modules_lock:
+        if script_path not in _modules:
+            spec = importlib.util.spec_from_file_location(f"checker_{script_path.stem}", script_path)
+            module = importlib.util.module_from_spec(spec)
+            try:
+                spec.loader.exec_module(module)
+            except (Exception, SystemExit):
+                module = None  # e.g. a missing optional dependency: the subprocess path reports it
+            _modules[script_path] = module if callable(getattr(module, "run", None)) else None
+        return _modules[script_path]
+
+
+def run_checker(checker, name: str, project_path: Path, context: dict = None) -> dict:
+    """Call a checker's run() and shape its report like a subprocess result"""
+    try:
+        report = checker.run(Path(project_path), context if context is not None else {})
+    except Exception:
+        return {"name": name, "passed": False, "output": "", "error": traceback.format_exc(), "skipped": False}
+
+    passed = bool(report.get("passed"))
+    return {
+        "name": name,
+        "passed": passed,
+        "output": json.dumps(report, indent=2, default=str),
+        "error": "" if passed else report.get("summary", ""),
+        "skipped": False,
+        "report": report
+    }
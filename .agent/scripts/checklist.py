@@ -9,6 +9,7 @@ Use this for incremental validation during development.
 Usage:
     python scripts/checklist.py .                    # Run core checks
     python scripts/checklist.py . --url <URL>        # Include performance checks
+    python scripts/checklist.py . --since HEAD       # Re-audit only files changed since a git ref (pre-commit hook)
 
 Priority Order:
     P0: Security Scan (vulnerabilities, secrets)
@@ -18,6 +19,17 @@ Priority Order:
     P4: UX Audit (psychology laws, accessibility)
     P5: SEO Check (meta tags, structure)
     P6: Performance (lighthouse - requires URL)
+
+Python checkers that define run() (see checkers.py) execute in-process and
+share one walk of the project (see inventory.py) and one cache of decoded
+file contents (see content_cache.py); external-tool wrappers still run as a
+subprocess.
+
+Per-file results are kept in .agent/.cache/check_results.json (see
+result_store.py): a file whose content and checker are both unchanged is not
+audited again. --since GIT_REF goes further and trusts the stored result of
+every file git reports unchanged, without hashing it; reports still cover the
+whole project. --no-cache ignores the store for one run.
 """
 
 import sys
@@ -26,6 +38,11 @@ import argparse
 from pathlib import Path
 from typing import List, Tuple, Optional
 
+from checkers import load_checker, run_checker
+from content_cache import ContentCache
+from inventory import FileInventory
+from result_store import ResultStore
+
 # ANSI colors for terminal output
 class Colors:
     HEADER = '\033[95m'
@@ -73,7 +90,8 @@ def check_script_exists(script_path: Path) -> bool:
     """Check if script file exists"""
     return script_path.exists() and script_path.is_file()
 
-def run_script(name: str, script_path: Path, project_path: str, url: Optional[str] = None) -> dict:
+def run_script(name: str, script_path: Path, project_path: str, url: Optional[str] = None,
+               context: Optional[dict] = None) -> dict:
     """
     Run a validation script and capture results
     
@@ -86,6 +104,18 @@ def run_script(name: str, script_path: Path, project_path: str, url: Optional[st
     
     print_step(f"Running: {name}")
     
+    # In-process checker plugin
+    checker = load_checker(script_path)
+    if checker is not None:
+        result = run_checker(checker, name, Path(project_path), dict(context or {}, url=url))
+        if result["passed"]:
+            print_success(f"{name}: PASSED")
+        else:
+            print_error(f"{name}: FAILED")
+            if result["error"]:
+                print(f"  Error: {result['error'][:200]}")
+        return result
+    
     # Build command
     cmd = ["python", str(script_path), project_path]
     if url and ("lighthouse" in script_path.name.lower() or "playwright" in script_path.name.lower()):
@@ -125,6 +155,20 @@ def run_script(name: str, script_path: Path, project_path: str, url: Optional[st
         print_error(f"{name}: ERROR - {str(e)}")
         return {"name": name, "passed": False, "output": "", "error": str(e), "skipped": False}
 
+def changed_files(project_path: Path, ref: str) -> List[str]:
+    """Project-relative paths changed since a git ref: committed, staged, unstaged or untracked"""
+    commands = [
+        ["git", "diff", "--name-only", "--relative", "-z", ref, "--"],
+        ["git", "ls-files", "--others", "--exclude-standard", "-z"],
+    ]
+    changed = set()
+    for cmd in commands:
+        result = subprocess.run(cmd, cwd=project_path, capture_output=True, text=True)
+        if result.returncode != 0:
+            raise ValueError(result.stderr.strip() or f"{' '.join(cmd)} failed")
+        changed.update(name for name in result.stdout.split("\0") if name)
+    return sorted(changed)
+
 def print_summary(results: List[dict]):
     """Print final summary report"""
     print_header("📊 CHECKLIST SUMMARY")
@@ -159,6 +203,34 @@ def print_summary(results: List[dict]):
         print_success("All checks PASSED ✨")
         return True
 
+def run_checks(project_path: Path, args, context: dict) -> bool:
+    """Run core (and, with a URL, performance) checks; True if all passed"""
+    results = []
+    
+    # Run core checks
+    print_header("📋 CORE CHECKS")
+    for name, script_path, required in CORE_CHECKS:
+        script = project_path / script_path
+        result = run_script(name, script, str(project_path), context=context)
+        results.append(result)
+        
+        # If required check fails, stop
+        if required and not result["passed"] and not result.get("skipped"):
+            print_error(f"CRITICAL: {name} failed. Stopping checklist.")
+            print_summary(results)
+            return False
+    
+    # Run performance checks if URL provided
+    if args.url and not args.skip_performance:
+        print_header("⚡ PERFORMANCE CHECKS")
+        for name, script_path, required in PERFORMANCE_CHECKS:
+            script = project_path / script_path
+            result = run_script(name, script, str(project_path), args.url, context)
+            results.append(result)
+    
+    # Print summary
+    return print_summary(results)
+
 def main():
     parser = argparse.ArgumentParser(
         description="Run Antigravity Kit validation checklist",
@@ -167,11 +239,15 @@ def main():
 Examples:
   python scripts/checklist.py .                      # Core checks only
   python scripts/checklist.py . --url http://localhost:3000  # Include performance
+  python scripts/checklist.py . --since HEAD         # Re-audit uncommitted changes only (pre-commit hook)
+  python scripts/checklist.py . --since origin/main  # Re-audit everything changed on this branch
         """
     )
     parser.add_argument("project", help="Project path to validate")
     parser.add_argument("--url", help="URL for performance checks (lighthouse, playwright)")
     parser.add_argument("--skip-performance", action="store_true", help="Skip performance checks even if URL provided")
+    parser.add_argument("--since", metavar="GIT_REF", help="Reuse stored results for files unchanged since this git ref")
+    parser.add_argument("--no-cache", action="store_true", help="Re-audit every file instead of reusing stored results")
     
     args = parser.parse_args()
     
@@ -185,31 +261,24 @@ Examples:
     print(f"Project: {project_path}")
     print(f"URL: {args.url if args.url else 'Not provided (performance checks skipped)'}")
     
-    results = []
-    
-    # Run core checks
-    print_header("📋 CORE CHECKS")
-    for name, script_path, required in CORE_CHECKS:
-        script = project_path / script_path
-        result = run_script(name, script, str(project_path))
-        results.append(result)
-        
-        # If required check fails, stop
-        if required and not result["passed"] and not result.get("skipped"):
-            print_error(f"CRITICAL: {name} failed. Stopping checklist.")
-            print_summary(results)
+    # Shared by every in-process checker of this run
+    inventory = FileInventory(project_path)
+    changed = None
+    if args.since:
+        try:
+            changed = changed_files(project_path, args.since)
+        except (ValueError, OSError) as e:
+            print_error(f"--since {args.since}: {e}")
             sys.exit(1)
+        print(f"Since: {args.since} ({len(changed)} changed files)")
+    store = None if args.no_cache else ResultStore(project_path, inventory, changed=changed)
+    context = {"inventory": inventory, "contents": ContentCache(inventory=inventory), "store": store}
     
-    # Run performance checks if URL provided
-    if args.url and not args.skip_performance:
-        print_header("⚡ PERFORMANCE CHECKS")
-        for name, script_path, required in PERFORMANCE_CHECKS:
-            script = project_path / script_path
-            result = run_script(name, script, str(project_path), args.url)
-            results.append(result)
-    
-    # Print summary
-    all_passed = print_summary(results)
+    try:
+        all_passed = run_checks(project_path, args, context)
+    finally:
+        if store is not None:
+            store.save()
     
     sys.exit(0 if all_passed else 1)
 
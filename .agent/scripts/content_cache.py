@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+Content Cache - Antigravity Kit
+===============================
+
+Decoded file text shared by every checker of a checklist.py / verify_all.py
+run, so a page component is read and decoded once instead of once per checker.
+
+- read_text(path, errors=...) behaves like Path.read_text (UTF-8, universal
+  newlines). A file that decodes cleanly is stored once and serves every
+  `errors` mode; an invalid one is cached per mode.
+- read_lower() returns a cached lower-cased copy of the same text.
+- Entries are evicted least-recently-used once their total size passes the
+  memory budget. Text larger than the whole budget is returned uncached.
+- Files of MMAP_THRESHOLD bytes or more are decoded straight from a memory
+  map, skipping the intermediate bytes copy of a regular read.
+
+The cache lives for one run and assumes files do not change during it.
+Checkers get it as context["contents"]; standalone they read files directly.
+"""
+
+import mmap
+import sys
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Optional
+
+DEFAULT_BUDGET = 64 * 1024 * 1024  # Bytes of decoded text kept in memory
+MMAP_THRESHOLD = 1024 * 1024  # Files at least this large are decoded from an mmap
+
+_CLEAN = "clean"  # Key suffix for text that decoded without errors (valid for every errors mode)
+
+
+class ContentCache:
+    """LRU cache of decoded (and lower-cased) file contents under a memory budget"""
+
+    def __init__(self, budget: int = DEFAULT_BUDGET, inventory=None, use_mmap: bool = True):
+        self.budget = budget
+        self.inventory = inventory  # Known file sizes spare a stat() per read
+        self.use_mmap = use_mmap
+        self.used = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = OrderedDict()  # (path, "text" | "lower", encoding, mode) -> str
+        self._lock = threading.Lock()  # verify_all.py runs checkers on several worker threads
+
+    # ============ PUBLIC API ============
+    def read_text(self, path, encoding: str = 'utf-8', errors: Optional[str] = None) -> str:
+        """File text like Path(path).read_text(encoding, errors), served from the cache"""
+        return self._text(str(path), encoding, errors)[0]
+
+    def read_lower(self, path, encoding: str = 'utf-8', errors: Optional[str] = None) -> str:
+        """read_text(path).lower(), computed once per file"""
+        key = str(path)
+        cached = self._lookup(key, "lower", encoding, errors)
+        if cached is not None:
+            return cached[0]
+
+        text, mode = self._text(key, encoding, errors, count=False)  # The lookup above already counted this call
+        lower = text.lower()
+        self._store((key, "lower", encoding, mode), lower)
+        return lower
+
+    def stats(self) -> dict:
+        """Hit/miss counters and memory use"""
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "used_bytes": self.used,
+                "budget_bytes": self.budget,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions
+            }
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.used = 0
+
+    # ============ INTERNALS ============
+    def _size_of(self, path: Path) -> int:
+        entry = self.inventory.get(path) if self.inventory is not None else None
+        return entry.size if entry is not None else path.stat().st_size
+
+    def _read_bytes(self, path: Path):
+        """File contents as bytes, or as an mmap for large files (caller closes it)"""
+        if self.use_mmap and self._size_of(path) >= MMAP_THRESHOLD:
+            with open(path, 'rb') as f:
+                return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        return path.read_bytes()
+
+    def _text(self, key: str, encoding: str, errors: Optional[str], count: bool = True):
+        """(text, mode) for a file; mode is _CLEAN or the errors mode it was decoded with"""
+        cached = self._lookup(key, "text", encoding, errors, count)
+        if cached is not None:
+            return cached
+
+        data = self._read_bytes(Path(key))
+        try:
+            text, mode = str(data, encoding), _CLEAN
+        except UnicodeDecodeError:
+            if errors in (None, 'strict'):
+                raise
+            text, mode = str(data, encoding, errors), errors
+        finally:
+            if isinstance(data, mmap.mmap):
+                data.close()
+        if "\r" in text:
+            text = text.replace("\r\n", "\n").replace("\r", "\n")  # Universal newlines, as in text mode
+
+        self._store((key, "text", encoding, mode), text)
+        return text, mode
+
+    def _lookup(self, key: str, kind: str, encoding: str, errors: Optional[str], count: bool = True):
+        """Cached (value, mode) usable for this errors mode, or None; `count` updates hits/misses"""
+        with self._lock:
+            for mode in (_CLEAN, errors):
+                value = self._entries.get((key, kind, encoding, mode))
+                if value is not None:
+                    self._entries.move_to_end((key, kind, encoding, mode))
+                    if count:
+                        self.hits += 1
+                    return value, mode
+            if count:
+                self.misses += 1
+            return None
+
+    def _store(self, key, text: str) -> None:
+        size = sys.getsizeof(text)
+        if size > self.budget:
+            return
+        with self._lock:
+            if key in self._entries:
+                return  # Another worker thread decoded it first
+            self._entries[key] = text
+            self.used += size
+            while self.used > self.budget:
+                _, evicted = self._entries.popitem(last=False)
+                self.used -= sys.getsizeof(evicted)
+                self.evictions += 1
@@ -0,0 +1,251 @@
+#!/usr/bin/env python3
+"""
+File Inventory - Antigravity Kit
+================================
+
+Walks the project once and shares the result with every checker of a
+checklist.py / verify_all.py run.
+
+Directories in IGNORE_DIRS and paths matched by a .gitignore (at the root
+or in any subdirectory) are left out. Every kept file is stat-ed once and
+recorded with its size, mtime and extension.
+
+Checkers get the inventory as context["inventory"] and use it in place of
+the walks they do when run standalone:
+
+    (inventory or project_path).glob("**/*.html")     # like Path.glob
+    (inventory or project_path).rglob("*.ts")         # like Path.rglob
+    (inventory.walk if inventory else os.walk)(path)  # like os.walk; dirs[:] pruning works
+
+Usage:
+    python scripts/inventory.py .     # File counts by extension
+"""
+
+import os
+import re
+import stat
+import sys
+from pathlib import Path
+from typing import Dict, Iterator, List, NamedTuple, Optional, Tuple
+
+# Never worth auditing: VCS metadata, dependencies, build output, caches
+IGNORE_DIRS = {'.git', 'node_modules', '.next', 'dist', 'build', '__pycache__', '.venv', 'venv'}
+
+
+class FileEntry(NamedTuple):
+    path: Path
+    rel: str      # POSIX path relative to the inventory root
+    size: int
+    mtime: float
+    ext: str      # Lower-cased suffix, e.g. ".tsx"
+
+
+class _IgnoreRule(NamedTuple):
+    base: str     # Directory of the .gitignore, relative to the root ("" for the root)
+    regex: re.Pattern
+    negate: bool
+    dir_only: bool
+    anchored: bool
+
+
+def _glob_regex(pattern: str) -> str:
+    """Translate a glob (with ** segments) to a regex over POSIX relative paths"""
+    out = []
+    i = 0
+    while i < len(pattern):
+        c = pattern[i]
+        if pattern.startswith("**/", i):
+            out.append("(?:.*/)?")
+            i += 3
+            continue
+        if pattern.startswith("**", i):
+            out.append(".*")
+            i += 2
+            continue
+        if c == "*":
+            out.append("[^/]*")
+        elif c == "?":
+            out.append("[^/]")
+        elif c == "[":
+            end = pattern.find("]", i + 1)
+            if end == -1:
+                out.append(re.escape(c))
+            else:
+                body = pattern[i + 1:end]
+                if body.startswith("!"):
+                    body = "^" + body[1:]
+                out.append(f"[{body}]")
+                i = end
+        else:
+            out.append(re.escape(c))
+        i += 1
+    return "".join(out)
+
+
+def _parse_gitignore(path: Path, base: str) -> List[_IgnoreRule]:
+    """Rules of one .gitignore file; base is its directory relative to the root"""
+    rules = []
+    try:
+        lines = path.read_text(encoding='utf-8', errors='ignore').splitlines()
+    except OSError:
+        return rules
+
+    for line in lines:
+        line = line.rstrip()
+        if not line or line.startswith("#"):
+            continue
+        negate = line.startswith("!")
+        if negate:
+            line = line[1:]
+        if line.startswith("\\"):
+            line = line[1:]
+        dir_only = line.endswith("/")
+        line = line.rstrip("/")
+        if not line:
+            continue
+        anchored = "/" in line  # A slash anywhere but the end ties the pattern to the .gitignore's directory
+        line = line.lstrip("/")
+        rules.append(_IgnoreRule(base, re.compile(_glob_regex(line) + r"\Z"), negate, dir_only, anchored))
+    return rules
+
+
+def _ignored(rel: str, is_dir: bool, rules: List[_IgnoreRule]) -> bool:
+    """gitignore semantics: the last matching rule wins"""
+    ignored = False
+    for rule in rules:
+        if rule.dir_only and not is_dir:
+            continue
+        if rule.base:
+            if not rel.startswith(rule.base + "/"):
+                continue
+            sub = rel[len(rule.base) + 1:]
+        else:
+            sub = rel
+        target = sub if rule.anchored else sub.rsplit("/", 1)[-1]
+        if rule.regex.match(target):
+            ignored = not rule.negate
+    return ignored
+
+
+class FileInventory:
+    """Every non-ignored file under root, collected by a single walk"""
+
+    def __init__(self, root, ignore_dirs=None, use_gitignore: bool = True):
+        self.root = Path(root).resolve()
+        self.ignore_dirs = set(IGNORE_DIRS if ignore_dirs is None else ignore_dirs)
+        self.use_gitignore = use_gitignore
+        self.files: List[FileEntry] = []
+        self._tree: Dict[str, Tuple[List[str], List[str]]] = {}  # rel dir -> (subdir names, file names)
+        self._entries: Dict[str, FileEntry] = {}
+        self._scan()
+
+    def _scan(self) -> None:
+        stack = [("", [])]
+        while stack:
+            rel_dir, rules = stack.pop()
+            directory = self.root / rel_dir if rel_dir else self.root
+            if self.use_gitignore and (directory / ".gitignore").is_file():
+                rules = rules + _parse_gitignore(directory / ".gitignore", rel_dir)
+
+            dirs, names = [], []
+            try:
+                with os.scandir(directory) as it:
+                    items = list(it)
+            except OSError:
+                items = []
+
+            for item in items:
+                rel = f"{rel_dir}/{item.name}" if rel_dir else item.name
+                try:
+                    is_dir = item.is_dir(follow_symlinks=False)
+                except OSError:
+                    continue
+                if is_dir:
+                    if item.name in self.ignore_dirs or _ignored(rel, True, rules):
+                        continue
+                    dirs.append(item.name)
+                    continue
+                if _ignored(rel, False, rules):
+                    continue
+                try:
+                    st = item.stat()
+                except OSError:
+                    continue  # Broken symlink
+                if not stat.S_ISREG(st.st_mode):
+                    continue  # Symlinked directory (not followed, as with os.walk), socket, ...
+                entry = FileEntry(Path(item.path), rel, st.st_size, st.st_mtime, os.path.splitext(item.name)[1].lower())
+                names.append(item.name)
+                self.files.append(entry)
+                self._entries[rel] = entry
+
+            self._tree[rel_dir] = (dirs, names)
+            # Reversed so self.files comes out in os.walk's top-down order
+            for name in reversed(dirs):
+                stack.append((f"{rel_dir}/{name}" if rel_dir else name, rules))
+
+    def _relative(self, path) -> Optional[str]:
+        """POSIX path of `path` relative to root, or None if it lies outside"""
+        try:
+            rel = Path(path).resolve().relative_to(self.root).as_posix()
+        except ValueError:
+            return None
+        return "" if rel == "." else rel
+
+    def __len__(self) -> int:
+        return len(self.files)
+
+    def __iter__(self) -> Iterator[FileEntry]:
+        return iter(self.files)
+
+    def get(self, path) -> Optional[FileEntry]:
+        """Entry for a file path, or None if it is not in the inventory"""
+        rel = self._relative(path)
+        return self._entries.get(rel) if rel else None
+
+    def glob(self, pattern: str) -> Iterator[Path]:
+        """Files matching a pattern relative to root, like Path.glob"""
+        regex = re.compile(_glob_regex(pattern) + r"\Z")
+        return (entry.path for entry in self.files if regex.match(entry.rel))
+
+    def rglob(self, pattern: str) -> Iterator[Path]:
+        """Files matching a pattern at any depth, like Path.rglob"""
+        return self.glob("**/" + pattern)
+
+    def walk(self, top=None) -> Iterator[Tuple[str, List[str], List[str]]]:
+        """os.walk over the inventory; prune by assigning to dirs[:] as with os.walk"""
+        top = self.root if top is None else top
+        top_rel = self._relative(top)
+        if top_rel is None or top_rel not in self._tree:
+            yield from os.walk(top)  # Outside the inventory (or an ignored directory)
+            return
+
+        stack = [(top_rel, os.fspath(top))]
+        while stack:
+            rel_dir, path = stack.pop()
+            subdirs, names = self._tree[rel_dir]
+            dirs = list(subdirs)
+            yield path, dirs, list(names)
+            for name in reversed(dirs):
+                rel = f"{rel_dir}/{name}" if rel_dir else name
+                if rel in self._tree:
+                    stack.append((rel, os.path.join(path, name)))
+
+    def by_extension(self) -> Dict[str, int]:
+        """File counts per extension, most common first"""
+        counts: Dict[str, int] = {}
+        for entry in self.files:
+            counts[entry.ext or "(none)"] = counts.get(entry.ext or "(none)", 0) + 1
+        return dict(sorted(counts.items(), key=lambda item: (-item[1], item[0])))
+
+
+def main():
+    root = sys.argv[1] if len(sys.argv) > 1 else "."
+    inventory = FileInventory(root)
+    total_size = sum(entry.size for entry in inventory)
+    print(f"{inventory.root}: {len(inventory)} files, {total_size / 1024:.0f} KiB")
+    for ext, count in inventory.by_extension().items():
+        print(f"  {ext:12} {count}")
+
+
+if __name__ == "__main__":
+    main()
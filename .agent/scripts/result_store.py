@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+"""
+Result Store - Antigravity Kit
+==============================
+
+Per-file checker results persisted between checklist.py runs, so an
+unchanged file is not audited again.
+
+A result is reused while both of these hold:
+- the file's content hash is unchanged (size + mtime are compared first,
+  so unchanged files are not even read);
+- the checker's version is unchanged: the hash of the checker script's
+  source, so editing a checker's rules invalidates everything it stored.
+
+Checkers get the store as context["store"] and wrap their per-file work:
+
+    store.cached(__file__, file_path, lambda: check_file(file_path))
+
+compute() must return JSON-serializable data; it is round-tripped through
+JSON on a miss too, so a fresh and a stored result look exactly alike.
+
+With a changed-file set (checklist.py --since), files outside it are taken
+as unchanged: a stored result of the current checker version is reused
+without hashing the file, as long as its size still matches. That spares
+re-hashing a whole checkout whose mtimes all moved (fresh clone, CI cache).
+Files with no such result are still audited, so a report always covers the
+whole project.
+
+Usage:
+    python scripts/result_store.py .           # Entries per checker
+    python scripts/result_store.py . --clear   # Drop the store
+"""
+
+import hashlib
+import json
+import os
+import sys
+import threading
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional
+
+STORE_FORMAT = 1
+STORE_FILE = Path(".agent") / ".cache" / "check_results.json"  # Relative to the project root
+
+
+def _hash_file(path: Path) -> str:
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class ResultStore:
+    """Persisted per-file results keyed by content hash and checker version"""
+
+    def __init__(self, root, inventory=None, path: Optional[Path] = None, changed=None):
+        self.root = Path(root).resolve()
+        self.path = path or self.root / STORE_FILE
+        self.inventory = inventory  # Known sizes/mtimes spare a stat() per file
+        self.changed = set(changed) if changed is not None else None  # Root-relative POSIX paths; None: check every file
+        self.hits = 0
+        self.misses = 0
+        self._versions: Dict[str, str] = {}
+        self._lock = threading.Lock()
+        self._checkers = self._load()
+
+    # ============ PUBLIC API ============
+    def cached(self, checker_file, file_path, compute: Callable[[], Any], kind: str = "") -> Any:
+        """compute() for file_path, or the stored result if neither the file nor the checker changed"""
+        name = Path(checker_file).stem + (f":{kind}" if kind else "")
+        try:
+            rel = Path(file_path).resolve().relative_to(self.root).as_posix()
+            size, mtime = self._stat(file_path)
+        except (ValueError, OSError):
+            return compute()  # Outside the project or unreadable: nothing to key on
+
+        version = self._version(checker_file)
+        with self._lock:
+            section = self._checkers.get(name)
+            if section is None or section["version"] != version:
+                section = self._checkers[name] = {"version": version, "files": {}}
+            entry = section["files"].get(rel)
+
+        if entry is not None and self.changed is not None and rel not in self.changed and entry["size"] == size:
+            with self._lock:
+                self.hits += 1
+            return entry["result"]  # Unchanged per git: trusted without hashing (e.g. fresh mtimes after a checkout)
+        if entry is not None and (entry["size"], entry["mtime"]) == (size, mtime):
+            with self._lock:
+                self.hits += 1
+            return entry["result"]
+
+        try:
+            digest = _hash_file(Path(file_path))
+        except OSError:
+            return compute()
+        if entry is not None and entry["sha256"] == digest:
+            with self._lock:
+                self.hits += 1
+                entry.update(size=size, mtime=mtime)  # Touched but not changed
+            return entry["result"]
+
+        result = json.loads(json.dumps(compute()))
+        with self._lock:
+            self.misses += 1
+            section["files"][rel] = {"size": size, "mtime": mtime, "sha256": digest, "result": result}
+        return result
+
+    def save(self) -> None:
+        """Write the store atomically, dropping entries of files that no longer exist"""
+        with self._lock:
+            for section in self._checkers.values():
+                for rel in [rel for rel in section["files"] if not self._exists(rel)]:
+                    del section["files"][rel]
+            data = {"format": STORE_FORMAT, "checkers": self._checkers}
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.path.with_suffix(f".tmp{os.getpid()}")
+            tmp.write_text(json.dumps(data, separators=(",", ":")), encoding='utf-8')
+            os.replace(tmp, self.path)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._checkers = {}
+        if self.path.exists():
+            self.path.unlink()
+
+    def stats(self) -> dict:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "entries": {name: len(section["files"]) for name, section in self._checkers.items()}
+        }
+
+    # ============ INTERNALS ============
+    def _load(self) -> Dict[str, dict]:
+        try:
+            data = json.loads(self.path.read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(data, dict) or data.get("format") != STORE_FORMAT:
+            return {}  # Older layout: start over
+        return data.get("checkers", {})
+
+    def _version(self, checker_file) -> str:
+        key = str(checker_file)
+        if key not in self._versions:
+            self._versions[key] = _hash_file(Path(checker_file))[:16]
+        return self._versions[key]
+
+    def _stat(self, file_path):
+        entry = self.inventory.get(file_path) if self.inventory is not None else None
+        if entry is not None:
+            return entry.size, entry.mtime
+        st = os.stat(file_path)
+        return st.st_size, st.st_mtime
+
+    def _exists(self, rel: str) -> bool:
+        if self.inventory is not None:
+            return self.inventory.get(self.root / rel) is not None
+        return (self.root / rel).is_file()
+
+
+def main():
+    args = [arg for arg in sys.argv[1:] if not arg.startswith("--")]
+    store = ResultStore(args[0] if args else ".")
+    if "--clear" in sys.argv:
+        store.clear()
+        print(f"Cleared {store.path}")
+        return
+    print(f"{store.path}")
+    for name, count in sorted(store.stats()["entries"].items()):
+        print(f"  {name:32} {count} files")
+
+
+if __name__ == "__main__":
+    main()
@@ -10,12 +10,13 @@ Usage:
     python .agent/scripts/session_manager.py info [path]
 """
 
-import os
 import json
 import argparse
 from pathlib import Path
 from typing import Dict, Any, List
 
+from inventory import FileInventory, IGNORE_DIRS
+
 def get_project_root(path: str) -> Path:
     return Path(path).resolve()
 
@@ -56,12 +57,9 @@ def analyze_package_json(root: Path) -> Dict[str, Any]:
 def count_files(root: Path) -> Dict[str, int]:
     stats = {"created": 0, "modified": 0, "total": 0}
     # Simple count for now, comprehensive tracking would require git diff or extensive history
-    exclude = {".git", "node_modules", ".next", "dist", "build", ".agent", ".gemini", "__pycache__"}
+    inventory = FileInventory(root, ignore_dirs=IGNORE_DIRS | {".agent", ".gemini"})
+    stats["total"] = len(inventory)
     
-    for root_dir, dirs, files in os.walk(root):
-        dirs[:] = [d for d in dirs if d not in exclude]
-        stats["total"] += len(files)
-        
     return stats
 
 def detect_features(root: Path) -> List[str]:
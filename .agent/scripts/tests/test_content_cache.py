@@ -0,0 +1,21 @@
+"""Tests for content_cache.ContentCache statistics (run with pytest)"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from content_cache import ContentCache  # noqa: E402
+
+
+def test_each_read_counts_one_hit_or_miss(tmp_path):
+    page = tmp_path / "Page.tsx"
+    page.write_text("<Button>Salvar</Button>\n", encoding="utf-8")
+    cache = ContentCache()
+
+    assert cache.read_lower(page) == "<button>salvar</button>\n"
+    assert (cache.stats()["hits"], cache.stats()["misses"]) == (0, 1)
+
+    cache.read_text(page)
+    cache.read_lower(page)
+    assert (cache.stats()["hits"], cache.stats()["misses"]) == (2, 1)
@@ -0,0 +1,51 @@
+"""Regression tests for verify_all.run_checks (run with pytest)"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from verify_all import run_checks  # noqa: E402
+
+
+def make_check(name, passed=True, required=False, depends_on=(), ran=None):
+    def run(stop):
+        if ran is not None:
+            ran.append(name)
+        return {"name": name, "passed": passed, "skipped": False, "duration": 0}
+    return {"name": name, "category": "Test", "required": required,
+            "depends_on": list(depends_on), "run": run}
+
+
+def test_stop_on_fail_reports_dropped_checks_as_cancelled():
+    ran = []
+    checks = [
+        make_check("critical", passed=False, required=True, ran=ran),
+        make_check("dependent", depends_on=["critical"], ran=ran),  # Still waiting when critical fails
+        make_check("transitive", depends_on=["dependent"], ran=ran),
+    ]
+
+    results = run_checks(checks, jobs=1, stop_on_fail=True)
+
+    assert ran == ["critical"]
+    assert [r["name"] for r in results] == ["critical", "dependent", "transitive"]
+    assert not results[0]["passed"]
+    for r in results[1:]:
+        assert r["cancelled"] and r["skipped"] and r["passed"]
+        assert "blocked" not in r
+        assert r["category"] == "Test"
+
+
+def test_without_stop_on_fail_every_check_runs():
+    ran = []
+    checks = [
+        make_check("critical", passed=False, required=True, ran=ran),
+        make_check("queued", ran=ran),
+        make_check("blocked", depends_on=["critical"], ran=ran),
+    ]
+
+    results = run_checks(checks, jobs=1)
+
+    assert sorted(ran) == ["critical", "queued"]
+    assert [r["name"] for r in results] == ["critical", "queued", "blocked"]
+    assert results[2]["blocked"] == "critical"
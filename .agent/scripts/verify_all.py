@@ -7,7 +7,15 @@ Runs COMPLETE validation including all checks + performance + E2E.
 Use this before deployment or major releases.
 
 Usage:
-    python scripts/verify_all.py . --url <URL>
+    python scripts/verify_all.py . --url <URL> [--jobs 4] [--stop-on-fail] [--no-cache]
+
+Independent checks run concurrently on a bounded worker pool; a check with
+entries in CHECK_DEPENDENCIES starts only after those checks have passed.
+Python checkers that define run() (see checkers.py) execute in-process on
+the worker thread and share one walk of the project (see inventory.py) and
+one cache of decoded file contents (see content_cache.py); external-tool
+wrappers still run as a subprocess. Per-file results of unchanged files are
+reused from the store shared with checklist.py (see result_store.py).
 
 Includes ALL checks:
     ✅ Security Scan (OWASP, secrets, dependencies)
@@ -23,12 +31,27 @@ Includes ALL checks:
 """
 
 import sys
+import time
+import threading
 import subprocess
 import argparse
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
 from pathlib import Path
 from typing import List, Dict, Optional
 from datetime import datetime
 
+from checkers import load_checker, run_checker
+from content_cache import ContentCache
+from inventory import FileInventory
+from result_store import ResultStore
+
+DEFAULT_JOBS = 4  # Checks running at once; the suite is bound by wall-clock, not CPU
+CHECK_TIMEOUT = 600  # 10 minute timeout for slow checks
+PREVIEW_TIMEOUT = 60  # Seconds to wait for the preview server to answer on --url
+POLL_INTERVAL = 0.5
+
 # ANSI colors
 class Colors:
     HEADER = '\033[95m'
@@ -147,15 +170,38 @@ VERIFICATION_SUITE = [
     },
 ]
 
-def run_script(name: str, script_path: Path, project_path: str, url: Optional[str] = None) -> dict:
-    """Run validation script"""
+# Checks that must pass before another may start (names from VERIFICATION_SUITE, plus PREVIEW_SERVER)
+PREVIEW_SERVER = "Preview Server"
+CHECK_DEPENDENCIES = {
+    "Lighthouse Audit": [PREVIEW_SERVER],
+    "Playwright E2E": [PREVIEW_SERVER, "Lint Check"],
+}
+
+def run_script(name: str, script_path: Path, project_path: str, url: Optional[str] = None,
+               stop: Optional[threading.Event] = None, context: Optional[dict] = None) -> dict:
+    """Run validation script (a subprocess is killed early if `stop` is set)"""
     if not script_path.exists():
         print_warning(f"{name}: Script not found, skipping")
         return {"name": name, "passed": True, "skipped": True, "duration": 0}
+    if stop is not None and stop.is_set():
+        return {"name": name, "passed": True, "skipped": True, "cancelled": True, "duration": 0}
     
     print_step(f"Running: {name}")
     start_time = datetime.now()
     
+    # In-process checker plugin (runs to completion: neither stop nor the timeout can interrupt it)
+    checker = load_checker(script_path)
+    if checker is not None:
+        result = run_checker(checker, name, Path(project_path), dict(context or {}, url=url))
+        result["duration"] = (datetime.now() - start_time).total_seconds()
+        if result["passed"]:
+            print_success(f"{name}: PASSED ({result['duration']:.1f}s)")
+        else:
+            print_error(f"{name}: FAILED ({result['duration']:.1f}s)")
+            if result["error"]:
+                print(f"  {result['error'][:300]}")
+        return result
+    
     # Build command
     cmd = ["python", str(script_path), project_path]
     if url and ("lighthouse" in script_path.name.lower() or "playwright" in script_path.name.lower()):
@@ -163,28 +209,39 @@ def run_script(name: str, script_path: Path, project_path: str, url: Optional[st
     
     # Run
     try:
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            timeout=600  # 10 minute timeout for slow checks
-        )
+        process = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
+        deadline = time.monotonic() + CHECK_TIMEOUT
+        while True:
+            try:
+                stdout, stderr = process.communicate(timeout=POLL_INTERVAL)
+                break
+            except subprocess.TimeoutExpired:
+                if stop is not None and stop.is_set():
+                    process.kill()
+                    process.communicate()
+                    print_warning(f"{name}: cancelled")
+                    return {"name": name, "passed": True, "skipped": True, "cancelled": True,
+                            "duration": (datetime.now() - start_time).total_seconds()}
+                if time.monotonic() > deadline:
+                    process.kill()
+                    process.communicate()
+                    raise subprocess.TimeoutExpired(cmd, CHECK_TIMEOUT)
         
         duration = (datetime.now() - start_time).total_seconds()
-        passed = result.returncode == 0
+        passed = process.returncode == 0
         
         if passed:
             print_success(f"{name}: PASSED ({duration:.1f}s)")
         else:
             print_error(f"{name}: FAILED ({duration:.1f}s)")
-            if result.stderr:
-                print(f"  {result.stderr[:300]}")
+            if stderr:
+                print(f"  {stderr[:300]}")
         
         return {
             "name": name,
             "passed": passed,
-            "output": result.stdout,
-            "error": result.stderr,
+            "output": stdout,
+            "error": stderr,
             "skipped": False,
             "duration": duration
         }
@@ -199,6 +256,107 @@ def run_script(name: str, script_path: Path, project_path: str, url: Optional[st
         print_error(f"{name}: ERROR - {str(e)}")
         return {"name": name, "passed": False, "skipped": False, "duration": duration, "error": str(e)}
 
+def wait_for_preview(url: str, stop: Optional[threading.Event] = None, timeout: float = PREVIEW_TIMEOUT) -> dict:
+    """Wait until the preview server answers on url (any HTTP status counts)"""
+    print_step(f"Waiting for preview server: {url}")
+    start_time = datetime.now()
+    deadline = time.monotonic() + timeout
+    error = ""
+    while time.monotonic() < deadline and not (stop is not None and stop.is_set()):
+        try:
+            urllib.request.urlopen(url, timeout=5).close()
+            error = ""
+        except urllib.error.HTTPError:
+            error = ""  # The server is up, the page just is not 2xx
+        except (urllib.error.URLError, OSError, ValueError) as e:
+            error = str(e)
+            time.sleep(1)
+            continue
+        duration = (datetime.now() - start_time).total_seconds()
+        print_success(f"{PREVIEW_SERVER}: UP ({duration:.1f}s)")
+        return {"name": PREVIEW_SERVER, "passed": True, "skipped": False, "duration": duration}
+    
+    duration = (datetime.now() - start_time).total_seconds()
+    print_error(f"{PREVIEW_SERVER}: not reachable at {url} ({duration:.0f}s)")
+    return {"name": PREVIEW_SERVER, "passed": False, "skipped": False, "duration": duration,
+            "error": f"No response from {url}: {error}"}
+
+def check_dependencies(checks: List[dict]):
+    """Reject unknown dependency names and cycles before anything runs"""
+    names = {check["name"] for check in checks}
+    known = names | {name for suite in VERIFICATION_SUITE for name, _, _ in suite["checks"]} | {PREVIEW_SERVER}
+    for check in checks:
+        unknown = [dep for dep in check["depends_on"] if dep not in known]
+        if unknown:
+            raise ValueError(f"{check['name']}: unknown dependency {', '.join(unknown)}")
+    
+    deps = {check["name"]: [dep for dep in check["depends_on"] if dep in names] for check in checks}
+    state = {}  # name -> "visiting" | "done"
+    def visit(name, path):
+        if state.get(name) == "done":
+            return
+        if state.get(name) == "visiting":
+            raise ValueError(f"Dependency cycle: {' -> '.join(path + [name])}")
+        state[name] = "visiting"
+        for dep in deps[name]:
+            visit(dep, path + [name])
+        state[name] = "done"
+    for name in deps:
+        visit(name, [])
+
+def run_checks(checks: List[dict], jobs: int = DEFAULT_JOBS, stop_on_fail: bool = False) -> List[dict]:
+    """
+    Run checks concurrently, each as soon as its dependencies have passed
+    
+    A check whose dependency failed is skipped (marked blocked). With
+    stop_on_fail, a required failure cancels queued checks and kills running
+    ones. Returns the results in suite order.
+    """
+    check_dependencies(checks)
+    names = {check["name"] for check in checks}
+    order = {check["name"]: i for i, check in enumerate(checks)}
+    results = {}
+    waiting = list(checks)
+    running = {}
+    stop = threading.Event()
+    
+    with ThreadPoolExecutor(max_workers=max(1, jobs)) as pool:
+        while waiting or running:
+            for check in list(waiting):
+                deps = [dep for dep in check["depends_on"] if dep in names]
+                blocker = next((dep for dep in deps if dep in results
+                                and (not results[dep]["passed"] or results[dep].get("blocked"))), None)
+                if blocker:
+                    print_warning(f"{check['name']}: skipped ({blocker} did not pass)")
+                    results[check["name"]] = {"name": check["name"], "passed": True, "skipped": True,
+                                              "blocked": blocker, "duration": 0, "category": check["category"]}
+                    waiting.remove(check)
+                elif all(dep in results for dep in deps):
+                    running[pool.submit(check["run"], stop)] = check
+                    waiting.remove(check)
+            if not running:
+                continue  # Only blocked checks were left; the next pass resolves them
+            
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                check = running.pop(future)
+                result = future.result()
+                result["category"] = check["category"]
+                results[check["name"]] = result
+                
+                # Stop on critical failure if flag set
+                if stop_on_fail and check["required"] and not result["passed"] and not result.get("skipped"):
+                    print_error(f"CRITICAL: {check['name']} failed. Stopping verification.")
+                    stop.set()
+                    dropped = waiting + [running.pop(f) for f in list(running) if f.cancel()]
+                    waiting.clear()
+                    for pending in dropped:
+                        results[pending["name"]] = {"name": pending["name"], "passed": True, "skipped": True,
+                                                    "cancelled": True, "duration": 0,
+                                                    "category": pending["category"]}
+    
+    return sorted(results.values(), key=lambda r: order[r["name"]])
+
 def print_final_report(results: List[dict], start_time: datetime):
     """Print comprehensive final report"""
     total_duration = (datetime.now() - start_time).total_seconds()
@@ -236,6 +394,10 @@ def print_final_report(results: List[dict], start_time: datetime):
             status = f"{Colors.RED}❌{Colors.ENDC}"
         
         duration_str = f"({r.get('duration', 0):.1f}s)" if not r.get("skipped") else ""
+        if r.get("blocked"):
+            duration_str = f"(blocked: {r['blocked']} did not pass)"
+        elif r.get("cancelled"):
+            duration_str = "(cancelled)"
         print(f"  {status} {r['name']} {duration_str}")
     
     print()
@@ -274,6 +436,8 @@ Examples:
     parser.add_argument("--url", required=True, help="URL for performance & E2E checks")
     parser.add_argument("--no-e2e", action="store_true", help="Skip E2E tests")
     parser.add_argument("--stop-on-fail", action="store_true", help="Stop on first failure")
+    parser.add_argument("--jobs", "-j", type=int, default=DEFAULT_JOBS, help=f"Checks to run at once (default: {DEFAULT_JOBS})")
+    parser.add_argument("--no-cache", action="store_true", help="Re-audit every file instead of reusing stored results")
     
     args = parser.parse_args()
     
@@ -289,9 +453,13 @@ Examples:
     print(f"Started: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
     
     start_time = datetime.now()
-    results = []
+    checks = []
+    # Shared by every in-process checker of this run
+    inventory = FileInventory(project_path)
+    store = None if args.no_cache else ResultStore(project_path, inventory)
+    context = {"inventory": inventory, "contents": ContentCache(inventory=inventory), "store": store}
     
-    # Run all verification categories
+    # Collect all verification categories
     for suite in VERIFICATION_SUITE:
         category = suite["category"]
         requires_url = suite.get("requires_url", False)
@@ -304,19 +472,26 @@ Examples:
         if args.no_e2e and category == "E2E Testing":
             continue
         
-        print_header(f"📋 {category.upper()}")
+        if requires_url and not any(c["name"] == PREVIEW_SERVER for c in checks):
+            checks.append({"name": PREVIEW_SERVER, "category": category, "required": True, "depends_on": [],
+                           "run": lambda stop: wait_for_preview(args.url, stop)})
         
         for name, script_path, required in suite["checks"]:
             script = project_path / script_path
-            result = run_script(name, script, str(project_path), args.url)
-            result["category"] = category
-            results.append(result)
-            
-            # Stop on critical failure if flag set
-            if args.stop_on_fail and required and not result["passed"] and not result.get("skipped"):
-                print_error(f"CRITICAL: {name} failed. Stopping verification.")
-                print_final_report(results, start_time)
-                sys.exit(1)
+            checks.append({
+                "name": name,
+                "category": category,
+                "required": required,
+                "depends_on": CHECK_DEPENDENCIES.get(name, []),
+                "run": lambda stop, name=name, script=script: run_script(name, script, str(project_path), args.url, stop, context)
+            })
+    
+    print_header(f"📋 RUNNING {len(checks)} CHECKS ({args.jobs} at a time)")
+    try:
+        results = run_checks(checks, args.jobs, args.stop_on_fail)
+    finally:
+        if store is not None:
+            store.save()
     
     # Print final report
     all_passed = print_final_report(results, start_time)
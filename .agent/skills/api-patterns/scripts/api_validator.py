@@ -15,8 +15,8 @@ try:
 except AttributeError:
     pass  # Python < 3.7
 
-def find_api_files(project_path: Path) -> list:
-    """Find API-related files."""
+def find_api_files(project_path: Path, inventory=None) -> list:
+    """Find API-related files (from the shared inventory when given one)."""
     patterns = [
         "**/*api*.ts", "**/*api*.js", "**/*api*.py",
         "**/routes/*.ts", "**/routes/*.js", "**/routes/*.py",
@@ -29,18 +29,19 @@ def find_api_files(project_path: Path) -> list:
     
     files = []
     for pattern in patterns:
-        files.extend(project_path.glob(pattern))
+        files.extend((inventory if inventory is not None else project_path).glob(pattern))
     
     # Exclude node_modules, etc.
     return [f for f in files if not any(x in str(f) for x in ['node_modules', '.git', 'dist', 'build', '__pycache__'])]
 
-def check_openapi_spec(file_path: Path) -> dict:
+def check_openapi_spec(file_path: Path, contents=None) -> dict:
     """Check OpenAPI/Swagger specification."""
     issues = []
     passed = []
     
     try:
-        content = file_path.read_text(encoding='utf-8')
+        content = (contents.read_text(file_path) if contents is not None  # Shared content cache
+                   else file_path.read_text(encoding='utf-8'))
         
         if file_path.suffix == '.json':
             spec = json.loads(content)
@@ -91,13 +92,14 @@ def check_openapi_spec(file_path: Path) -> dict:
     
     return {'file': str(file_path), 'passed': passed, 'issues': issues, 'type': 'openapi'}
 
-def check_api_code(file_path: Path) -> dict:
+def check_api_code(file_path: Path, contents=None) -> dict:
     """Check API code for common issues."""
     issues = []
     passed = []
     
     try:
-        content = file_path.read_text(encoding='utf-8')
+        content = (contents.read_text(file_path) if contents is not None  # Shared content cache
+                   else file_path.read_text(encoding='utf-8'))
         
         # Check for error handling
         error_patterns = [
@@ -159,6 +161,33 @@ def check_api_code(file_path: Path) -> dict:
     
     return {'file': str(file_path), 'passed': passed, 'issues': issues, 'type': 'code'}
 
+def run(project_path: Path, context: dict = None) -> dict:
+    """Plugin entry point for checklist.py / verify_all.py: audit without printing."""
+    context = context or {}
+    contents = context.get("contents")
+    api_files = find_api_files(project_path, context.get("inventory"))
+    
+    results = []
+    for file_path in api_files[:15]:  # Limit
+        if 'openapi' in file_path.name.lower() or 'swagger' in file_path.name.lower():
+            result = check_openapi_spec(file_path, contents)
+        else:
+            result = check_api_code(file_path, contents)
+        results.append(result)
+    
+    total_passed = sum(len(result['passed']) for result in results)
+    total_issues = sum(1 for result in results for item in result['issues'] if item.startswith("[X]"))
+    return {
+        "script": "api_validator",
+        "project": str(project_path),
+        "files_checked": len(results),
+        "results": results,
+        "checks_passed": total_passed,
+        "critical_issues": total_issues,
+        "passed": total_issues == 0,
+        "summary": f"{total_passed} passed, {total_issues} critical issues" if api_files else "No API files found"
+    }
+
 def main():
     target = sys.argv[1] if len(sys.argv) > 1 else "."
     project_path = Path(target)
@@ -167,40 +196,26 @@ def main():
     print("  API VALIDATOR - Endpoint Best Practices Check")
     print("=" * 60 + "\n")
     
-    api_files = find_api_files(project_path)
+    report = run(project_path)
     
-    if not api_files:
+    if not report['results']:
         print("[!] No API files found.")
         print("   Looking for: routes/, controllers/, api/, openapi.json/yaml")
         sys.exit(0)
     
-    results = []
-    for file_path in api_files[:15]:  # Limit
-        if 'openapi' in file_path.name.lower() or 'swagger' in file_path.name.lower():
-            result = check_openapi_spec(file_path)
-        else:
-            result = check_api_code(file_path)
-        results.append(result)
-    
     # Print results
-    total_issues = 0
-    total_passed = 0
-    
-    for result in results:
+    for result in report['results']:
         print(f"\n[FILE] {result['file']} [{result['type']}]")
         for item in result['passed']:
             print(f"   {item}")
-            total_passed += 1
         for item in result['issues']:
             print(f"   {item}")
-            if item.startswith("[X]"):
-                total_issues += 1
     
     print("\n" + "=" * 60)
-    print(f"[RESULTS] {total_passed} passed, {total_issues} critical issues")
+    print(f"[RESULTS] {report['checks_passed']} passed, {report['critical_issues']} critical issues")
     print("=" * 60)
     
-    if total_issues == 0:
+    if report['passed']:
         print("[OK] API validation passed")
         sys.exit(0)
     else:
@@ -91,38 +91,24 @@ def validate_prisma_schema(file_path: Path) -> list:
     return issues
 
 
-def main():
-    project_path = Path(sys.argv[1] if len(sys.argv) > 1 else ".").resolve()
-    
-    print(f"\n{'='*60}")
-    print(f"[SCHEMA VALIDATOR] Database Schema Validation")
-    print(f"{'='*60}")
-    print(f"Project: {project_path}")
-    print(f"Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-    print("-"*60)
-    
-    # Find schema files
+def run(project_path: Path, context: dict = None) -> dict:
+    """Plugin entry point for checklist.py / verify_all.py: audit without printing."""
     schemas = find_schema_files(project_path)
-    print(f"Found {len(schemas)} schema files")
-    
     if not schemas:
-        output = {
+        return {
             "script": "schema_validator",
             "project": str(project_path),
             "schemas_checked": 0,
             "issues_found": 0,
             "passed": True,
-            "message": "No schema files found"
+            "message": "No schema files found",
+            "summary": "No schema files found"
         }
-        print(json.dumps(output, indent=2))
-        sys.exit(0)
     
     # Validate each schema
     all_issues = []
     
     for schema_type, file_path in schemas:
-        print(f"\nValidating: {file_path.name} ({schema_type})")
-        
         if schema_type == 'prisma':
             issues = validate_prisma_schema(file_path)
         else:
@@ -135,11 +121,50 @@ def main():
                 "issues": issues
             })
     
+    total_issues = sum(len(item["issues"]) for item in all_issues)
+    # Schema issues are warnings, not failures
+    passed = True
+    
+    return {
+        "script": "schema_validator",
+        "project": str(project_path),
+        "schemas_checked": len(schemas),
+        "schemas": [{"file": str(file_path.name), "type": schema_type} for schema_type, file_path in schemas],
+        "issues_found": total_issues,
+        "passed": passed,
+        "issues": all_issues,
+        "summary": f"{total_issues} schema issues in {len(schemas)} schema files"
+    }
+
+
+def main():
+    project_path = Path(sys.argv[1] if len(sys.argv) > 1 else ".").resolve()
+    
+    print(f"\n{'='*60}")
+    print(f"[SCHEMA VALIDATOR] Database Schema Validation")
+    print(f"{'='*60}")
+    print(f"Project: {project_path}")
+    print(f"Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+    print("-"*60)
+    
+    report = run(project_path)
+    schemas = report.pop("schemas", [])
+    del report["summary"]
+    print(f"Found {len(schemas)} schema files")
+    
+    if not schemas:
+        print(json.dumps(report, indent=2))
+        sys.exit(0)
+    
+    for schema in schemas:
+        print(f"\nValidating: {schema['file']} ({schema['type']})")
+    
     # Summary
     print("\n" + "="*60)
     print("SCHEMA ISSUES")
     print("="*60)
     
+    all_issues = report["issues"]
     if all_issues:
         for item in all_issues:
             print(f"\n{item['file']} ({item['type']}):")
@@ -150,20 +175,7 @@ def main():
     else:
         print("No schema issues found!")
     
-    total_issues = sum(len(item["issues"]) for item in all_issues)
-    # Schema issues are warnings, not failures
-    passed = True
-    
-    output = {
-        "script": "schema_validator",
-        "project": str(project_path),
-        "schemas_checked": len(schemas),
-        "issues_found": total_issues,
-        "passed": passed,
-        "issues": all_issues
-    }
-    
-    print("\n" + json.dumps(output, indent=2))
+    print("\n" + json.dumps(report, indent=2))
     
     sys.exit(0)
 
@@ -27,26 +27,31 @@ except:
     pass
 
 
-def find_html_files(project_path: Path) -> list:
-    """Find all HTML/JSX/TSX files."""
+def find_html_files(project_path: Path, inventory=None) -> list:
+    """Find all HTML/JSX/TSX files (from the shared inventory when given one)."""
     patterns = ['**/*.html', '**/*.jsx', '**/*.tsx']
     skip_dirs = {'node_modules', '.next', 'dist', 'build', '.git'}
     
     files = []
     for pattern in patterns:
-        for f in project_path.glob(pattern):
+        for f in (inventory if inventory is not None else project_path).glob(pattern):
             if not any(skip in f.parts for skip in skip_dirs):
                 files.append(f)
     
     return files[:50]
 
 
-def check_accessibility(file_path: Path) -> list:
+def check_accessibility(file_path: Path, contents=None) -> list:
     """Check a single file for accessibility issues."""
     issues = []
     
     try:
-        content = file_path.read_text(encoding='utf-8', errors='ignore')
+        if contents is not None:  # Shared content cache (checklist.py / verify_all.py)
+            content = contents.read_text(file_path, errors='ignore')
+            lower = contents.read_lower(file_path, errors='ignore')
+        else:
+            content = file_path.read_text(encoding='utf-8', errors='ignore')
+            lower = content.lower()
         
         # Check for form inputs without labels
         inputs = re.findall(r'<input[^>]*>', content, re.IGNORECASE)
@@ -67,34 +72,34 @@ def check_accessibility(file_path: Path) -> list:
                     break
         
         # Check for missing lang attribute
-        if '<html' in content.lower() and 'lang=' not in content.lower():
+        if '<html' in lower and 'lang=' not in lower:
             issues.append("Missing lang attribute on <html>")
         
         # Check for missing skip link
-        if '<main' in content.lower() or '<body' in content.lower():
-            if 'skip' not in content.lower() and '#main' not in content.lower():
+        if '<main' in lower or '<body' in lower:
+            if 'skip' not in lower and '#main' not in lower:
                 issues.append("Consider adding skip-to-main-content link")
         
         # Check for click handlers without keyboard support
-        onclick_count = content.lower().count('onclick=')
-        onkeydown_count = content.lower().count('onkeydown=') + content.lower().count('onkeyup=')
+        onclick_count = lower.count('onclick=')
+        onkeydown_count = lower.count('onkeydown=') + lower.count('onkeyup=')
         if onclick_count > 0 and onkeydown_count == 0:
             issues.append("onClick without keyboard handler (onKeyDown)")
         
         # Check for tabIndex misuse
-        if 'tabindex=' in content.lower():
-            if 'tabindex="-1"' not in content.lower() and 'tabindex="0"' not in content.lower():
+        if 'tabindex=' in lower:
+            if 'tabindex="-1"' not in lower and 'tabindex="0"' not in lower:
                 positive_tabindex = re.findall(r'tabindex="([1-9]\d*)"', content, re.IGNORECASE)
                 if positive_tabindex:
                     issues.append("Avoid positive tabIndex values")
         
         # Check for autoplay media
-        if 'autoplay' in content.lower():
-            if 'muted' not in content.lower():
+        if 'autoplay' in lower:
+            if 'muted' not in lower:
                 issues.append("Autoplay media should be muted")
         
         # Check for role usage
-        if 'role="button"' in content.lower():
+        if 'role="button"' in lower:
             # Divs with role button should have tabindex
             div_buttons = re.findall(r'<div[^>]*role="button"[^>]*>', content, re.IGNORECASE)
             for div in div_buttons:
@@ -108,43 +113,71 @@ def check_accessibility(file_path: Path) -> list:
     return issues
 
 
-def main():
-    project_path = Path(sys.argv[1] if len(sys.argv) > 1 else ".").resolve()
-    
-    print(f"\n{'='*60}")
-    print(f"[ACCESSIBILITY CHECKER] WCAG Compliance Audit")
-    print(f"{'='*60}")
-    print(f"Project: {project_path}")
-    print(f"Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-    print("-"*60)
-    
-    # Find HTML files
-    files = find_html_files(project_path)
-    print(f"Found {len(files)} HTML/JSX/TSX files")
-    
+def run(project_path: Path, context: dict = None) -> dict:
+    """Plugin entry point for checklist.py / verify_all.py: audit without printing."""
+    context = context or {}
+    contents, store = context.get("contents"), context.get("store")
+    files = find_html_files(project_path, context.get("inventory"))
     if not files:
-        output = {
+        return {
             "script": "accessibility_checker",
             "project": str(project_path),
             "files_checked": 0,
             "issues_found": 0,
             "passed": True,
-            "message": "No HTML files found"
+            "message": "No HTML files found",
+            "summary": "No HTML files found"
         }
-        print(json.dumps(output, indent=2))
-        sys.exit(0)
     
     # Check each file
     all_issues = []
     
     for f in files:
-        issues = check_accessibility(f)
+        if store is not None:  # Result store (checklist.py): skip files unchanged since the last run
+            issues = store.cached(__file__, f, lambda: check_accessibility(f, contents))
+        else:
+            issues = check_accessibility(f, contents)
         if issues:
             all_issues.append({
                 "file": str(f.name),
                 "issues": issues
             })
     
+    total_issues = sum(len(item["issues"]) for item in all_issues)
+    # Accessibility issues are important but not blocking
+    passed = total_issues < 5  # Allow minor issues
+    
+    return {
+        "script": "accessibility_checker",
+        "project": str(project_path),
+        "files_checked": len(files),
+        "files_with_issues": len(all_issues),
+        "issues_found": total_issues,
+        "passed": passed,
+        "issues": all_issues,
+        "summary": f"{total_issues} accessibility issues in {len(all_issues)} of {len(files)} files"
+    }
+
+
+def main():
+    project_path = Path(sys.argv[1] if len(sys.argv) > 1 else ".").resolve()
+    
+    print(f"\n{'='*60}")
+    print(f"[ACCESSIBILITY CHECKER] WCAG Compliance Audit")
+    print(f"{'='*60}")
+    print(f"Project: {project_path}")
+    print(f"Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+    print("-"*60)
+    
+    report = run(project_path)
+    all_issues = report.pop("issues", [])
+    del report["summary"]
+    print(f"Found {report['files_checked']} HTML/JSX/TSX files")
+    
+    if not report["files_checked"]:
+        print(json.dumps(report, indent=2))
+        sys.exit(0)
+    
     # Summary
     print("\n" + "="*60)
     print("ACCESSIBILITY ISSUES")
@@ -161,22 +194,9 @@ def main():
     else:
         print("No accessibility issues found!")
     
-    total_issues = sum(len(item["issues"]) for item in all_issues)
-    # Accessibility issues are important but not blocking
-    passed = total_issues < 5  # Allow minor issues
-    
-    output = {
-        "script": "accessibility_checker",
-        "project": str(project_path),
-        "files_checked": len(files),
-        "files_with_issues": len(all_issues),
-        "issues_found": total_issues,
-        "passed": passed
-    }
-    
-    print("\n" + json.dumps(output, indent=2))
+    print("\n" + json.dumps(report, indent=2))
     
-    sys.exit(0 if passed else 1)
+    sys.exit(0 if report["passed"] else 1)
 
 
 if __name__ == "__main__":
@@ -96,7 +96,9 @@ import json
 from pathlib import Path
 
 class UXAuditor:
-    def __init__(self):
+    def __init__(self, contents=None, store=None):
+        self.contents = contents  # Shared content cache (checklist.py / verify_all.py)
+        self.store = store  # Result store (checklist.py): skip files unchanged since the last run
         self.issues = []
         self.warnings = []
         self.passed_count = 0
@@ -104,8 +106,13 @@ class UXAuditor:
     
     def audit_file(self, filepath: str) -> None:
         try:
-            with open(filepath, 'r', encoding='utf-8', errors='replace') as f:
-                content = f.read()
+            if self.contents is not None:
+                content = self.contents.read_text(filepath, errors='replace')
+                lower = self.contents.read_lower(filepath, errors='replace')
+            else:
+                with open(filepath, 'r', encoding='utf-8', errors='replace') as f:
+                    content = f.read()
+                lower = content.lower()
         except: return
         
         self.files_checked += 1
@@ -132,7 +139,7 @@ class UXAuditor:
             self.warnings.append(f"[Miller's Law] {filename}: Complex form ({form_fields} fields)")
             
         # Von Restorff
-        if 'button' in content.lower() and not re.search(r'primary|bg-primary|Button.*primary|variant=["\']primary', content, re.IGNORECASE):
+        if 'button' in lower and not re.search(r'primary|bg-primary|Button.*primary|variant=["\']primary', content, re.IGNORECASE):
             self.warnings.append(f"[Von Restorff] {filename}: No primary CTA")
 
         # Serial Position Effect - Important items at beginning/end
@@ -503,7 +510,7 @@ class UXAuditor:
                         '#8b5cf6', '#a855f7', '#9333ea', '#7c3aed', '#6d28d9',
                         'purple', 'violet', 'fuchsia', 'magenta', 'lavender']
         for purple in purple_hexes:
-            if purple.lower() in content.lower():
+            if purple.lower() in lower:
                 self.issues.append(f"[Color] {filename}: PURPLE DETECTED ('{purple}'). Banned by Maestro rules. Use Teal/Cyan/Emerald instead.")
                 break
 
@@ -567,7 +574,7 @@ class UXAuditor:
             duration_ms = float(duration) * (1000 if unit == 's' else 1)
             if duration_ms < 50:
                 self.warnings.append(f"[Animation] {filename}: Very fast animation ({duration}{unit}). Minimum 50ms for visibility.")
-            elif duration_ms > 1000 and 'transition' in content.lower():
+            elif duration_ms > 1000 and 'transition' in lower:
                 self.warnings.append(f"[Animation] {filename}: Long transition ({duration}{unit}). Transitions should be 100-300ms for responsiveness.")
 
         # 5.2 Easing Function Correctness
@@ -671,13 +678,30 @@ class UXAuditor:
         if re.search(r'<img(?![^>]*alt=)[^>]*>', content):
             self.issues.append(f"[Accessibility] {filename}: Missing img alt text")
 
-    def audit_directory(self, directory: str) -> None:
+    def audit_directory(self, directory: str, inventory=None) -> None:
         extensions = {'.tsx', '.jsx', '.html', '.vue', '.svelte', '.css'}
-        for root, dirs, files in os.walk(directory):
+        walk = inventory.walk if inventory is not None else os.walk  # Shared file inventory (checklist.py / verify_all.py)
+        for root, dirs, files in walk(directory):
             dirs[:] = [d for d in dirs if d not in {'node_modules', '.git', 'dist', 'build', '.next'}]
             for file in files:
                 if Path(file).suffix in extensions:
-                    self.audit_file(os.path.join(root, file))
+                    self.audit_stored(os.path.join(root, file))
+
+    def audit_stored(self, filepath: str) -> None:
+        """audit_file(), replaying the stored outcome of a file unchanged since the last run"""
+        if self.store is None:
+            return self.audit_file(filepath)
+        
+        def audit():
+            auditor = UXAuditor(self.contents)
+            auditor.audit_file(filepath)
+            return [auditor.issues, auditor.warnings, auditor.passed_count, auditor.files_checked]
+        
+        issues, warnings, passed_count, files_checked = self.store.cached(__file__, filepath, audit)
+        self.issues += issues
+        self.warnings += warnings
+        self.passed_count += passed_count
+        self.files_checked += files_checked
 
     def get_report(self):
         return {
@@ -688,6 +712,18 @@ class UXAuditor:
             "compliant": len(self.issues) == 0
         }
 
+def run(project_path: Path, context: dict = None) -> dict:
+    """Plugin entry point for checklist.py / verify_all.py: audit without printing."""
+    context = context or {}
+    auditor = UXAuditor(context.get("contents"), context.get("store"))
+    if os.path.isfile(project_path): auditor.audit_file(str(project_path))
+    else: auditor.audit_directory(str(project_path), context.get("inventory"))
+    
+    report = auditor.get_report()
+    report["passed"] = report["compliant"]
+    report["summary"] = f"{len(report['issues'])} issues, {len(report['warnings'])} warnings in {report['files_checked']} files"
+    return report
+
 def main():
     if len(sys.argv) < 2: sys.exit(1)
     
@@ -78,13 +78,13 @@ def is_page_file(file_path: Path) -> bool:
     return False
 
 
-def find_web_pages(project_path: Path) -> list:
-    """Find public-facing web pages only."""
+def find_web_pages(project_path: Path, inventory=None) -> list:
+    """Find public-facing web pages only (from the shared inventory when given one)."""
     patterns = ['**/*.html', '**/*.htm', '**/*.jsx', '**/*.tsx']
     
     files = []
     for pattern in patterns:
-        for f in project_path.glob(pattern):
+        for f in (inventory if inventory is not None else project_path).glob(pattern):
             # Skip excluded directories
             if any(skip in f.parts for skip in SKIP_DIRS):
                 continue
@@ -96,10 +96,15 @@ def find_web_pages(project_path: Path) -> list:
     return files[:30]  # Limit to 30 pages
 
 
-def check_page(file_path: Path) -> dict:
+def check_page(file_path: Path, contents=None) -> dict:
     """Check a single web page for GEO elements."""
     try:
-        content = file_path.read_text(encoding='utf-8', errors='ignore')
+        if contents is not None:  # Shared content cache (checklist.py / verify_all.py)
+            content = contents.read_text(file_path, errors='ignore')
+            lower = contents.read_lower(file_path, errors='ignore')
+        else:
+            content = file_path.read_text(encoding='utf-8', errors='ignore')
+            lower = content.lower()
     except Exception as e:
         return {'file': str(file_path.name), 'passed': [], 'issues': [f"Error: {e}"], 'score': 0}
     
@@ -137,7 +142,7 @@ def check_page(file_path: Path) -> dict:
     
     # 3. Author Attribution (E-E-A-T signal)
     author_patterns = ['author', 'byline', 'written-by', 'contributor', 'rel="author"']
-    has_author = any(p in content.lower() for p in author_patterns)
+    has_author = any(p in lower for p in author_patterns)
     if has_author:
         passed.append("Author attribution found")
     else:
@@ -219,6 +224,35 @@ def check_page(file_path: Path) -> dict:
     }
 
 
+def run(project_path: Path, context: dict = None) -> dict:
+    """Plugin entry point for checklist.py / verify_all.py: audit without printing."""
+    # Find web pages only
+    context = context or {}
+    pages = find_web_pages(project_path, context.get("inventory"))
+    if not pages:
+        return {"script": "geo_checker", "pages_found": 0, "passed": True, "summary": "No public web pages found"}
+    
+    # Check each page (reusing stored results of unchanged pages under checklist.py)
+    contents, store = context.get("contents"), context.get("store")
+    if store is not None:
+        results = [store.cached(__file__, page, lambda: check_page(page, contents)) for page in pages]
+    else:
+        results = [check_page(page, contents) for page in pages]
+    
+    # Average score
+    avg_score = sum(r['score'] for r in results) / len(results) if results else 0
+    
+    return {
+        "script": "geo_checker",
+        "project": str(project_path),
+        "pages_checked": len(results),
+        "average_score": round(avg_score),
+        "passed": avg_score >= 60,
+        "pages": results,
+        "summary": f"Average GEO score {avg_score:.0f}% over {len(results)} pages (60% required)"
+    }
+
+
 def main():
     target = sys.argv[1] if len(sys.argv) > 1 else "."
     target_path = Path(target).resolve()
@@ -229,24 +263,18 @@ def main():
     print(f"Project: {target_path}")
     print("-" * 60)
     
-    # Find web pages only
-    pages = find_web_pages(target_path)
+    report = run(target_path)
+    results = report.pop("pages", [])
+    del report["summary"]
     
-    if not pages:
+    if not results:
         print("\n[!] No public web pages found.")
         print("    Looking for: HTML, JSX, TSX files in pages/app directories")
         print("    Skipping: docs, tests, config files, node_modules")
-        output = {"script": "geo_checker", "pages_found": 0, "passed": True}
-        print("\n" + json.dumps(output, indent=2))
+        print("\n" + json.dumps(report, indent=2))
         sys.exit(0)
     
-    print(f"Found {len(pages)} public pages to analyze\n")
-    
-    # Check each page
-    results = []
-    for page in pages:
-        result = check_page(page)
-        results.append(result)
+    print(f"Found {len(results)} public pages to analyze\n")
     
     # Print results
     for result in results:
@@ -256,8 +284,7 @@ def main():
             for issue in result['issues'][:2]:  # Show max 2 issues
                 print(f"    - {issue}")
     
-    # Average score
-    avg_score = sum(r['score'] for r in results) / len(results) if results else 0
+    avg_score = sum(r['score'] for r in results) / len(results)
     
     print("\n" + "=" * 60)
     print(f"AVERAGE GEO SCORE: {avg_score:.0f}%")
@@ -273,16 +300,9 @@ def main():
         print("[X] Poor - Content needs GEO optimization")
     
     # JSON output
-    output = {
-        "script": "geo_checker",
-        "project": str(target_path),
-        "pages_checked": len(results),
-        "average_score": round(avg_score),
-        "passed": avg_score >= 60
-    }
-    print("\n" + json.dumps(output, indent=2))
+    print("\n" + json.dumps(report, indent=2))
     
-    sys.exit(0 if avg_score >= 60 else 1)
+    sys.exit(0 if report["passed"] else 1)
 
 
 if __name__ == "__main__":
@@ -50,8 +50,8 @@ I18N_PATTERNS = [
     r'i18n\.',             # Generic i18n
 ]
 
-def find_locale_files(project_path: Path) -> list:
-    """Find translation/locale files."""
+def find_locale_files(project_path: Path, inventory=None) -> list:
+    """Find translation/locale files (from the shared inventory when given one)."""
     patterns = [
         "**/locales/**/*.json",
         "**/translations/**/*.json",
@@ -63,7 +63,7 @@ def find_locale_files(project_path: Path) -> list:
     
     files = []
     for pattern in patterns:
-        files.extend(project_path.glob(pattern))
+        files.extend((inventory if inventory is not None else project_path).glob(pattern))
     
     return [f for f in files if 'node_modules' not in str(f)]
 
@@ -128,7 +128,25 @@ def flatten_keys(d, prefix=''):
             keys.add(new_key)
     return keys
 
-def check_hardcoded_strings(project_path: Path) -> dict:
+def scan_code_file(file_path: Path, file_type: str, contents=None) -> dict:
+    """i18n usage and hardcoded-string examples of a single code file."""
+    content = (contents.read_text(file_path, errors='ignore') if contents is not None  # Shared content cache
+               else file_path.read_text(encoding='utf-8', errors='ignore'))
+    
+    # Check for i18n usage
+    has_i18n = any(re.search(p, content) for p in I18N_PATTERNS)
+    
+    # Check for hardcoded strings
+    examples = []
+    if not has_i18n:
+        for pattern in HARDCODED_PATTERNS.get(file_type, []):
+            matches = re.findall(pattern, content)
+            if matches:
+                examples.append(f"{file_path.name}: {str(matches[0])[:40]}...")
+    
+    return {'has_i18n': has_i18n, 'hardcoded': examples}
+
+def check_hardcoded_strings(project_path: Path, inventory=None, contents=None, store=None) -> dict:
     """Check for hardcoded strings in code files."""
     issues = []
     passed = []
@@ -142,7 +160,7 @@ def check_hardcoded_strings(project_path: Path) -> dict:
     
     code_files = []
     for ext in extensions:
-        code_files.extend(project_path.rglob(f"*{ext}"))
+        code_files.extend((inventory if inventory is not None else project_path).rglob(f"*{ext}"))
     
     code_files = [f for f in code_files if not any(x in str(f) for x in 
                   ['node_modules', '.git', 'dist', 'build', '__pycache__', 'venv', 'test', 'spec'])]
@@ -155,32 +173,20 @@ def check_hardcoded_strings(project_path: Path) -> dict:
     hardcoded_examples = []
     
     for file_path in code_files[:50]:  # Limit
+        file_type = extensions.get(file_path.suffix, 'jsx')
         try:
-            content = file_path.read_text(encoding='utf-8', errors='ignore')
-            ext = file_path.suffix
-            file_type = extensions.get(ext, 'jsx')
-            
-            # Check for i18n usage
-            has_i18n = any(re.search(p, content) for p in I18N_PATTERNS)
-            if has_i18n:
-                files_with_i18n += 1
-            
-            # Check for hardcoded strings
-            patterns = HARDCODED_PATTERNS.get(file_type, [])
-            hardcoded_found = False
-            
-            for pattern in patterns:
-                matches = re.findall(pattern, content)
-                if matches and not has_i18n:
-                    hardcoded_found = True
-                    if len(hardcoded_examples) < 5:
-                        hardcoded_examples.append(f"{file_path.name}: {str(matches[0])[:40]}...")
-            
-            if hardcoded_found:
-                files_with_hardcoded += 1
-                
+            if store is not None:  # Result store (checklist.py): skip files unchanged since the last run
+                result = store.cached(__file__, file_path, lambda: scan_code_file(file_path, file_type, contents))
+            else:
+                result = scan_code_file(file_path, file_type, contents)
         except:
             continue
+        
+        if result['has_i18n']:
+            files_with_i18n += 1
+        if result['hardcoded']:
+            files_with_hardcoded += 1
+            hardcoded_examples.extend(result['hardcoded'][:5 - len(hardcoded_examples)])
     
     passed.append(f"[OK] Analyzed {len(code_files)} code files")
     
@@ -196,6 +202,28 @@ def check_hardcoded_strings(project_path: Path) -> dict:
     
     return {'passed': passed, 'issues': issues}
 
+def run(project_path: Path, context: dict = None) -> dict:
+    """Plugin entry point for checklist.py / verify_all.py: audit without printing."""
+    # Check locale files
+    context = context or {}
+    inventory = context.get("inventory")
+    locale_files = find_locale_files(project_path, inventory)
+    locale_result = check_locale_completeness(locale_files)
+    
+    # Check hardcoded strings
+    code_result = check_hardcoded_strings(project_path, inventory, context.get("contents"), context.get("store"))
+    
+    critical_issues = sum(1 for i in locale_result['issues'] + code_result['issues'] if i.startswith("[X]"))
+    return {
+        "script": "i18n_checker",
+        "project": str(project_path),
+        "locales": locale_result,
+        "code": code_result,
+        "critical_issues": critical_issues,
+        "passed": critical_issues == 0,
+        "summary": f"{critical_issues} critical i18n issues"
+    }
+
 def main():
     target = sys.argv[1] if len(sys.argv) > 1 else "."
     project_path = Path(target)
@@ -204,12 +232,8 @@ def main():
     print("  i18n CHECKER - Internationalization Audit")
     print("=" * 60 + "\n")
     
-    # Check locale files
-    locale_files = find_locale_files(project_path)
-    locale_result = check_locale_completeness(locale_files)
-    
-    # Check hardcoded strings
-    code_result = check_hardcoded_strings(project_path)
+    report = run(project_path)
+    locale_result, code_result = report['locales'], report['code']
     
     # Print results
     print("[LOCALE FILES]")
@@ -227,7 +251,7 @@ def main():
         print(f"  {item}")
     
     # Summary
-    critical_issues = sum(1 for i in locale_result['issues'] + code_result['issues'] if i.startswith("[X]"))
+    critical_issues = report['critical_issues']
     
     print("\n" + "=" * 60)
     if critical_issues == 0:
@@ -15,13 +15,59 @@ try:
 except AttributeError:
     pass  # Python < 3.7
 
-def check_typescript_coverage(project_path: Path) -> dict:
+def read_source(file_path: Path, contents=None) -> str:
+    """File text, from the shared content cache (checklist.py / verify_all.py) when given one."""
+    if contents is not None:
+        return contents.read_text(file_path, errors='ignore')
+    return file_path.read_text(encoding='utf-8', errors='ignore')
+
+def per_file(store, file_path: Path, compute, kind: str) -> dict:
+    """compute(), or its stored result while the file is unchanged (checklist.py result store)."""
+    return store.cached(__file__, file_path, compute, kind) if store is not None else compute()
+
+def typescript_file_stats(file_path: Path, contents=None) -> dict:
+    """'any' and function counts of a single TypeScript file."""
+    content = read_source(file_path, contents)
+    
+    # Count 'any' usage
+    any_matches = re.findall(r':\s*any\b', content)
+    
+    # Find functions without return types
+    # function name(params) { - no return type
+    untyped = re.findall(r'function\s+\w+\s*\([^)]*\)\s*{', content)
+    # Arrow functions without types: const fn = (x) => or (x) =>
+    untyped += re.findall(r'=\s*\([^:)]*\)\s*=>', content)
+    
+    # Count typed functions
+    typed = re.findall(r'function\s+\w+\s*\([^)]*\)\s*:\s*\w+', content)
+    typed += re.findall(r':\s*\([^)]*\)\s*=>\s*\w+', content)
+    
+    return {'any_count': len(any_matches), 'untyped_functions': len(untyped), 'total_functions': len(typed) + len(untyped)}
+
+def python_file_stats(file_path: Path, contents=None) -> dict:
+    """'Any' and type-hinted function counts of a single Python file."""
+    content = read_source(file_path, contents)
+    
+    # Count Any usage
+    any_matches = re.findall(r':\s*Any\b', content)
+    
+    # Find functions with type hints
+    typed_funcs = re.findall(r'def\s+\w+\s*\([^)]*:[^)]+\)', content)
+    typed_funcs += re.findall(r'def\s+\w+\s*\([^)]*\)\s*->', content)
+    
+    # Find functions without type hints
+    all_funcs = re.findall(r'def\s+\w+\s*\(', content)
+    
+    return {'untyped_functions': len(all_funcs) - len(typed_funcs), 'typed_functions': len(typed_funcs), 'any_count': len(any_matches)}
+
+def check_typescript_coverage(project_path: Path, inventory=None, contents=None, store=None) -> dict:
     """Check TypeScript type coverage."""
     issues = []
     passed = []
     stats = {'any_count': 0, 'untyped_functions': 0, 'total_functions': 0}
     
-    ts_files = list(project_path.rglob("*.ts")) + list(project_path.rglob("*.tsx"))
+    files = inventory if inventory is not None else project_path  # Shared file inventory (checklist.py / verify_all.py)
+    ts_files = list(files.rglob("*.ts")) + list(files.rglob("*.tsx"))
     ts_files = [f for f in ts_files if 'node_modules' not in str(f) and '.d.ts' not in str(f)]
     
     if not ts_files:
@@ -29,26 +75,11 @@ def check_typescript_coverage(project_path: Path) -> dict:
     
     for file_path in ts_files[:30]:  # Limit
         try:
-            content = file_path.read_text(encoding='utf-8', errors='ignore')
-            
-            # Count 'any' usage
-            any_matches = re.findall(r':\s*any\b', content)
-            stats['any_count'] += len(any_matches)
-            
-            # Find functions without return types
-            # function name(params) { - no return type
-            untyped = re.findall(r'function\s+\w+\s*\([^)]*\)\s*{', content)
-            # Arrow functions without types: const fn = (x) => or (x) =>
-            untyped += re.findall(r'=\s*\([^:)]*\)\s*=>', content)
-            stats['untyped_functions'] += len(untyped)
-            
-            # Count typed functions
-            typed = re.findall(r'function\s+\w+\s*\([^)]*\)\s*:\s*\w+', content)
-            typed += re.findall(r':\s*\([^)]*\)\s*=>\s*\w+', content)
-            stats['total_functions'] += len(typed) + len(untyped)
-            
+            file_stats = per_file(store, file_path, lambda: typescript_file_stats(file_path, contents), "typescript")
         except Exception:
             continue
+        for key in stats:
+            stats[key] += file_stats[key]
     
     # Analyze results
     if stats['any_count'] == 0:
@@ -71,13 +102,13 @@ def check_typescript_coverage(project_path: Path) -> dict:
     
     return {'type': 'typescript', 'files': len(ts_files), 'passed': passed, 'issues': issues, 'stats': stats}
 
-def check_python_coverage(project_path: Path) -> dict:
+def check_python_coverage(project_path: Path, inventory=None, contents=None, store=None) -> dict:
     """Check Python type hints coverage."""
     issues = []
     passed = []
     stats = {'untyped_functions': 0, 'typed_functions': 0, 'any_count': 0}
     
-    py_files = list(project_path.rglob("*.py"))
+    py_files = list((inventory if inventory is not None else project_path).rglob("*.py"))
     py_files = [f for f in py_files if not any(x in str(f) for x in ['venv', '__pycache__', '.git', 'node_modules'])]
     
     if not py_files:
@@ -85,23 +116,11 @@ def check_python_coverage(project_path: Path) -> dict:
     
     for file_path in py_files[:30]:  # Limit
         try:
-            content = file_path.read_text(encoding='utf-8', errors='ignore')
-            
-            # Count Any usage
-            any_matches = re.findall(r':\s*Any\b', content)
-            stats['any_count'] += len(any_matches)
-            
-            # Find functions with type hints
-            typed_funcs = re.findall(r'def\s+\w+\s*\([^)]*:[^)]+\)', content)
-            typed_funcs += re.findall(r'def\s+\w+\s*\([^)]*\)\s*->', content)
-            stats['typed_functions'] += len(typed_funcs)
-            
-            # Find functions without type hints
-            all_funcs = re.findall(r'def\s+\w+\s*\(', content)
-            stats['untyped_functions'] += len(all_funcs) - len(typed_funcs)
-            
+            file_stats = per_file(store, file_path, lambda: python_file_stats(file_path, contents), "python")
         except Exception:
             continue
+        for key in stats:
+            stats[key] += file_stats[key]
     
     total = stats['typed_functions'] + stats['untyped_functions']
     
@@ -125,32 +144,49 @@ def check_python_coverage(project_path: Path) -> dict:
     
     return {'type': 'python', 'files': len(py_files), 'passed': passed, 'issues': issues, 'stats': stats}
 
-def main():
-    target = sys.argv[1] if len(sys.argv) > 1 else "."
-    project_path = Path(target)
-    
-    print("\n" + "=" * 60)
-    print("  TYPE COVERAGE CHECKER")
-    print("=" * 60 + "\n")
-    
+def run(project_path: Path, context: dict = None) -> dict:
+    """Plugin entry point for checklist.py / verify_all.py: audit without printing."""
     results = []
     
+    context = context or {}
+    inventory, contents, store = context.get("inventory"), context.get("contents"), context.get("store")
+    
     # Check TypeScript
-    ts_result = check_typescript_coverage(project_path)
+    ts_result = check_typescript_coverage(project_path, inventory, contents, store)
     if ts_result['files'] > 0:
         results.append(ts_result)
     
     # Check Python
-    py_result = check_python_coverage(project_path)
+    py_result = check_python_coverage(project_path, inventory, contents, store)
     if py_result['files'] > 0:
         results.append(py_result)
     
+    critical_issues = sum(1 for result in results for item in result['issues'] if item.startswith("[X]"))
+    return {
+        "script": "type_coverage",
+        "project": str(project_path),
+        "results": results,
+        "critical_issues": critical_issues,
+        "passed": critical_issues == 0,
+        "summary": f"{critical_issues} critical type coverage issues" if results else "No TypeScript or Python files found"
+    }
+
+def main():
+    target = sys.argv[1] if len(sys.argv) > 1 else "."
+    project_path = Path(target)
+    
+    print("\n" + "=" * 60)
+    print("  TYPE COVERAGE CHECKER")
+    print("=" * 60 + "\n")
+    
+    report = run(project_path)
+    results = report['results']
+    
     if not results:
         print("[!] No TypeScript or Python files found.")
         sys.exit(0)
     
     # Print results
-    critical_issues = 0
     for result in results:
         print(f"\n[{result['type'].upper()}]")
         print("-" * 40)
@@ -158,9 +194,8 @@ def main():
             print(f"  {item}")
         for item in result['issues']:
             print(f"  {item}")
-            if item.startswith("[X]"):
-                critical_issues += 1
     
+    critical_issues = report['critical_issues']
     print("\n" + "=" * 60)
     if critical_issues == 0:
         print("[OK] TYPE COVERAGE: ACCEPTABLE")
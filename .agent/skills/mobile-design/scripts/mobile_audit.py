@@ -72,7 +72,8 @@ import json
 from pathlib import Path
 
 class MobileAuditor:
-    def __init__(self):
+    def __init__(self, contents=None):
+        self.contents = contents  # Shared content cache (checklist.py / verify_all.py)
         self.issues = []
         self.warnings = []
         self.passed_count = 0
@@ -80,8 +81,11 @@ class MobileAuditor:
 
     def audit_file(self, filepath: str) -> None:
         try:
-            with open(filepath, 'r', encoding='utf-8', errors='replace') as f:
-                content = f.read()
+            if self.contents is not None:
+                content = self.contents.read_text(filepath, errors='replace')
+            else:
+                with open(filepath, 'r', encoding='utf-8', errors='replace') as f:
+                    content = f.read()
         except:
             return
 
@@ -610,9 +614,10 @@ class MobileAuditor:
             # This is more of a configuration check, not code pattern
             self.passed_count += 1  # Hermes is default in RN 0.70+
 
-    def audit_directory(self, directory: str) -> None:
+    def audit_directory(self, directory: str, inventory=None) -> None:
         extensions = {'.tsx', '.ts', '.jsx', '.js', '.dart'}
-        for root, dirs, files in os.walk(directory):
+        walk = inventory.walk if inventory is not None else os.walk  # Shared file inventory (checklist.py / verify_all.py)
+        for root, dirs, files in walk(directory):
             dirs[:] = [d for d in dirs if d not in {'node_modules', '.git', 'dist', 'build', '.next', 'ios', 'android', 'build', '.idea'}]
             for file in files:
                 if Path(file).suffix in extensions:
@@ -628,6 +633,21 @@ class MobileAuditor:
         }
 
 
+def run(project_path: Path, context: dict = None) -> dict:
+    """Plugin entry point for checklist.py / verify_all.py: audit without printing."""
+    context = context or {}
+    auditor = MobileAuditor(context.get("contents"))
+    if os.path.isfile(project_path):
+        auditor.audit_file(str(project_path))
+    else:
+        auditor.audit_directory(str(project_path), context.get("inventory"))
+
+    report = auditor.get_report()
+    report["passed"] = report["compliant"]
+    report["summary"] = f"{len(report['issues'])} issues, {len(report['warnings'])} warnings in {report['files_checked']} files"
+    return report
+
+
 def main():
     if len(sys.argv) < 2:
         print("Usage: python mobile_audit.py <directory>")
@@ -75,13 +75,13 @@ def is_page_file(file_path: Path) -> bool:
     return False
 
 
-def find_pages(project_path: Path) -> list:
-    """Find page files to check."""
+def find_pages(project_path: Path, inventory=None) -> list:
+    """Find page files to check (from the shared inventory when given one)."""
     patterns = ['**/*.html', '**/*.htm', '**/*.jsx', '**/*.tsx']
     
     files = []
     for pattern in patterns:
-        for f in project_path.glob(pattern):
+        for f in (inventory if inventory is not None else project_path).glob(pattern):
             # Skip excluded directories
             if any(skip in f.parts for skip in SKIP_DIRS):
                 continue
@@ -93,30 +93,35 @@ def find_pages(project_path: Path) -> list:
     return files[:50]  # Limit to 50 files
 
 
-def check_page(file_path: Path) -> dict:
+def check_page(file_path: Path, contents=None) -> dict:
     """Check a single page for SEO issues."""
     issues = []
     
     try:
-        content = file_path.read_text(encoding='utf-8', errors='ignore')
+        if contents is not None:  # Shared content cache (checklist.py / verify_all.py)
+            content = contents.read_text(file_path, errors='ignore')
+            lower = contents.read_lower(file_path, errors='ignore')
+        else:
+            content = file_path.read_text(encoding='utf-8', errors='ignore')
+            lower = content.lower()
     except Exception as e:
         return {"file": str(file_path.name), "issues": [f"Error: {e}"]}
     
     # Detect if this is a layout/template file (has Head component)
-    is_layout = 'Head>' in content or '<head' in content.lower()
+    is_layout = 'Head>' in content or '<head' in lower
     
     # 1. Title tag
-    has_title = '<title' in content.lower() or 'title=' in content or 'Head>' in content
+    has_title = '<title' in lower or 'title=' in content or 'Head>' in content
     if not has_title and is_layout:
         issues.append("Missing <title> tag")
     
     # 2. Meta description
-    has_description = 'name="description"' in content.lower() or 'name=\'description\'' in content.lower()
+    has_description = 'name="description"' in lower or 'name=\'description\'' in lower
     if not has_description and is_layout:
         issues.append("Missing meta description")
     
     # 3. Open Graph tags
-    has_og = 'og:' in content or 'property="og:' in content.lower()
+    has_og = 'og:' in content or 'property="og:' in lower
     if not has_og and is_layout:
         issues.append("Missing Open Graph tags")
     
@@ -145,6 +150,39 @@ def check_page(file_path: Path) -> dict:
     }
 
 
+def run(project_path: Path, context: dict = None) -> dict:
+    """Plugin entry point for checklist.py / verify_all.py: audit without printing."""
+    context = context or {}
+    contents, store = context.get("contents"), context.get("store")
+    pages = find_pages(project_path, context.get("inventory"))
+    if not pages:
+        return {"script": "seo_checker", "files_checked": 0, "passed": True, "summary": "No page files found"}
+    
+    # Check each page
+    all_issues = []
+    for f in pages:
+        if store is not None:  # Result store (checklist.py): skip files unchanged since the last run
+            result = store.cached(__file__, f, lambda: check_page(f, contents))
+        else:
+            result = check_page(f, contents)
+        if result["issues"]:
+            all_issues.append(result)
+    
+    total_issues = sum(len(item["issues"]) for item in all_issues)
+    passed = total_issues == 0
+    
+    return {
+        "script": "seo_checker",
+        "project": str(project_path),
+        "files_checked": len(pages),
+        "files_with_issues": len(all_issues),
+        "issues_found": total_issues,
+        "passed": passed,
+        "issues": all_issues,
+        "summary": f"{total_issues} SEO issues in {len(all_issues)} of {len(pages)} pages"
+    }
+
+
 def main():
     project_path = Path(sys.argv[1] if len(sys.argv) > 1 else ".").resolve()
     
@@ -155,24 +193,17 @@ def main():
     print(f"Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
     print("-"*60)
     
-    # Find pages
-    pages = find_pages(project_path)
+    report = run(project_path)
+    all_issues = report.pop("issues", [])
+    del report["summary"]
     
-    if not pages:
+    if not report["files_checked"]:
         print("\n[!] No page files found.")
         print("    Looking for: HTML, JSX, TSX in pages/app/routes directories")
-        output = {"script": "seo_checker", "files_checked": 0, "passed": True}
-        print("\n" + json.dumps(output, indent=2))
+        print("\n" + json.dumps(report, indent=2))
         sys.exit(0)
     
-    print(f"Found {len(pages)} page files to analyze\n")
-    
-    # Check each page
-    all_issues = []
-    for f in pages:
-        result = check_page(f)
-        if result["issues"]:
-            all_issues.append(result)
+    print(f"Found {report['files_checked']} page files to analyze\n")
     
     # Summary
     print("=" * 60)
@@ -198,21 +229,9 @@ def main():
     else:
         print("\n[OK] No SEO issues found!")
     
-    total_issues = sum(len(item["issues"]) for item in all_issues)
-    passed = total_issues == 0
-    
-    output = {
-        "script": "seo_checker",
-        "project": str(project_path),
-        "files_checked": len(pages),
-        "files_with_issues": len(all_issues),
-        "issues_found": total_issues,
-        "passed": passed
-    }
-    
-    print("\n" + json.dumps(output, indent=2))
+    print("\n" + json.dumps(report, indent=2))
     
-    sys.exit(0 if passed else 1)
+    sys.exit(0 if report["passed"] else 1)
 
 
 if __name__ == "__main__":
@@ -89,11 +89,34 @@ SKIP_DIRS = {'node_modules', '.git', 'dist', 'build', '__pycache__', '.venv', 'v
 CODE_EXTENSIONS = {'.js', '.ts', '.jsx', '.tsx', '.py', '.go', '.java', '.rb', '.php'}
 CONFIG_EXTENSIONS = {'.json', '.yaml', '.yml', '.toml', '.env', '.env.local', '.env.development'}
 
+# Config file issues (scan_configuration)
+CONFIG_ISSUES = [
+    (r'"DEBUG"\s*:\s*true', "Debug mode enabled", "high"),
+    (r'debug\s*=\s*True', "Debug mode enabled", "high"),
+    (r'NODE_ENV.*development', "Development mode in config", "medium"),
+    (r'"CORS_ALLOW_ALL".*true', "CORS allow all origins", "high"),
+    (r'"Access-Control-Allow-Origin".*\*', "CORS wildcard", "high"),
+    (r'allowCredentials.*true.*origin.*\*', "Dangerous CORS combo", "critical"),
+]
+
 
 # ============================================================================
 #  SCANNING FUNCTIONS
 # ============================================================================
 
+def read_source(filepath: Path, contents=None) -> str:
+    """File text, from the shared content cache (checklist.py / verify_all.py) when given one."""
+    if contents is not None:
+        return contents.read_text(filepath, errors='ignore')
+    with open(filepath, 'r', encoding='utf-8', errors='ignore') as f:
+        return f.read()
+
+
+def per_file(store, filepath: Path, compute, kind: str):
+    """compute(), or its stored result while the file is unchanged (checklist.py result store)."""
+    return store.cached(__file__, filepath, compute, kind) if store is not None else compute()
+
+
 def scan_dependencies(project_path: str) -> Dict[str, Any]:
     """
     Validate supply chain security (OWASP A03).
@@ -178,7 +201,25 @@ def scan_dependencies(project_path: str) -> Dict[str, Any]:
     return results
 
 
-def scan_secrets(project_path: str) -> Dict[str, Any]:
+def find_secrets(filepath: Path, project_path: str, contents=None) -> List[Dict[str, Any]]:
+    """Secret findings of a single file."""
+    findings = []
+    content = read_source(filepath, contents)
+    
+    for pattern, secret_type, severity in SECRET_PATTERNS:
+        matches = re.findall(pattern, content, re.IGNORECASE)
+        if matches:
+            findings.append({
+                "file": str(filepath.relative_to(project_path)),
+                "type": secret_type,
+                "severity": severity,
+                "count": len(matches)
+            })
+    
+    return findings
+
+
+def scan_secrets(project_path: str, inventory=None, contents=None, store=None) -> Dict[str, Any]:
     """
     Validate no hardcoded secrets (OWASP A04).
     Checks: API keys, tokens, passwords, cloud credentials.
@@ -191,7 +232,8 @@ def scan_secrets(project_path: str) -> Dict[str, Any]:
         "by_severity": {"critical": 0, "high": 0, "medium": 0}
     }
     
-    for root, dirs, files in os.walk(project_path):
+    walk = inventory.walk if inventory is not None else os.walk  # Shared file inventory (checklist.py / verify_all.py)
+    for root, dirs, files in walk(project_path):
         dirs[:] = [d for d in dirs if d not in SKIP_DIRS]
         
         for file in files:
@@ -203,22 +245,13 @@ def scan_secrets(project_path: str) -> Dict[str, Any]:
             results["scanned_files"] += 1
             
             try:
-                with open(filepath, 'r', encoding='utf-8', errors='ignore') as f:
-                    content = f.read()
-                    
-                    for pattern, secret_type, severity in SECRET_PATTERNS:
-                        matches = re.findall(pattern, content, re.IGNORECASE)
-                        if matches:
-                            results["findings"].append({
-                                "file": str(filepath.relative_to(project_path)),
-                                "type": secret_type,
-                                "severity": severity,
-                                "count": len(matches)
-                            })
-                            results["by_severity"][severity] += len(matches)
-                            
+                findings = per_file(store, filepath, lambda: find_secrets(filepath, project_path, contents), "secrets")
             except Exception:
-                pass
+                continue
+            
+            for finding in findings:
+                results["findings"].append(finding)
+                results["by_severity"][finding["severity"]] += finding["count"]
     
     if results["by_severity"]["critical"] > 0:
         results["status"] = "[!!] CRITICAL: Secrets exposed!"
@@ -233,7 +266,27 @@ def scan_secrets(project_path: str) -> Dict[str, Any]:
     return results
 
 
-def scan_code_patterns(project_path: str) -> Dict[str, Any]:
+def find_code_patterns(filepath: Path, project_path: str, contents=None) -> List[Dict[str, Any]]:
+    """Dangerous-pattern findings of a single file."""
+    findings = []
+    lines = read_source(filepath, contents).split('\n')
+    
+    for line_num, line in enumerate(lines, 1):
+        for pattern, name, severity, category in DANGEROUS_PATTERNS:
+            if re.search(pattern, line, re.IGNORECASE):
+                findings.append({
+                    "file": str(filepath.relative_to(project_path)),
+                    "line": line_num,
+                    "pattern": name,
+                    "severity": severity,
+                    "category": category,
+                    "snippet": line.strip()[:80]
+                })
+    
+    return findings
+
+
+def scan_code_patterns(project_path: str, inventory=None, contents=None, store=None) -> Dict[str, Any]:
     """
     Validate dangerous code patterns (OWASP A05).
     Checks: Injection risks, XSS, unsafe deserialization.
@@ -246,7 +299,8 @@ def scan_code_patterns(project_path: str) -> Dict[str, Any]:
         "by_category": {}
     }
     
-    for root, dirs, files in os.walk(project_path):
+    walk = inventory.walk if inventory is not None else os.walk
+    for root, dirs, files in walk(project_path):
         dirs[:] = [d for d in dirs if d not in SKIP_DIRS]
         
         for file in files:
@@ -258,24 +312,13 @@ def scan_code_patterns(project_path: str) -> Dict[str, Any]:
             results["scanned_files"] += 1
             
             try:
-                with open(filepath, 'r', encoding='utf-8', errors='ignore') as f:
-                    lines = f.readlines()
-                    
-                    for line_num, line in enumerate(lines, 1):
-                        for pattern, name, severity, category in DANGEROUS_PATTERNS:
-                            if re.search(pattern, line, re.IGNORECASE):
-                                results["findings"].append({
-                                    "file": str(filepath.relative_to(project_path)),
-                                    "line": line_num,
-                                    "pattern": name,
-                                    "severity": severity,
-                                    "category": category,
-                                    "snippet": line.strip()[:80]
-                                })
-                                results["by_category"][category] = results["by_category"].get(category, 0) + 1
-                                
+                findings = per_file(store, filepath, lambda: find_code_patterns(filepath, project_path, contents), "patterns")
             except Exception:
-                pass
+                continue
+            
+            for finding in findings:
+                results["findings"].append(finding)
+                results["by_category"][finding["category"]] = results["by_category"].get(finding["category"], 0) + 1
     
     critical_count = sum(1 for f in results["findings"] if f["severity"] == "critical")
     high_count = sum(1 for f in results["findings"] if f["severity"] == "high")
@@ -293,7 +336,23 @@ def scan_code_patterns(project_path: str) -> Dict[str, Any]:
     return results
 
 
-def scan_configuration(project_path: str) -> Dict[str, Any]:
+def find_config_issues(filepath: Path, project_path: str, contents=None) -> List[Dict[str, Any]]:
+    """Configuration findings of a single file."""
+    findings = []
+    content = read_source(filepath, contents)
+    
+    for pattern, issue, severity in CONFIG_ISSUES:
+        if re.search(pattern, content, re.IGNORECASE):
+            findings.append({
+                "file": str(filepath.relative_to(project_path)),
+                "issue": issue,
+                "severity": severity
+            })
+    
+    return findings
+
+
+def scan_configuration(project_path: str, inventory=None, contents=None, store=None) -> Dict[str, Any]:
     """
     Validate security configuration (OWASP A02).
     Checks: Security headers, CORS, debug modes.
@@ -305,17 +364,8 @@ def scan_configuration(project_path: str) -> Dict[str, Any]:
         "checks": {}
     }
     
-    # Check common config files for issues
-    config_issues = [
-        (r'"DEBUG"\s*:\s*true', "Debug mode enabled", "high"),
-        (r'debug\s*=\s*True', "Debug mode enabled", "high"),
-        (r'NODE_ENV.*development', "Development mode in config", "medium"),
-        (r'"CORS_ALLOW_ALL".*true', "CORS allow all origins", "high"),
-        (r'"Access-Control-Allow-Origin".*\*', "CORS wildcard", "high"),
-        (r'allowCredentials.*true.*origin.*\*', "Dangerous CORS combo", "critical"),
-    ]
-    
-    for root, dirs, files in os.walk(project_path):
+    walk = inventory.walk if inventory is not None else os.walk
+    for root, dirs, files in walk(project_path):
         dirs[:] = [d for d in dirs if d not in SKIP_DIRS]
         
         for file in files:
@@ -326,17 +376,7 @@ def scan_configuration(project_path: str) -> Dict[str, Any]:
             filepath = Path(root) / file
             
             try:
-                with open(filepath, 'r', encoding='utf-8', errors='ignore') as f:
-                    content = f.read()
-                    
-                    for pattern, issue, severity in config_issues:
-                        if re.search(pattern, content, re.IGNORECASE):
-                            results["findings"].append({
-                                "file": str(filepath.relative_to(project_path)),
-                                "issue": issue,
-                                "severity": severity
-                            })
-                            
+                results["findings"].extend(per_file(store, filepath, lambda: find_config_issues(filepath, project_path, contents), "config"))
             except Exception:
                 pass
     
@@ -369,7 +409,7 @@ def scan_configuration(project_path: str) -> Dict[str, Any]:
 #  MAIN
 # ============================================================================
 
-def run_full_scan(project_path: str, scan_type: str = "all") -> Dict[str, Any]:
+def run_full_scan(project_path: str, scan_type: str = "all", inventory=None, contents=None, store=None) -> Dict[str, Any]:
     """Execute security validation scans."""
     
     report = {
@@ -394,7 +434,7 @@ def run_full_scan(project_path: str, scan_type: str = "all") -> Dict[str, Any]:
     
     for key, (name, scanner) in scanners.items():
         if scan_type == "all" or scan_type == key:
-            result = scanner(project_path)
+            result = scanner(project_path) if scanner is scan_dependencies else scanner(project_path, inventory, contents, store)
             report["scans"][name] = result
             
             findings_count = len(result.get("findings", []))
@@ -418,6 +458,21 @@ def run_full_scan(project_path: str, scan_type: str = "all") -> Dict[str, Any]:
     return report
 
 
+def run(project_path: Path, context: dict = None) -> dict:
+    """Plugin entry point for checklist.py / verify_all.py: audit without printing."""
+    context = context or {}
+    result = run_full_scan(str(project_path), inventory=context.get("inventory"), contents=context.get("contents"),
+                           store=context.get("store"))
+    return {
+        "script": "security_scan",
+        "project": str(project_path),
+        # Findings are advisory: like the CLI (always exit 0), the scan does not fail the run
+        "passed": True,
+        "summary": result["summary"]["overall_status"],
+        "scan": result
+    }
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Validate security principles from vulnerability-scanner skill"